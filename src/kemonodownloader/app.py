@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QLabel, QPushButton, QGraphicsDropShadowEffect, 
     QTabWidget, QMessageBox
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QThread, pyqtSignal, QEvent
 from PyQt6.QtGui import QColor, QPalette, QFont, QCursor, QIcon
 import qtawesome as qta
 from kemonodownloader.post_downloader import PostDownloaderTab
@@ -15,6 +15,7 @@ from kemonodownloader.creator_downloader import CreatorDownloaderTab
 from kemonodownloader.kd_settings import SettingsTab
 from kemonodownloader.kd_help import HelpTab
 from kemonodownloader.kd_language import translate, language_manager
+from kemonodownloader.kd_progress import set_paused as set_progress_paused
 
 CURRENT_VERSION = "4.1.0"
 GITHUB_REPO = "VoxDroid/KemonoDownloader"
@@ -178,6 +179,12 @@ class KemonoDownloader(QMainWindow):
         if self.settings_tab.is_auto_check_updates_enabled():
             self.check_for_updates()
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.WindowStateChange:
+            # Nobody sees the progress bars while minimized, so stop the download threads from publishing to them
+            set_progress_paused(self.isMinimized())
+        super().changeEvent(event)
+
     def apply_palette(self):
         palette = QPalette()
         palette.setColor(QPalette.ColorRole.Window, QColor("#1A2A44"))
@@ -6,15 +6,28 @@ import json
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, 
-                             QGroupBox, QGridLayout, QProgressBar, QTextEdit, QListWidget, 
-                             QListWidgetItem, QAbstractItemView, QMessageBox, QCheckBox, 
+                             QGroupBox, QGridLayout, QProgressBar, 
+                             QMessageBox, QCheckBox, 
                              QLabel, QDialog)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPixmap
 import qtawesome as qta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import time
 from kemonodownloader.kd_language import translate
+from kemonodownloader.kd_logging import LogConsole, ThreadLogger
+from kemonodownloader.kd_files import (DEFAULT_HASH_ALGORITHM, RECEIVE_BUFFER_SIZE, RECEIVE_CHUNK_SIZE, ContentMismatch,
+                                       DirectoryCache, DiskWriter, PartialDownload, ResumeMismatch, content_claims,
+                                       content_hash_from_url, hash_file, new_hash, place_existing_file, update_from_file)
+from kemonodownloader.kd_lists import CheckListModel, QueueModel, UrlRole, check_list_view, queue_list_view
+from kemonodownloader.kd_network import (API_RETRY_POLICY, DOWNLOAD_RETRY_POLICY, RetryLater, call_with_retries,
+                                         classify_error, limiter_for, parse_retry_after, rate_limited_get, retry_after_from,
+                                         run_jobs)
+from kemonodownloader.kd_plan import format_duration, format_size, plan_downloads, record_throughput
+from kemonodownloader.kd_preview import PREFETCH_NEIGHBOURS, PREVIEW_MAX_DIMENSION, preview_service
+from kemonodownloader.kd_progress import ProgressAggregator
+from kemonodownloader.kd_search import SEARCH_DEBOUNCE_INTERVAL, TitleIndex
+from kemonodownloader.kd_store import get_download_store
 import locale
 import ctypes
 from fake_useragent import UserAgent
@@ -51,52 +64,6 @@ HEADERS = {
 }
 API_BASE = "https://coomer.su/api/v1"
 
-class PreviewThread(QThread):
-    preview_ready = pyqtSignal(str, object)
-    progress = pyqtSignal(int)
-    error = pyqtSignal(str)
-
-    def __init__(self, url, cache_dir):
-        super().__init__()
-        self.url = url
-        self.cache_dir = cache_dir
-        self.total_size = 0
-        self.downloaded_size = 0
-        os.makedirs(self.cache_dir, exist_ok=True)
-
-    def run(self):
-        if self.url.lower().endswith(('.jpg', '.jpeg', '.png', '.gif')):
-            cache_key = hashlib.md5(self.url.encode()).hexdigest() + os.path.splitext(self.url)[1]
-            cache_path = os.path.join(self.cache_dir, cache_key)
-            if os.path.exists(cache_path):
-                pixmap = QPixmap()
-                if pixmap.load(cache_path):
-                    self.preview_ready.emit(self.url, pixmap)
-                    return
-
-            try:
-                response = requests.get(self.url, headers=HEADERS, stream=True)
-                response.raise_for_status()
-                self.total_size = int(response.headers.get('content-length', 0)) or 1
-                downloaded_data = bytearray()
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        downloaded_data.extend(chunk)
-                        self.downloaded_size += len(chunk)
-                        progress = int((self.downloaded_size / self.total_size) * 100)
-                        self.progress.emit(min(progress, 100))
-                pixmap = QPixmap()
-                if not pixmap.loadFromData(downloaded_data):
-                    self.error.emit(translate("failed_to_download", f"{self.url}: {translate('invalid_image_data')}"))
-                    return
-                scaled_pixmap = pixmap.scaled(800, 800, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                scaled_pixmap.save(cache_path)
-                self.preview_ready.emit(self.url, scaled_pixmap)
-            except requests.RequestException as e:
-                self.error.emit(translate("failed_to_download", f"{self.url}: {str(e)}"))
-            except Exception as e:
-                self.error.emit(translate("unexpected_error", f"{self.url}: {str(e)}"))
-
 class ImageModal(QDialog):
     def __init__(self, url, cache_dir, parent=None):
         super().__init__(parent)
@@ -111,136 +78,320 @@ class ImageModal(QDialog):
         self.progress_bar.setStyleSheet("QProgressBar { border: 1px solid #4A5B7A; border-radius: 5px; } QProgressBar::chunk { background: #4A5B7A; }")
         self.layout.addWidget(self.progress_bar)
         self.setLayout(self.layout)
-        
-        self.preview_thread = PreviewThread(url, cache_dir)
-        self.preview_thread.preview_ready.connect(self.display_image)
-        self.preview_thread.progress.connect(self.update_progress)
-        self.preview_thread.error.connect(self.display_error)
-        self.preview_thread.finished.connect(self.preview_thread.deleteLater)
-        self.preview_thread.start()
-
-    def update_progress(self, value):
+
+        self.url = url
+        self.preview_service = preview_service()
+        self.preview_service.preview_ready.connect(self.display_image)
+        self.preview_service.progress.connect(self.update_progress)
+        self.preview_service.error.connect(self.display_error)
+        self.preview_service.load(url, cache_dir, HEADERS, self)
+
+    def update_progress(self, url, full_size, value):
+        if url != self.url or full_size:
+            return
         self.progress_bar.setValue(value)
         self.label.setText(translate("loading_image", value))
 
-    def display_image(self, url, pixmap):
+    def display_image(self, url, full_size, image):
+        if url != self.url or full_size:
+            return
         self.label.setText("")
         self.progress_bar.hide()
+        pixmap = QPixmap.fromImage(image) if isinstance(image, QImage) else QPixmap(image)
+        if pixmap.width() > PREVIEW_MAX_DIMENSION or pixmap.height() > PREVIEW_MAX_DIMENSION:
+            pixmap = pixmap.scaled(PREVIEW_MAX_DIMENSION, PREVIEW_MAX_DIMENSION, Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
         self.label.setPixmap(pixmap)
 
-    def display_error(self, error_message):
+    def display_error(self, url, full_size, error_message):
+        if url != self.url or full_size:
+            return
         self.label.setText(translate("error_loading_image"))
         self.progress_bar.hide()
         QMessageBox.critical(self, translate("image_load_error"), error_message)
 
+    def done(self, result):
+        self.preview_service.preview_ready.disconnect(self.display_image)
+        self.preview_service.progress.disconnect(self.update_progress)
+        self.preview_service.error.disconnect(self.display_error)
+        self.preview_service.cancel(self.url, self)
+        super().done(result)
+
+class CreatorPostPaginator:
+    """Fetch every post of a creator by learning the post count first and requesting pages concurrently."""
+    page_size = 50
+
+    def __init__(self, service, creator_id, logger, is_running, max_workers=4, max_pages=1000):
+        self.service = service
+        self.creator_id = creator_id
+        self.base_api_url = f"{API_BASE}/{service}/user/{creator_id}"
+        self.logger = logger
+        self.is_running = is_running
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        self.pages = {}  # Map page index to the list of posts fetched for it
+
+    def fetch_page(self, page_index):
+        """Fetch one listing page. Raises requests.RequestException or ValueError on failure."""
+        api_url = f"{self.base_api_url}?o={page_index * self.page_size}"
+        response = rate_limited_get(api_url, headers=HEADERS, timeout=10)
+        response.raise_for_status()
+        posts_data = response.json()
+        if not isinstance(posts_data, list):
+            raise ValueError(f"Invalid posts data returned for {api_url}")
+        self.logger.debug("Fetched {0} posts at offset {1}", len(posts_data), page_index * self.page_size)
+        return posts_data
+
+    def fetch_page_with_retries(self, page_index):
+        """Fetch one listing page, backing off on transient errors. Only used for sequential requests."""
+        def on_retry(e, delay, attempts):
+            self.logger.warning("Failed to fetch page at offset {0}: {1}. Retrying in {2:.1f}s ({3})", page_index * self.page_size, e, delay, attempts)
+        return call_with_retries(lambda: self.fetch_page(page_index), API_RETRY_POLICY, self.is_running, on_retry)
+
+    def fetch_page_job(self, page_index, retry_state):
+        """Fetch one listing page on the pool. Raises RetryLater on transient errors and returns None on give-up."""
+        try:
+            return self.fetch_page(page_index)
+        except (requests.RequestException, ValueError) as e:
+            error_class = classify_error(exception=e)
+            delay = retry_state.next_delay(error_class, retry_after_from(e))
+            if delay is None:
+                self.logger.error("Giving up on page at offset {0}: {1}", page_index * self.page_size, e)
+                return None
+            self.logger.warning("Failed to fetch page at offset {0}: {1}. Retrying in {2:.1f}s ({3})", page_index * self.page_size, e, delay, retry_state.describe(error_class))
+            raise RetryLater(delay)
+
+    def get_page(self, page_index):
+        if page_index not in self.pages:
+            self.pages[page_index] = self.fetch_page_with_retries(page_index)
+        return self.pages[page_index]
+
+    def fetch_post_count(self):
+        """Return the post count advertised by the creator profile, or None if it is unavailable."""
+        try:
+            response = rate_limited_get(f"{self.base_api_url}/profile", headers=HEADERS, timeout=10)
+            if response.status_code == 200:
+                post_count = response.json().get('post_count')
+                if isinstance(post_count, int) and post_count >= 0:
+                    return post_count
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            self.logger.warning("Failed to fetch post count from profile: {0}", e)
+        return None
+
+    def probe_post_count(self):
+        """Find the post count with an exponential search over page offsets followed by a binary search."""
+        first_page = self.get_page(0)
+        if len(first_page) < self.page_size:
+            return len(first_page)
+        low, high = 0, 1  # low is known to be a full page
+        while self.is_running():
+            if high >= self.max_pages:
+                return self.max_pages * self.page_size
+            page = self.get_page(high)
+            if len(page) == self.page_size:
+                low, high = high, high * 2
+                continue
+            if page:
+                return high * self.page_size + len(page)
+            break
+        while high - low > 1 and self.is_running():
+            mid = (low + high) // 2
+            page = self.get_page(mid)
+            if len(page) == self.page_size:
+                low = mid
+            elif page:
+                return mid * self.page_size + len(page)
+            else:
+                high = mid
+        return (low + 1) * self.page_size
+
+    def fetch_pages(self, page_indexes):
+        """Fetch the given pages concurrently. Failed pages are retried without blocking the other pages."""
+        page_indexes = [i for i in page_indexes if i not in self.pages]
+
+        def on_result(page_index, posts_data):
+            if posts_data is not None:
+                self.pages[page_index] = posts_data
+
+        jobs = [(i, lambda i=i, state=API_RETRY_POLICY.start(): self.fetch_page_job(i, state)) for i in page_indexes]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            run_jobs(executor, jobs, on_result, self.is_running)
+
+    def assemble(self):
+        """Return the fetched posts in listing order with duplicates removed, and the number of duplicates dropped."""
+        posts, seen_ids, duplicates = [], set(), 0
+        for page_index in sorted(self.pages):
+            for post in self.pages[page_index]:
+                post_id = post.get('id')
+                if post_id in seen_ids:
+                    duplicates += 1
+                    continue
+                seen_ids.add(post_id)
+                posts.append(post)
+        return posts, duplicates
+
+    def shifted_pages(self):
+        """Return the pages on either side of every boundary where the listing moved between requests.
+
+        A boundary is suspect when neighbouring pages share a post, when the earlier page came back short
+        or when one of them failed to load.
+        """
+        if not self.pages:
+            return []
+        shifted = set()
+        for page_index in range(max(self.pages)):
+            page, next_page = self.pages.get(page_index), self.pages.get(page_index + 1)
+            if page is None or next_page is None or len(page) < self.page_size:
+                shifted.update((page_index, page_index + 1))
+            elif {post.get('id') for post in page} & {post.get('id') for post in next_page}:
+                shifted.update((page_index, page_index + 1))
+        return sorted(shifted)
+
+    def fetch_new_head_posts(self, known_ids):
+        """Collect posts published at the head of the listing while the crawl was running."""
+        new_posts = []
+        for page_index in range(self.max_pages):
+            if not self.is_running():
+                break
+            page = self.fetch_page_with_retries(page_index)
+            unseen = [post for post in page if post.get('id') not in known_ids]
+            new_posts.extend(unseen)
+            if len(unseen) < len(page) or len(page) < self.page_size:
+                break
+        return new_posts
+
+    def fetch_all(self):
+        """Fetch all posts. The first page is requested before anything else so callers can validate the creator."""
+        self.get_page(0)
+        expected_count = self.fetch_post_count()
+        if expected_count is None:
+            self.logger.debug("Post count not advertised, probing listing offsets")
+            try:
+                expected_count = self.probe_post_count()
+            except (requests.RequestException, ValueError) as e:
+                # Fall back to walking the listing page by page from what we already have
+                self.logger.warning("Failed to probe post count: {0}", e)
+                expected_count = max(self.pages) * self.page_size + len(self.pages[max(self.pages)])
+        page_count = min(max(1, -(-expected_count // self.page_size)), self.max_pages)
+        self.logger.info("Expecting {0} posts across {1} pages", expected_count, page_count)
+
+        self.fetch_pages(range(page_count))
+
+        # The count may be stale if posts were added while crawling: keep going until a partial page
+        next_page = page_count
+        while self.is_running() and next_page < self.max_pages and len(self.pages.get(next_page - 1, [])) == self.page_size:
+            try:
+                self.get_page(next_page)
+            except (requests.RequestException, ValueError) as e:
+                self.logger.error("Failed to fetch page at offset {0}: {1}", next_page * self.page_size, e)
+                break
+            next_page += 1
+
+        posts, duplicates = self.assemble()
+        if not self.is_running():
+            return posts
+
+        # New posts shift every page towards higher offsets, so re-read the head for anything we missed
+        known_ids = {post.get('id') for post in posts}
+        try:
+            head_posts = self.fetch_new_head_posts(known_ids)
+        except (requests.RequestException, ValueError) as e:
+            head_posts = []
+            self.logger.warning("Failed to re-check newest posts: {0}", e)
+        if head_posts:
+            self.logger.info("Found {0} posts published during the crawl", len(head_posts))
+            posts = head_posts + posts
+            known_ids.update(post.get('id') for post in head_posts)
+
+        # Deleted posts shift pages towards lower offsets and can hide a post at a page boundary
+        shifted = self.shifted_pages()
+        if shifted and self.is_running():
+            self.logger.warning("Listing shifted during the crawl, re-fetching {0} pages to fill gaps", len(shifted))
+            for page_index in shifted:
+                self.pages.pop(page_index, None)
+            self.fetch_pages(shifted)
+            refetched_posts, _ = self.assemble()
+            missing = [post for post in refetched_posts if post.get('id') not in known_ids]
+            if missing:
+                order = {post.get('id'): i for i, post in enumerate(refetched_posts)}
+                posts = sorted(posts + missing, key=lambda post: order.get(post.get('id'), len(order)))
+                self.logger.info("Recovered {0} posts missed during pagination", len(missing))
+        elif len(posts) != expected_count:
+            self.logger.debug("Expected {0} posts but found {1}", expected_count, len(posts))
+
+        if duplicates:
+            self.logger.debug("Dropped {0} duplicate posts caused by listing shifts", duplicates)
+        return posts
+
 class PostDetectionThread(QThread):
     finished = pyqtSignal(list)
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
     error = pyqtSignal(str)
 
-    def __init__(self, url, post_titles_map):
+    def __init__(self, url, post_titles_map, post_payloads):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.url = url
         self.post_titles_map = post_titles_map  # Shared dictionary to store post titles
+        self.post_payloads = post_payloads  # Shared dictionary to store listing payloads per creator
         self.is_running = True
 
     def stop(self):
         self.is_running = False
 
+    def run_fallback_validation(self):
+        fallback_headers = {
+            'User-Agent': user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': accept_language,
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Cache-Control': 'max-age=0'
+        }
+        try:
+            direct_response = rate_limited_get(self.url, headers=fallback_headers, timeout=10)
+            if direct_response.status_code == 200 and 'kemono' in direct_response.text.lower():
+                self.logger.info(translate("url_validated_fallback", self.url))
+            else:
+                self.logger.error("Fallback validation failed for {0} - Status code: {1}", self.url, direct_response.status_code)
+        except requests.RequestException as fallback_e:
+            self.logger.error(translate("fallback_validation_failed", str(fallback_e)))
+
     def run(self):
         if not self.is_running:
             return
-        self.log.emit(translate("log_info", f"Checking creator with URL: {self.url}"), "INFO")
+        self.logger.info("Checking creator with URL: {0}", self.url)
         parts = self.url.split('/')
         if len(parts) < 5 or 'coomer.su' not in self.url or parts[-2] != 'user':
+            self.logger.flush()
             self.error.emit(translate("invalid_url_format"))
             return
         service, creator_id = parts[-3], parts[-1]
         base_api_url = f"{API_BASE}/{service}/user/{creator_id}"
 
+        paginator = CreatorPostPaginator(service, creator_id, self.logger, lambda: self.is_running)
         all_posts = []
-        offset = 0
-        page_size = 50
-        max_attempts = 200
-
-        attempt = 1
-        while attempt <= max_attempts and self.is_running:
-            api_url = f"{base_api_url}?o={offset}"
-            self.log.emit(translate("log_debug", f"Fetching page {attempt} (offset {offset}) from {api_url}"), "INFO")
-            
-            try:
-                response = requests.get(api_url, headers=HEADERS, timeout=10)
-                if response.status_code != 200:
-                    self.log.emit(translate("log_info", translate("first_validation_failed", api_url)), "INFO")
-                    # Fallback validation
-                    self.log.emit(translate("log_info", translate("attempting_fallback_validation", api_url)), "INFO")
-                    fallback_headers = {
-                        'User-Agent': user_agent,
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                        'Accept-Language': accept_language,
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                        'Cache-Control': 'max-age=0'
-                    }
-                    try:
-                        direct_response = requests.get(self.url, headers=fallback_headers, timeout=10)
-                        if direct_response.status_code == 200 and 'kemono' in direct_response.text.lower():
-                            self.log.emit(translate("log_info", translate("url_validated_fallback", self.url)), "INFO")
-                            break 
-                        else:
-                            self.log.emit(translate("log_error", f"Fallback validation failed for {self.url} - Status code: {direct_response.status_code}"), "ERROR")
-                            break
-                    except requests.RequestException as fallback_e:
-                        self.log.emit(translate("log_error", translate("fallback_validation_failed", str(fallback_e))), "ERROR")
-                        break
-                    
-                posts_data = response.json()
-                if not isinstance(posts_data, list):
-                    self.log.emit(translate("log_error", "Invalid posts data returned! Response: " + json.dumps(posts_data, indent=2)), "ERROR")
-                    break
-
-                self.log.emit(translate("log_debug", f"Fetched {len(posts_data)} posts at offset {offset}"), "INFO")
-                for post in posts_data:
-                    post_id = post.get('id')
-                    title = post.get('title', f"Post {post_id}")
-                    self.log.emit(translate("log_debug", f"Post ID: {post_id}, Title: {title}"), "INFO")
-                    # Store title in shared post_titles_map
-                    self.post_titles_map[(service, creator_id, post_id)] = sanitize_filename(title)
-
-                if not posts_data:
-                    self.log.emit(translate("log_info", f"No more posts to fetch at offset {offset}. Stopping pagination."), "INFO")
-                    break
-
-                all_posts.extend(posts_data)
-                offset += page_size
-                attempt += 1
-                time.sleep(0.5)
-
-            except requests.RequestException as e:
-                self.log.emit(translate("log_info", translate("first_validation_failed_exception", api_url)), "INFO")
-                # Fallback validation on exception
-                self.log.emit(translate("log_info", translate("attempting_fallback_validation", api_url)), "INFO")
-                fallback_headers = {
-                    'User-Agent': user_agent,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': accept_language,
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Cache-Control': 'max-age=0'
-                }
-                try:
-                    direct_response = requests.get(self.url, headers=fallback_headers, timeout=10)
-                    if direct_response.status_code == 200 and 'kemono' in direct_response.text.lower():
-                        self.log.emit(translate("log_info", translate("url_validated_fallback", self.url)), "INFO")
-                        break  
-                    else:
-                        self.log.emit(translate("log_error", f"Fallback validation failed for {self.url} - Status code: {direct_response.status_code}"), "ERROR")
-                        break
-                except requests.RequestException as fallback_e:
-                    self.log.emit(translate("log_error", translate("fallback_validation_failed", str(fallback_e))), "ERROR")
-                    break
+        try:
+            all_posts = paginator.fetch_all()
+        except requests.HTTPError:
+            self.logger.info(translate("first_validation_failed", base_api_url))
+            self.logger.info(translate("attempting_fallback_validation", base_api_url))
+            self.run_fallback_validation()
+        except (requests.RequestException, ValueError):
+            self.logger.info(translate("first_validation_failed_exception", base_api_url))
+            self.logger.info(translate("attempting_fallback_validation", base_api_url))
+            self.run_fallback_validation()
+
+        for post in all_posts:
+            post_id = post.get('id')
+            title = post.get('title', f"Post {post_id}")
+            self.logger.debug("Post ID: {0}, Title: {1}", post_id, title)
+            # Store title in shared post_titles_map
+            self.post_titles_map[(service, creator_id, post_id)] = sanitize_filename(title)
 
         if self.is_running:
+            # Keep the full listing payloads so file preparation can detect files without refetching each post
+            self.post_payloads[self.url] = {post.get('id'): post for post in all_posts if post.get('id')}
             detected_posts = []
             for post in all_posts:
                 post_id = post.get('id')
@@ -258,15 +409,17 @@ class PostDetectionThread(QThread):
                     thumbnail_url = urljoin("https://coomer.su", post['file']['path'])
                 detected_posts.append((title, (post_id, thumbnail_url)))
 
-            self.log.emit(translate("log_info", f"Total posts fetched for creator {self.url}: {len(detected_posts)}"), "INFO")
+            self.logger.info("Total posts fetched for creator {0}: {1}", self.url, len(detected_posts))
+            self.logger.flush()
             self.finished.emit(detected_posts)
 
 class PostPopulationThread(QThread):
-    finished = pyqtSignal(dict, list)
-    log = pyqtSignal(str, str)
+    finished = pyqtSignal(dict, list, list, object)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
 
     def __init__(self, detected_posts):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.detected_posts = detected_posts
         self.is_running = True
 
@@ -277,48 +430,29 @@ class PostPopulationThread(QThread):
         if not self.is_running:
             return
         post_url_map = {}
+        post_rows = []
         for post_title, (post_id, thumbnail_url) in self.detected_posts:
             unique_title = f"{post_title} (ID: {post_id})"
             post_url_map[unique_title] = (post_id, thumbnail_url)
-            self.log.emit(translate("log_debug", f"Mapped title '{unique_title}' to ID: {post_id}, Thumbnail: {thumbnail_url}"), "INFO")
-        self.log.emit(translate("log_debug", f"Prepared {len(self.detected_posts)} posts for population, unique titles: {len(post_url_map)}"), "INFO")
-        self.finished.emit(post_url_map, self.detected_posts)
+            post_rows.append((unique_title, thumbnail_url, post_id))
+            self.logger.debug("Mapped title '{0}' to ID: {1}, Thumbnail: {2}", unique_title, post_id, thumbnail_url)
+        title_index = TitleIndex(post_title for post_title, _ in self.detected_posts)
+        self.logger.debug("Prepared {0} posts for population, unique titles: {1}", len(self.detected_posts), len(post_url_map))
+        self.logger.flush()
+        self.finished.emit(post_url_map, self.detected_posts, post_rows, title_index)
         
-class FilterThread(QThread):
-    finished = pyqtSignal(list)
-    log = pyqtSignal(str, str)
-
-    def __init__(self, all_detected_posts, checked_urls, search_text):
-        super().__init__()
-        self.all_detected_posts = all_detected_posts
-        self.checked_urls = checked_urls.copy()
-        self.search_text = search_text.lower()
-        self.is_running = True
-
-    def stop(self):
-        self.is_running = False
-
-    def run(self):
-        if not self.is_running:
-            return
-        filtered_items = []
-        for post_title, (post_id, thumbnail_url) in self.all_detected_posts:
-            if not self.search_text or self.search_text in post_title.lower():
-                is_checked = self.checked_urls.get(post_id, False)
-                filtered_items.append((post_title, post_id, thumbnail_url, is_checked))
-                self.log.emit(translate("log_debug", f"Filtered post: {post_title} (ID: {post_id})"), "INFO")
-        self.finished.emit(filtered_items)
-
 class FilePreparationThread(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal(list, dict)
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
     error = pyqtSignal(str)
 
-    def __init__(self, post_ids, all_files_map, creator_ext_checks, creator_main_check, creator_attachments_check, creator_content_check, max_concurrent=20):
+    def __init__(self, post_ids, all_files_map, post_payloads, creator_ext_checks, creator_main_check, creator_attachments_check, creator_content_check, max_concurrent=20):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.post_ids = post_ids
         self.all_files_map = all_files_map
+        self.post_payloads = post_payloads
         self.creator_ext_checks = creator_ext_checks
         self.creator_main_check = creator_main_check
         self.creator_attachments_check = creator_attachments_check
@@ -331,7 +465,7 @@ class FilePreparationThread(QThread):
 
     def detect_files(self, post, allowed_extensions):
         files_to_download = []
-        self.log.emit(translate("log_debug", f"Detecting files for post with allowed extensions: {allowed_extensions}"), "INFO")
+        self.logger.debug("Detecting files for post with allowed extensions: {0}", allowed_extensions)
         
         def get_effective_extension(file_path, file_name):
             name_ext = os.path.splitext(file_name)[1].lower()
@@ -346,12 +480,12 @@ class FilePreparationThread(QThread):
             file_url = urljoin("https://coomer.su", file_path)
             if 'f=' not in file_url and file_name:
                 file_url += f"?f={file_name}"
-            self.log.emit(translate("log_debug", f"Checking main file: {file_name} ({file_ext})"), "INFO")
+            self.logger.debug("Checking main file: {0} ({1})", file_name, file_ext)
             if '.jpg' in allowed_extensions and file_ext in ['.jpg', '.jpeg']:
-                self.log.emit(translate("log_debug", f"Added main file: {file_name}"), "INFO")
+                self.logger.debug("Added main file: {0}", file_name)
                 files_to_download.append((file_name, file_url))
             elif file_ext in allowed_extensions:
-                self.log.emit(translate("log_debug", f"Added main file: {file_name}"), "INFO")
+                self.logger.debug("Added main file: {0}", file_name)
                 files_to_download.append((file_name, file_url))
 
         # Attachments detection
@@ -364,12 +498,12 @@ class FilePreparationThread(QThread):
                     attachment_url = urljoin("https://coomer.su", attachment_path)
                     if 'f=' not in attachment_url and attachment_name:
                         attachment_url += f"?f={attachment_name}"
-                    self.log.emit(translate("log_debug", f"Checking attachment: {attachment_name} ({attachment_ext})"), "INFO")
+                    self.logger.debug("Checking attachment: {0} ({1})", attachment_name, attachment_ext)
                     if '.jpg' in allowed_extensions and attachment_ext in ['.jpg', '.jpeg']:
-                        self.log.emit(translate("log_debug", f"Added attachment: {attachment_name}"), "INFO")
+                        self.logger.debug("Added attachment: {0}", attachment_name)
                         files_to_download.append((attachment_name, attachment_url))
                     elif attachment_ext in allowed_extensions:
-                        self.log.emit(translate("log_debug", f"Added attachment: {attachment_name}"), "INFO")
+                        self.logger.debug("Added attachment: {0}", attachment_name)
                         files_to_download.append((attachment_name, attachment_url))
 
         # Content images detection
@@ -379,50 +513,61 @@ class FilePreparationThread(QThread):
                 img_url = urljoin("https://coomer.su", img['src'])
                 img_ext = os.path.splitext(img_url)[1].lower()
                 img_name = os.path.basename(img_url)
-                self.log.emit(translate("log_debug", f"Checking content image: {img_name} ({img_ext})"), "INFO")
+                self.logger.debug("Checking content image: {0} ({1})", img_name, img_ext)
                 if '.jpg' in allowed_extensions and img_ext in ['.jpg', '.jpeg']:
-                    self.log.emit(translate("log_debug", f"Added content image: {img_name}"), "INFO")
+                    self.logger.debug("Added content image: {0}", img_name)
                     files_to_download.append((img_name, img_url))
                 elif img_ext in allowed_extensions:
-                    self.log.emit(translate("log_debug", f"Added content image: {img_name}"), "INFO")
+                    self.logger.debug("Added content image: {0}", img_name)
                     files_to_download.append((img_name, img_url))
 
-        self.log.emit(translate("log_debug", f"Total files detected: {len(files_to_download)}"), "INFO")
+        self.logger.debug("Total files detected: {0}", len(files_to_download))
         return list(dict.fromkeys(files_to_download))
 
-    def fetch_and_detect_files(self, post_id, creator_url):
+    def is_complete_payload(self, post):
+        """Check whether a listing payload carries everything detect_files needs for the selected categories."""
+        if not isinstance(post, dict):
+            return False
+        if self.creator_main_check and 'file' not in post:
+            return False
+        if self.creator_attachments_check and not isinstance(post.get('attachments'), list):
+            return False
+        # Listings may only carry a 'substring' preview of the post body
+        if self.creator_content_check and 'content' not in post:
+            return False
+        return True
+
+    def fetch_and_detect_files(self, post_id, creator_url, retry_state):
+        """Fetch one post and detect its files. Raises RetryLater on transient errors and returns None on give-up."""
         parts = creator_url.split('/')
         service, creator_id = parts[-3], parts[-1]
         api_url = f"{API_BASE}/{service}/user/{creator_id}/post/{post_id}"
-        max_retries = 50
-        retry_delay_seconds = 5
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = requests.get(api_url, headers=HEADERS)
-                if response.status_code != 200:
-                    if response.status_code == 429 and attempt < max_retries:
-                        self.log.emit(translate("log_warning", f"Rate limit hit for {api_url} (attempt {attempt}/{max_retries}). Retrying..."), "WARNING")
-                        for i in range(retry_delay_seconds, 0, -1):
-                            self.log.emit(translate("log_info", f"Trying again in {i}"), "INFO")
-                            time.sleep(1)
-                        continue
-                    self.log.emit(translate("log_error", f"Failed to fetch {api_url} - Status code: {response.status_code}"), "ERROR")
-                    return None
-                post_data = response.json()
-                post = post_data if isinstance(post_data, dict) and 'post' not in post_data else post_data.get('post', {})
-                self.log.emit(translate("log_debug", f"Post data for {post_id}: {json.dumps(post, indent=2)}"), "INFO")
-                allowed_extensions = [ext.lower() for ext, checkbox in self.creator_ext_checks.items() if checkbox.isChecked()]
-                detected_files = self.detect_files(post, allowed_extensions)
-                files_to_download = [(file_name, file_url) for file_name, file_url in detected_files]
-                return (post_id, files_to_download)
-            except Exception as e:
-                if attempt == max_retries:
-                    self.log.emit(translate("log_error", f"Error fetching post {post_id} after {max_retries} attempts: {str(e)}"), "ERROR")
+        try:
+            response = rate_limited_get(api_url, headers=HEADERS, timeout=10)
+            if response.status_code != 200:
+                error_class = classify_error(response.status_code)
+                delay = retry_state.next_delay(error_class, parse_retry_after(response.headers.get('Retry-After')))
+                if delay is None:
+                    self.logger.error("Failed to fetch {0} - Status code: {1}", api_url, response.status_code)
                     return None
-                self.log.emit(translate("log_warning", f"Error fetching post {post_id} (attempt {attempt}/{max_retries}): {str(e)}. Retrying..."), "WARNING")
-                for i in range(retry_delay_seconds, 0, -1):
-                    self.log.emit(translate("log_info", f"Trying again in {i}"), "INFO")
-                    time.sleep(1)
+                self.logger.warning("Failed to fetch {0} - Status code: {1}. Retrying in {2:.1f}s ({3})", api_url, response.status_code, delay, retry_state.describe(error_class))
+                raise RetryLater(delay)
+            post_data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            error_class = classify_error(exception=e)
+            delay = retry_state.next_delay(error_class)
+            if delay is None:
+                self.logger.error("Error fetching post {0} after {1} attempts: {2}", post_id, retry_state.failures, e)
+                return None
+            self.logger.warning("Error fetching post {0}: {1}. Retrying in {2:.1f}s ({3})", post_id, e, delay, retry_state.describe(error_class))
+            raise RetryLater(delay)
+        post = post_data if isinstance(post_data, dict) and 'post' not in post_data else post_data.get('post', {})
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug("Post data for {0}: {1}", post_id, json.dumps(post, indent=2))
+        allowed_extensions = [ext.lower() for ext, checkbox in self.creator_ext_checks.items() if checkbox.isChecked()]
+        detected_files = self.detect_files(post, allowed_extensions)
+        files_to_download = [(file_name, file_url) for file_name, file_url in detected_files]
+        return (post_id, files_to_download)
 
     def run(self):
         if not self.is_running:
@@ -430,7 +575,7 @@ class FilePreparationThread(QThread):
         files_to_download = []
         files_to_posts_map = {}
         allowed_extensions = [ext.lower() for ext, checkbox in self.creator_ext_checks.items() if checkbox.isChecked()]
-        self.log.emit(translate("log_debug", f"Allowed extensions for download: {allowed_extensions}"), "INFO")
+        self.logger.debug("Allowed extensions for download: {0}", allowed_extensions)
 
         total_posts = len(self.post_ids)
         completed_posts = 0
@@ -444,36 +589,90 @@ class FilePreparationThread(QThread):
                     break
 
         if not creator_urls:
-            self.log.emit(translate("log_error", "No matching creator URLs found for selected posts."), "ERROR")
+            self.logger.error("No matching creator URLs found for selected posts.")
+            self.logger.flush()
             self.finished.emit([], {})
             return
 
-        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-            future_to_post = {}
-            for creator_url in creator_urls:
-                for post_id in self.post_ids:
-                    if any(p[1][0] == post_id for p in self.all_files_map.get(creator_url, [])):
-                        future_to_post[executor.submit(self.fetch_and_detect_files, post_id, creator_url)] = post_id
-            
-            for future in as_completed(future_to_post):
+        def add_result(result):
+            nonlocal completed_posts
+            if result:
+                post_id, detected_files = result
+                for file_name, file_url in detected_files:
+                    self.logger.debug("Detected file: {0} from {1}", file_name, file_url)
+                    files_to_download.append(file_url)
+                    files_to_posts_map[file_url] = post_id
+                completed_posts += 1
+                progress = min(int((completed_posts / total_posts) * 100), 100)
+                self.progress.emit(progress)
+
+        # Use the payloads kept from the creator listing and only hit the per-post endpoint for missing or truncated ones
+        posts_to_fetch = []
+        for creator_url in creator_urls:
+            creator_posts = {p[1][0] for p in self.all_files_map.get(creator_url, [])}
+            payloads = self.post_payloads.get(creator_url, {})
+            for post_id in self.post_ids:
+                if post_id not in creator_posts:
+                    continue
+                post = payloads.get(post_id)
+                if self.is_complete_payload(post):
+                    add_result((post_id, self.detect_files(post, allowed_extensions)))
+                else:
+                    posts_to_fetch.append((post_id, creator_url))
                 if not self.is_running:
                     break
-                result = future.result()
-                if result:
-                    post_id, detected_files = result
-                    for file_name, file_url in detected_files:
-                        self.log.emit(translate("log_debug", f"Detected file: {file_name} from {file_url}"), "INFO")
-                        files_to_download.append(file_url)
-                        files_to_posts_map[file_url] = post_id
-                    completed_posts += 1
-                    progress = min(int((completed_posts / total_posts) * 100), 100)
-                    self.progress.emit(progress)
+
+        self.logger.debug("Detected files locally for {0} posts, fetching {1} posts individually", total_posts - len(posts_to_fetch), len(posts_to_fetch))
+
+        if posts_to_fetch and self.is_running:
+            jobs = [(post_id, lambda post_id=post_id, creator_url=creator_url, state=API_RETRY_POLICY.start():
+                         self.fetch_and_detect_files(post_id, creator_url, state))
+                    for post_id, creator_url in posts_to_fetch]
+            with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+                run_jobs(executor, jobs, lambda post_id, result: add_result(result), lambda: self.is_running,
+                         lambda post_id, e: self.logger.error("Error fetching post {0}: {1}", post_id, e))
 
         if self.is_running:
             files_to_download = list(dict.fromkeys(files_to_download))
-            self.log.emit(translate("log_debug", f"Total files to download: {len(files_to_download)}"), "INFO")
+            self.logger.debug("Total files to download: {0}", len(files_to_download))
+            self.logger.flush()
             self.finished.emit(files_to_download, files_to_posts_map)
 
+class DownloadPlanThread(QThread):
+    """Looks up the size of every prepared file so the tab can check the job against the free disk space."""
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
+
+    def __init__(self, files_to_download, download_folder, other_files_dir, storage_mode='copy', max_concurrent=8):
+        super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
+        self.files_to_download = files_to_download
+        self.download_folder = download_folder
+        self.other_files_dir = other_files_dir
+        self.storage_mode = storage_mode
+        self.max_concurrent = max_concurrent
+        self.is_running = True
+
+    def stop(self):
+        self.is_running = False
+
+    def run(self):
+        if not self.is_running:
+            return
+        self.logger.debug("Checking sizes of {0} files", len(self.files_to_download))
+        try:
+            plan = plan_downloads(self.files_to_download, self.download_folder, get_download_store(self.other_files_dir),
+                                  HEADERS, self.storage_mode, lambda: self.is_running, self.max_concurrent,
+                                  lambda done, total: self.progress.emit(int(done / total * 100)))
+        except Exception as e:
+            # Planning is advisory; without it the download simply runs unchecked
+            self.logger.warning("Could not check file sizes: {0}", e)
+            plan = None
+        if self.is_running:
+            self.logger.flush()
+            self.finished.emit(plan)
+
 def sanitize_filename(name, max_length=100):
     """Sanitize a filename by removing invalid characters, trailing dots, and limiting length."""
     if not name:
@@ -495,14 +694,15 @@ def sanitize_filename(name, max_length=100):
     return sanitized if sanitized else "unnamed"
 
 class CreatorDownloadThread(QThread):
-    file_progress = pyqtSignal(int, int) 
+    files_progress = pyqtSignal(dict)  # {file_index: percent} snapshots from progress_counters
     file_completed = pyqtSignal(int, str, bool)  # Added success flag
     post_completed = pyqtSignal(str)
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
     finished = pyqtSignal()
 
-    def __init__(self, service, creator_id, download_folder, selected_posts, files_to_download, files_to_posts_map, console, other_files_dir, post_titles_map, max_concurrent=20):
+    def __init__(self, service, creator_id, download_folder, selected_posts, files_to_download, files_to_posts_map, console, other_files_dir, post_titles_map, max_concurrent=20, hash_algorithm=DEFAULT_HASH_ALGORITHM, storage_mode='copy', verify_files=False):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.service = service
         self.creator_id = creator_id
         self.download_folder = download_folder
@@ -512,12 +712,19 @@ class CreatorDownloadThread(QThread):
         self.console = console
         self.is_running = True
         self.other_files_dir = other_files_dir
-        self.hash_file_path = os.path.join(self.other_files_dir, "file_hashes.json")
-        self.file_hashes = self.load_hashes()
+        self.hash_algorithm = hash_algorithm  # Any key of HASH_ALGORITHMS
+        self.storage_mode = storage_mode  # Any of STORAGE_MODES
+        self.verify_files = verify_files  # Re-hash existing files instead of trusting matching size/mtime/inode
+        self.directory_cache = DirectoryCache()
+        self.progress_counters = ProgressAggregator(self.files_progress.emit)
+        self.disk_writer = None  # Created inside the download event loop in run()
+        self.bytes_received = 0
+        self.store = get_download_store(self.other_files_dir)
         self.max_concurrent = max_concurrent
         self.post_files_map = self.build_post_files_map()
         self.completed_files = set()
         self.failed_files = {}  # Map file_url to error message
+        self.no_resume = set()  # Files whose partial data the server failed to continue; restarted whole from now on
         self.post_titles_map = post_titles_map
         self.creator_name = None
 
@@ -529,38 +736,19 @@ class CreatorDownloadThread(QThread):
                 post_files_map[post_id].append(file_url)
         return post_files_map
 
-    def load_hashes(self):
-        os.makedirs(self.other_files_dir, exist_ok=True)
-        if os.path.exists(self.hash_file_path):
-            try:
-                with open(self.hash_file_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                self.log.emit(translate("log_error", f"Failed to load file hashes: {str(e)}"), "ERROR")
-                return {}
-        return {}
-
-    def save_hashes(self):
-        os.makedirs(self.other_files_dir, exist_ok=True)
-        try:
-            with open(self.hash_file_path, 'w') as f:
-                json.dump(self.file_hashes, f, indent=4)
-        except IOError as e:
-            self.log.emit(translate("log_error", f"Failed to save file hashes: {str(e)}"), "ERROR")
-
     def fetch_creator_and_post_info(self):
         """Fetch creator name and retrieve post titles from post_titles_map."""
         profile_url = f"{API_BASE}/{self.service}/user/{self.creator_id}/profile"
         try:
-            profile_response = requests.get(profile_url, headers=HEADERS, timeout=10)
+            profile_response = rate_limited_get(profile_url, headers=HEADERS, timeout=10)
             if profile_response.status_code == 200:
                 profile_data = profile_response.json()
                 self.creator_name = sanitize_filename(profile_data.get('name', 'Unknown_Creator'))
             else:
                 self.creator_name = "Unknown_Creator"
-                self.log.emit(translate("log_warning", f"Failed to fetch creator name, using default: {self.creator_name}"), "WARNING")
+                self.logger.warning("Failed to fetch creator name, using default: {0}", self.creator_name)
         except requests.RequestException as e:
-            self.log.emit(translate("log_error", f"Error fetching creator name: {str(e)}"), "ERROR")
+            self.logger.error("Error fetching creator name: {0}", e)
             self.creator_name = "Unknown_Creator"
 
         for post_id in self.selected_posts:
@@ -568,25 +756,26 @@ class CreatorDownloadThread(QThread):
             if key not in self.post_titles_map:
                 post_url = f"{API_BASE}/{self.service}/user/{self.creator_id}/post/{post_id}"
                 try:
-                    response = requests.get(post_url, headers=HEADERS, timeout=10)
+                    response = rate_limited_get(post_url, headers=HEADERS, timeout=10)
                     if response.status_code == 200:
                         post_data = response.json()
                         title = post_data.get('title', f"Post_{post_id}")
                         self.post_titles_map[key] = sanitize_filename(title)
-                        self.log.emit(translate("log_info", f"Fetched title for post {post_id}: {title}"), "INFO")
+                        self.logger.info("Fetched title for post {0}: {1}", post_id, title)
                     else:
                         self.post_titles_map[key] = sanitize_filename(f"Post_{post_id}")
-                        self.log.emit(translate("log_warning", f"Failed to fetch title for post {post_id}, using default"), "WARNING")
+                        self.logger.warning("Failed to fetch title for post {0}, using default", post_id)
                 except requests.RequestException as e:
                     self.post_titles_map[key] = sanitize_filename(f"Post_{post_id}")
-                    self.log.emit(translate("log_error", f"Error fetching title for post {post_id}: {str(e)}"), "ERROR")
+                    self.logger.error("Error fetching title for post {0}: {1}", post_id, e)
 
     def stop(self):
         self.is_running = False
 
-    async def download_file(self, file_url, folder, file_index, total_files, session):
+    async def download_file(self, file_url, folder, file_index, total_files, session, retry_state):
+        """Make one download attempt. Raises RetryLater on transient errors so the worker can pick up other files."""
         if not self.is_running or file_url not in self.files_to_download:
-            self.log.emit(translate("log_info", f"Skipping {file_url}"), "INFO")
+            self.logger.info("Skipping {0}", file_url)
             return
 
         post_id = self.files_to_posts_map.get(file_url, self.creator_id)
@@ -595,12 +784,12 @@ class CreatorDownloadThread(QThread):
         post_folder_name = f"{post_id}_{post_title}"
         post_folder = os.path.join(folder, post_folder_name)
         try:
-            os.makedirs(post_folder, exist_ok=True)
+            self.directory_cache.makedirs(post_folder)
         except OSError as e:
             error_msg = f"Failed to create post folder {post_folder}: {str(e)}. Likely due to invalid folder name."
-            self.log.emit(translate("log_error", error_msg), "ERROR")
+            self.logger.error(error_msg)
             self.failed_files[file_url] = error_msg
-            self.file_completed.emit(file_index, file_url, False)
+            self.complete_file(file_index, file_url, False)
             self.check_post_completion(file_url)
             return
 
@@ -608,100 +797,226 @@ class CreatorDownloadThread(QThread):
         full_path = os.path.join(post_folder, filename.replace('/', '_'))
         url_hash = hashlib.md5(file_url.encode()).hexdigest()
 
-        file_hashes_keys = list(self.file_hashes.keys())
-        for hash_key in file_hashes_keys:
-            if hash_key == url_hash:
-                existing_path = self.file_hashes[hash_key]["file_path"]
-                if os.path.exists(existing_path):
-                    with open(existing_path, 'rb') as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                    stored_hash = self.file_hashes[hash_key]["file_hash"]
-                    if file_hash == stored_hash:
-                        self.log.emit(translate("log_info", translate("file_already_downloaded", filename, existing_path)), "INFO")
-                        self.file_progress.emit(file_index, 100)
-                        self.file_completed.emit(file_index, file_url, True)
-                        self.completed_files.add(file_url)
-                        self.check_post_completion(file_url)
-                        return
-
-        self.log.emit(translate("log_info", translate("starting_download", file_index + 1, total_files, file_url, post_folder)), "INFO")
-        
-        max_retries = 50
-        file_handle = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                async with session.get(file_url, headers=HEADERS, timeout=ClientTimeout(total=3600)) as response:
-                    response.raise_for_status()
-                    file_size = int(response.headers.get('content-length', 0)) or 1
-                    downloaded_size = 0
-
-                    file_handle = open(full_path, 'wb')
-                    async for chunk in response.content.iter_chunked(8192):
-                        if not self.is_running:
-                            file_handle.close()
-                            file_handle = None
-                            if os.path.exists(full_path):
-                                try:
-                                    os.remove(full_path)
-                                except OSError as e:
-                                    self.log.emit(translate("log_error", f"Failed to remove interrupted file {full_path}: {str(e)}"), "ERROR")
-                            self.failed_files[file_url] = "Download interrupted by user"
-                            self.file_completed.emit(file_index, file_url, False)
-                            self.check_post_completion(file_url)
-                            return
-                        if chunk:
-                            file_handle.write(chunk)
-                            downloaded_size += len(chunk)
-                            progress = int((downloaded_size / file_size) * 100)
-                            self.file_progress.emit(file_index, progress)
-                            if progress == 100:
-                                self.file_completed.emit(file_index, file_url, True)
-
-                    file_handle.close()
-                    file_handle = None
-                    with open(full_path, 'rb') as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                    self.file_hashes[url_hash] = {
-                        "file_path": full_path,
-                        "file_hash": file_hash,
-                        "url": file_url
-                    }
-                    self.save_hashes()
-                    self.log.emit(translate("log_info", translate("successfully_downloaded", full_path)), "INFO")
+        entry = self.store.get(url_hash)
+        existing_stat = self.directory_cache.stat(entry["file_path"]) if entry else None
+        if existing_stat and self.store.is_intact(entry, existing_stat, self.verify_files):
+            existing_path = entry["file_path"]
+            self.logger.info(translate("file_already_downloaded", filename, existing_path))
+            self.complete_file(file_index, file_url, True)
+            self.completed_files.add(file_url)
+            self.check_post_completion(file_url)
+            return
+
+        content_sha256 = content_hash_from_url(file_url)
+        # Data URLs are named after their SHA-256, so hash those downloads with it and check the result against the URL
+        hash_algorithm = 'sha256' if content_sha256 else self.hash_algorithm
+        if content_sha256 and not retry_state.failures:
+            entry = self.store.find_content(content_sha256, self.directory_cache.stat, self.verify_files)
+            if entry:
+                existing_path = entry["file_path"]
+                try:
+                    if os.path.abspath(existing_path) != os.path.abspath(full_path):
+                        used_mode = place_existing_file(existing_path, full_path, self.storage_mode)
+                        self.logger.debug("Placed {0} from {1} ({2})", full_path, existing_path, used_mode)
+                except OSError as e:
+                    self.logger.warning("Failed to reuse {0} for {1}: {2}", existing_path, file_url, e)
+                else:
+                    self.directory_cache.update(full_path)
+                    self.store.put(url_hash, file_url, full_path, entry["file_hash"], entry["hash_algorithm"], content_sha256, os.stat(full_path))
+                    self.logger.info(translate("file_already_downloaded", filename, existing_path))
+                    self.complete_file(file_index, file_url, True)
                     self.completed_files.add(file_url)
-                    self.file_completed.emit(file_index, file_url, True)
                     self.check_post_completion(file_url)
                     return
 
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                if file_handle:
-                    file_handle.close()
-                    file_handle = None
-                if attempt == max_retries:
-                    error_msg = translate("error_downloading_after_retries", file_url, max_retries, str(e))
-                    self.log.emit(translate("log_error", error_msg), "ERROR")
-                    self.failed_files[file_url] = str(e)
-                    self.file_progress.emit(file_index, 0)
-                    self.file_completed.emit(file_index, file_url, False)
+        if not retry_state.failures:
+            self.logger.info(translate("starting_download", file_index + 1, total_files, file_url, post_folder))
+
+        file_handle = None
+        if content_sha256 and not content_claims.claim(content_sha256):
+            # The same content is downloading for another post; check again once that one had time to finish
+            self.logger.debug("Waiting for an identical file to finish before {0}", file_url)
+            raise RetryLater(2.0)
+        file_hash = None
+        limiter = limiter_for(file_url)
+        try:
+            # Set up the part file inside the try, so a bad sidecar or a permission error still releases the claim
+            partial = PartialDownload(full_path)
+            if file_url in self.no_resume:
+                # The server could not continue this file before, so fetch it whole in a single stream
+                partial.reset()
+            if not partial.segments:
+                await limiter.wait_async()
+                # Ranges apply to the encoded body, so ask for identity to keep offsets meaningful
+                request_headers = {**HEADERS, "Accept-Encoding": "identity", **partial.range_headers()}
+                async with session.get(file_url, headers=request_headers, timeout=ClientTimeout(total=3600)) as response:
+                    limiter.observe(response.status, response.headers.get('Retry-After'))
+                    if response.status != 416:
+                        response.raise_for_status()
+                    offset = partial.start(response.status, response.headers)
+                    if offset is None:
+                        self.logger.info("Partial file for {0} was already complete", file_url)
+                    elif offset == 0 and file_url not in self.no_resume and partial.can_segment(response.headers):
+                        # Leave this response unread and fetch the file as parallel byte ranges instead
+                        partial.plan_segments()
+                        self.logger.info("Downloading {0} in {1} segments", file_url, len(partial.segments))
+                    else:
+                        if offset > 0:
+                            self.logger.info("Resuming {0} at byte {1}", file_url, offset)
+                        elif partial.total_size and file_url not in self.no_resume:
+                            # Reserve the whole file up front as one segment; a full disk fails here, not midway
+                            partial.plan_segments(1)
+                        file_size = partial.total_size or (offset + int(response.headers.get('content-length', 0))) or 1
+                        downloaded_size = offset
+                        hasher = new_hash(hash_algorithm)
+                        if offset > 0:
+                            # Hash the bytes kept from the earlier attempt before continuing with the new ones
+                            await self.disk_writer.run(update_from_file, hasher, partial.part_path, offset)
+
+                        file_handle = await self.disk_writer.run(partial.open, offset)
+
+                        def write_block(block):
+                            if partial.segments:
+                                block = block[:partial.write(file_handle, 0, block)]
+                            else:
+                                file_handle.write(block)
+                            hasher.update(block)
+
+                        sink = self.disk_writer.sink(write_block)
+                        try:
+                            async for chunk in response.content.iter_chunked(RECEIVE_CHUNK_SIZE):
+                                if not self.is_running:
+                                    # Keep the partial file so the next run can resume it
+                                    self.failed_files[file_url] = "Download interrupted by user"
+                                    self.complete_file(file_index, file_url, False)
+                                    self.check_post_completion(file_url)
+                                    return
+                                if chunk:
+                                    await sink.write(chunk)
+                                    self.bytes_received += len(chunk)
+                                    downloaded_size += len(chunk)
+                                    self.progress_counters.update(file_index, downloaded_size, file_size)
+                        finally:
+                            await sink.drain()
+                            if partial.segments:
+                                await self.disk_writer.run(partial.checkpoint, file_handle)
+
+                        file_handle.close()
+                        file_handle = None
+                        file_hash = hasher.hexdigest()
+                        if partial.total_size and downloaded_size < partial.total_size:
+                            raise aiohttp.ClientPayloadError(f"Connection closed at byte {downloaded_size} of {partial.total_size}")
+
+            if partial.segments:
+                await self.download_segments(file_url, partial, file_index, session)
+                if not self.is_running:
+                    self.failed_files[file_url] = "Download interrupted by user"
+                    self.complete_file(file_index, file_url, False)
                     self.check_post_completion(file_url)
                     return
-                else:
-                    self.log.emit(translate("log_warning", translate("download_failed_retrying", file_url, attempt, max_retries, str(e))), "WARNING")
-                    await asyncio.sleep(1)
-            except Exception as e:
-                if file_handle:
-                    file_handle.close()
-                    file_handle = None
-                self.log.emit(translate("log_error", f"Unexpected error downloading {file_url}: {str(e)}"), "ERROR")
+
+            if file_hash is None:
+                # Segmented or already complete downloads were not written in order, so hash them from disk
+                file_hash = await self.disk_writer.run(hash_file, partial.part_path, hash_algorithm)
+            if content_sha256 and file_hash != content_sha256:
+                partial.reset()
+                raise ContentMismatch(f"Downloaded data hashes to {file_hash} instead of {content_sha256}")
+            await self.disk_writer.run(partial.finish)
+            self.directory_cache.update(full_path)
+            self.store.put(url_hash, file_url, full_path, file_hash, hash_algorithm, content_sha256, os.stat(full_path))
+            self.logger.info(translate("successfully_downloaded", full_path))
+            self.completed_files.add(file_url)
+            self.complete_file(file_index, file_url, True)
+            self.check_post_completion(file_url)
+            return
+
+        except ResumeMismatch as e:
+            if file_handle:
+                file_handle.close()
+                file_handle = None
+            partial.reset()
+            self.no_resume.add(file_url)
+            delay = retry_state.next_delay('server')
+            if delay is None:
+                self.logger.error(translate("error_downloading_after_retries", file_url, retry_state.failures, str(e)))
                 self.failed_files[file_url] = str(e)
-                self.file_progress.emit(file_index, 0)
-                self.file_completed.emit(file_index, file_url, False)
+                self.complete_file(file_index, file_url, False)
                 self.check_post_completion(file_url)
                 return
-            finally:
-                if file_handle:
-                    file_handle.close()
-                    file_handle = None
+            self.logger.warning("Cannot resume {0}: {1}. Restarting from the beginning", file_url, e)
+            raise RetryLater(delay)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ContentMismatch) as e:
+            if file_handle:
+                file_handle.close()
+                file_handle = None
+            error_class = classify_error(exception=e)
+            delay = retry_state.next_delay(error_class, retry_after_from(e))
+            if delay is None:
+                error_msg = translate("error_downloading_after_retries", file_url, retry_state.failures, str(e))
+                self.logger.error(error_msg)
+                self.failed_files[file_url] = str(e)
+                self.complete_file(file_index, file_url, False)
+                self.check_post_completion(file_url)
+                return
+            self.logger.warning(translate("download_failed_retrying", file_url, retry_state.attempts[error_class], retry_state.policy.budgets[error_class], str(e)))
+            self.logger.info(translate("retry_countdown", f"{delay:.1f}"))
+            raise RetryLater(delay)
+        except Exception as e:
+            if file_handle:
+                file_handle.close()
+                file_handle = None
+            self.logger.error("Unexpected error downloading {0}: {1}", file_url, e)
+            self.failed_files[file_url] = str(e)
+            self.complete_file(file_index, file_url, False)
+            self.check_post_completion(file_url)
+            return
+        finally:
+            if file_handle:
+                file_handle.close()
+                file_handle = None
+            if content_sha256:
+                content_claims.release(content_sha256)
+
+    async def download_segments(self, file_url, partial, file_index, session):
+        """Fetch the unfinished byte ranges of a segmented download concurrently into the preallocated part file."""
+        limiter = limiter_for(file_url)
+
+        async def fetch_segment(index):
+            await limiter.wait_async()
+            request_headers = {**HEADERS, "Accept-Encoding": "identity", **partial.segment_headers(index)}
+            async with session.get(file_url, headers=request_headers, timeout=ClientTimeout(total=3600)) as response:
+                limiter.observe(response.status, response.headers.get('Retry-After'))
+                response.raise_for_status()
+                partial.check_segment(index, response.status, response.headers)
+                start, _, written = partial.segments[index]
+                with open(partial.part_path, 'r+b') as f:
+                    f.seek(start + written)
+                    sink = self.disk_writer.sink(lambda block: partial.write(f, index, block))
+                    try:
+                        async for chunk in response.content.iter_chunked(RECEIVE_CHUNK_SIZE):
+                            if not self.is_running:
+                                return
+                            await sink.write(chunk)
+                            self.bytes_received += len(chunk)
+                            # Counts what has reached the writer, so it trails the network by at most a block
+                            self.progress_counters.update(file_index, partial.downloaded, partial.total_size)
+                    finally:
+                        await sink.drain()
+                        await self.disk_writer.run(partial.checkpoint, f)
+                if not partial.segment_done(index) and self.is_running:
+                    raise aiohttp.ClientPayloadError(f"Segment {index} closed early")
+
+        pending = [i for i in range(len(partial.segments)) if not partial.segment_done(i)]
+        results = await asyncio.gather(*(fetch_segment(i) for i in pending), return_exceptions=True)
+        # Let every segment keep its progress, then report the first failure so the retry resumes what is left
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def complete_file(self, file_index, file_url, success):
+        """Report a finished file, making sure no progress for it is published afterwards."""
+        self.progress_counters.finish(file_index)
+        self.file_completed.emit(file_index, file_url, success)
 
     def check_post_completion(self, file_url):
         post_id = self.files_to_posts_map.get(file_url)
@@ -711,78 +1026,100 @@ class CreatorDownloadThread(QThread):
                 self.post_completed.emit(post_id)
 
     async def download_worker(self, queue, folder, total_files, session):
+        loop = asyncio.get_running_loop()
         while self.is_running:
+            file_index, file_url, retry_state = await queue.get()
             try:
-                file_index, file_url = await queue.get()
-                await self.download_file(file_url, folder, file_index, total_files, session)
-                queue.task_done()
-            except asyncio.QueueEmpty:
-                break
+                await self.download_file(file_url, folder, file_index, total_files, session, retry_state)
+            except RetryLater as retry:
+                # Requeue after the delay instead of sleeping here. The item is only marked done once its retry
+                # is back in the queue, so queue.join() keeps waiting for it.
+                def requeue(item=(file_index, file_url, retry_state)):
+                    queue.put_nowait(item)
+                    queue.task_done()
+                loop.call_later(retry.delay, requeue)
+                continue
             except Exception as e:
-                self.log.emit(translate("log_error", f"Error in download worker: {e}"), "ERROR")
-                queue.task_done()
+                self.logger.error("Error in download worker: {0}", e)
+            queue.task_done()
 
     def run(self):
         if not self.is_running:
             return
-        self.log.emit(translate("log_info", f"CreatorDownloadThread started for service: {self.service}, creator_id: {self.creator_id}"), "INFO")
+        self.logger.info("CreatorDownloadThread started for service: {0}, creator_id: {1}", self.service, self.creator_id)
         self.fetch_creator_and_post_info()
         total_posts = len(self.selected_posts)
-        self.log.emit(translate("log_info", f"Total posts: {total_posts}"), "INFO")
+        self.logger.info("Total posts: {0}", total_posts)
 
         creator_folder_name = f"{self.creator_id}_{self.creator_name}"
         creator_folder = os.path.join(self.download_folder, creator_folder_name)
         try:
             os.makedirs(creator_folder, exist_ok=True)
         except OSError as e:
-            self.log.emit(translate("log_error", f"Failed to create creator folder {creator_folder}: {str(e)}"), "ERROR")
-        self.log.emit(translate("log_info", f"Created directory: {creator_folder}"), "INFO")
+            self.logger.error("Failed to create creator folder {0}: {1}", creator_folder, e)
+        self.logger.info("Created directory: {0}", creator_folder)
 
         total_files = len(self.files_to_download)
-        self.log.emit(translate("log_info", f"Total selected files to download: {total_files}"), "INFO")
+        self.logger.info("Total selected files to download: {0}", total_files)
 
         if total_files > 0:
+            started = time.monotonic()
+            self.progress_counters.start()
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             try:
                 queue = asyncio.Queue()
                 for i, file_url in enumerate(self.files_to_download):
-                    queue.put_nowait((i, file_url))
+                    queue.put_nowait((i, file_url, DOWNLOAD_RETRY_POLICY.start()))
 
                 async def main():
-                    async with ClientSession() as session:
-                        tasks = [
-                            loop.create_task(self.download_worker(queue, creator_folder, total_files, session))
-                            for _ in range(self.max_concurrent)
-                        ]
-                        await queue.join()
-                        await asyncio.gather(*tasks, return_exceptions=True)
+                    self.disk_writer = DiskWriter()
+                    try:
+                        async with ClientSession(read_bufsize=RECEIVE_BUFFER_SIZE) as session:
+                            tasks = [
+                                loop.create_task(self.download_worker(queue, creator_folder, total_files, session))
+                                for _ in range(self.max_concurrent)
+                            ]
+                            await queue.join()
+                            # Idle workers are blocked on queue.get() and would never return on their own
+                            for task in tasks:
+                                task.cancel()
+                            await asyncio.gather(*tasks, return_exceptions=True)
+                    finally:
+                        self.disk_writer.shutdown()
 
                 loop.run_until_complete(main())
             except Exception as e:
-                self.log.emit(translate("log_error", f"Error in async download loop: {e}"), "ERROR")
+                self.logger.error("Error in async download loop: {0}", e)
             finally:
                 if not loop.is_closed():
                     loop.run_until_complete(loop.shutdown_asyncgens())
                     loop.close()
+                self.progress_counters.stop()
+            if self.is_running:
+                record_throughput(self.store, self.bytes_received, time.monotonic() - started)
         else:
-            self.log.emit(translate("log_warning", "No files selected for download."), "WARNING")
+            self.logger.warning("No files selected for download.")
 
         # Log summary of failed files
         if self.failed_files:
-            self.log.emit(translate("log_warning", f"Download completed with {len(self.failed_files)} failed files:"), "WARNING")
+            self.logger.warning("Download completed with {0} failed files:", len(self.failed_files))
             for file_url, error in self.failed_files.items():
-                self.log.emit(translate("log_error", f"Failed to download {file_url}: {error}"), "ERROR")
+                self.logger.error("Failed to download {0}: {1}", file_url, error)
 
+        # Make this creator's records durable before the next one starts
+        self.store.flush()
         if self.is_running:
+            self.logger.flush()
             self.finished.emit()
 
 class ValidationThread(QThread):
     result = pyqtSignal(bool)
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
 
     def __init__(self, url):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.url = url
         self.is_running = True
 
@@ -795,7 +1132,8 @@ class ValidationThread(QThread):
         
         parts = self.url.split('/')
         if len(parts) < 5 or 'coomer.su' not in self.url or parts[-2] != 'user':
-            self.log.emit(translate("log_error", f"Invalid URL format: {self.url}"), "ERROR")
+            self.logger.error("Invalid URL format: {0}", self.url)
+            self.logger.flush()
             self.result.emit(False)
             return
             
@@ -803,45 +1141,16 @@ class ValidationThread(QThread):
         api_url = f"{API_BASE}/{service}/user/{creator_id}"
         
         try:
-            response = requests.get(api_url, headers=HEADERS, timeout=5)
+            response = rate_limited_get(api_url, headers=HEADERS, timeout=5)
             valid = response.status_code == 200
-            self.log.emit(translate("log_info", f"Validated URL {self.url}: {'Valid' if valid else 'Invalid'}"), "INFO")
+            self.logger.info("Validated URL {0}: {1}", self.url, 'Valid' if valid else 'Invalid')
+            self.logger.flush()
             self.result.emit(valid)
         except requests.RequestException as e:
-            self.log.emit(translate("log_error", f"Failed to validate {self.url}: {str(e)}"), "ERROR")
+            self.logger.error("Failed to validate {0}: {1}", self.url, e)
+            self.logger.flush()
             self.result.emit(False)
 
-class CheckboxToggleThread(QThread):
-    finished = pyqtSignal(dict, list)
-    log = pyqtSignal(str, str)
-
-    def __init__(self, visible_posts, checked_urls, check_all_state):
-        super().__init__()
-        self.visible_posts = visible_posts  # Use visible posts instead of all_detected_posts
-        self.checked_urls = checked_urls.copy()
-        self.check_all_state = check_all_state
-        self.is_running = True
-
-    def stop(self):
-        self.is_running = False
-
-    def run(self):
-        if not self.is_running:
-            return
-        is_checked = self.check_all_state == 2  # Qt.CheckState.Checked
-        new_state = Qt.CheckState.Checked if is_checked else Qt.CheckState.Unchecked
-        
-        # Only update checked_urls for posts that are currently visible
-        affected_post_ids = set()
-        for post_title, (post_id, _) in self.visible_posts:
-            self.checked_urls[post_id] = (new_state == Qt.CheckState.Checked)
-            affected_post_ids.add(post_id)
-        
-        # Update posts_to_download based on all checked posts, not just visible ones
-        posts_to_download = [post_id for post_id, checked in self.checked_urls.items() if checked]
-        self.log.emit(translate("log_debug", f"Checkbox toggle completed: Check ALL = {is_checked}, Affected posts: {len(affected_post_ids)}, Total checked: {len(posts_to_download)}"), "INFO")
-        self.finished.emit(self.checked_urls, posts_to_download)
-
 class CreatorDownloaderTab(QWidget):
     def __init__(self, parent):
         super().__init__()
@@ -849,15 +1158,17 @@ class CreatorDownloaderTab(QWidget):
         self.posts_to_download = []
         self.post_url_map = {}
         self.all_detected_posts = []
-        self.creator_queue = []
+        self.creator_queue = QueueModel(self)
         self.downloading = False
         self.current_preview_url = None
-        self.previous_selected_widget = None
         self.cache_dir = self.parent.cache_folder
         self.other_files_dir = self.parent.other_files_folder
         self.current_creator_url = None
         self.all_files_map = {}
-        self.checked_urls = {}
+        self.creator_post_model = CheckListModel(parent=self)
+        self.creator_post_model.check_toggled.connect(self.on_post_check_toggled)
+        self.post_rows = []  # Model rows of every post of the current creator, in all_detected_posts order
+        self.title_index = None
         self.current_file_index = -1
         self.active_threads = []
         self.completed_posts = set()
@@ -868,10 +1179,10 @@ class CreatorDownloaderTab(QWidget):
         self.validation_thread = None
         self.post_detection_thread = None
         self.post_population_thread = None
-        self.filter_thread = None
         self.file_preparation_thread = None
-        self.checkbox_toggle_thread = None
+        self.download_plan_thread = None
         self.post_titles_map = {}
+        self.post_payloads = {}  # Map creator URL to {post_id: listing payload}
         os.makedirs(self.cache_dir, exist_ok=True)
         os.makedirs(self.other_files_dir, exist_ok=True)
         self.setup_ui()
@@ -901,9 +1212,10 @@ class CreatorDownloaderTab(QWidget):
         self.creator_queue_group = QGroupBox()
         self.creator_queue_group.setStyleSheet("QGroupBox { color: white; font-weight: bold; padding: 10px; }")
         creator_queue_layout = QVBoxLayout()
-        self.creator_queue_list = QListWidget()
+        self.creator_queue_list = queue_list_view(self.creator_queue)
         self.creator_queue_list.setFixedHeight(100)
-        self.creator_queue_list.setStyleSheet("background: #2A3B5A; border-radius: 5px;")
+        self.creator_queue_list.delegate.view_clicked.connect(self.check_creator_from_queue)
+        self.creator_queue_list.delegate.remove_clicked.connect(self.remove_creator_from_queue)
         creator_queue_layout.addWidget(self.creator_queue_list)
         self.creator_queue_group.setLayout(creator_queue_layout)
         left_layout.addWidget(self.creator_queue_group)
@@ -972,9 +1284,7 @@ class CreatorDownloaderTab(QWidget):
         left_layout.addLayout(creator_progress_layout)
 
         # Console
-        self.creator_console = QTextEdit()
-        self.creator_console.setReadOnly(True)
-        self.creator_console.setStyleSheet("background: #2A3B5A; border-radius: 5px; padding: 5px;")
+        self.creator_console = LogConsole("creator", self.other_files_dir)
         left_layout.addWidget(self.creator_console)
 
         # Buttons layout
@@ -1004,7 +1314,11 @@ class CreatorDownloaderTab(QWidget):
 
         self.creator_search_input = QLineEdit()
         self.creator_search_input.setStyleSheet("padding: 5px; border-radius: 5px;")
-        self.creator_search_input.textChanged.connect(self.filter_items)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_INTERVAL)
+        self.search_timer.timeout.connect(self.filter_items)
+        self.creator_search_input.textChanged.connect(lambda: self.search_timer.start())
         post_list_layout.addWidget(self.creator_search_input)
 
         checkbox_layout = QHBoxLayout()
@@ -1015,11 +1329,9 @@ class CreatorDownloaderTab(QWidget):
         checkbox_layout.addWidget(self.creator_check_all)
         post_list_layout.addLayout(checkbox_layout)
 
-        self.creator_post_list = QListWidget()
-        self.creator_post_list.setStyleSheet("background: #2A3B5A; border-radius: 5px;")
-        self.creator_post_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.creator_post_list.itemClicked.connect(self.handle_item_click)
-        self.creator_post_list.currentItemChanged.connect(self.update_current_preview_url)
+        self.creator_post_list = check_list_view(self.creator_post_model)
+        self.creator_post_list.clicked.connect(self.handle_item_click)
+        self.creator_post_list.selectionModel().currentChanged.connect(self.update_current_preview_url)
         post_list_layout.addWidget(self.creator_post_list)
 
         bottom_layout = QHBoxLayout()
@@ -1069,6 +1381,7 @@ class CreatorDownloaderTab(QWidget):
         self.creator_options_group.setTitle(translate("download_options"))
         self.creator_ext_group.setTitle(translate("file_extensions"))
         self.post_list_group.setTitle(translate("posts_to_download"))
+        self.creator_console.update_ui_text()
         
         self.creator_main_check.setText(translate("main_file"))
         self.creator_attachments_check.setText(translate("attachments"))
@@ -1084,8 +1397,6 @@ class CreatorDownloaderTab(QWidget):
         self.creator_cancel_btn.setText(translate("cancel"))
         
         self.creator_search_input.setPlaceholderText(translate("search_posts"))
-        
-        self.update_creator_queue_list()
 
     def update_progress_bar_style(self):
         separator_style = "QProgressBar { border: 1px solid #4A5B7A; border-radius: 5px; background: #2A3B5A; } QProgressBar::chunk { background: #4A5B7A; }"
@@ -1113,7 +1424,7 @@ class CreatorDownloaderTab(QWidget):
         if not url:
             self.append_log_to_console(translate("log_error", translate("no_url_entered")), "ERROR")
             return
-        if any(item[0] == url for item in self.creator_queue):
+        if url in self.creator_queue:
             self.append_log_to_console(translate("log_warning", translate("url_already_in_queue")), "WARNING")
             return
         if hasattr(self, 'validation_thread') and self.validation_thread is not None and self.validation_thread.isRunning():
@@ -1123,7 +1434,7 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setRange(0, 0)
         self.validation_thread = ValidationThread(url)
         self.validation_thread.result.connect(lambda valid: self.on_validation_finished(url, valid))
-        self.validation_thread.log.connect(self.append_log_to_console)
+        self.validation_thread.log.connect(self.append_log_batch)
         self.validation_thread.finished.connect(self.cleanup_validation_thread)
         self.active_threads.append(self.validation_thread)
         self.validation_thread.start()
@@ -1140,79 +1451,35 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setValue(0)
         self.background_task_label.setText(translate("idle"))
         if valid:
-            self.creator_queue.append((url, False))
-            self.update_creator_queue_list()
+            self.creator_queue.append(url)
             self.creator_url_input.clear()
             self.append_log_to_console(translate("log_info", translate("added_creator_url", url)), "INFO")
         else:
             self.append_log_to_console(translate("log_error", translate("invalid_creator_url", url)), "ERROR")
 
-    def create_view_handler(self, url, checked):
-        def handler():
-            self.check_creator_from_queue(url)
-        return handler
-
-    def create_remove_handler(self, url):
-        def handler():
-            reply = QMessageBox.question(self, translate("confirm_removal"), 
-                                        translate("confirm_removal_message", url),
-                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-            if reply == QMessageBox.StandardButton.Yes:
-                found = False
-                for i, (queue_url, _) in enumerate(self.creator_queue):
-                    if queue_url == url:
-                        del self.creator_queue[i]
-                        found = True
-                        break
-                if found:
-                    self.update_creator_queue_list()
-                    self.append_log_to_console(translate("log_info", translate("link_removed", url)), "INFO")
-                    if not any(c for _, c in self.creator_queue):
-                        self.creator_post_list.clear()
-                        self.all_detected_posts = []
-                        self.posts_to_download = []
-                        self.post_url_map = {}
-                        self.checked_urls = {}
-                        self.all_files_map = {}
-                        self.current_creator_url = None
-                        self.previous_selected_widget = None
-                        self.update_checked_posts()
-                        self.filter_items()
-                else:
-                    self.append_log_to_console(translate("log_warning", translate("url_not_found", url)), "WARNING")
-        return handler
-
-    def update_creator_queue_list(self):
-        self.creator_queue_list.clear()
-        for url, checked in self.creator_queue:
-            item = QListWidgetItem()
-            widget = QWidget()
-            layout = QHBoxLayout()
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setSpacing(5)
-
-            view_button = QPushButton(qta.icon('fa5s.eye', color='white'), "")
-            view_button.setStyleSheet("background: #4A5B7A; padding: 2px; border-radius: 5px; min-width: 30px; max-width: 30px; min-height: 30px; max-height: 30px;")
-            view_button.clicked.connect(self.create_view_handler(url, checked))
-            layout.addWidget(view_button)
-
-            label = QLabel(url)
-            label.setStyleSheet("color: white;")
-            label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            layout.addWidget(label, stretch=1)
-
-            remove_button = QPushButton(qta.icon('fa5s.times', color='white'), "")
-            remove_button.setStyleSheet("background: #4A5B7A; padding: 2px; border-radius: 5px; min-width: 30px; max-width: 30px; min-height: 30px; max-height: 30px;")
-            remove_button.clicked.connect(self.create_remove_handler(url))
-            layout.addWidget(remove_button)
-
-            widget.setLayout(layout)
-            item.setSizeHint(widget.sizeHint())
-            self.creator_queue_list.addItem(item)
-            self.creator_queue_list.setItemWidget(item, widget)
-            widget.view_button = view_button
-            widget.label = label
-            widget.remove_button = remove_button
+    def remove_creator_from_queue(self, url):
+        reply = QMessageBox.question(self, translate("confirm_removal"), 
+                                    translate("confirm_removal_message", url),
+                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            if self.creator_queue.remove(url):
+                self.post_payloads.pop(url, None)
+                self.append_log_to_console(translate("log_info", translate("link_removed", url)), "INFO")
+                if not self.creator_queue.any_viewed():
+                    self.creator_post_model.clear()
+                    self.all_detected_posts = []
+                    self.posts_to_download = []
+                    self.post_url_map = {}
+                    self.post_rows = []
+                    self.title_index = None
+                    self.creator_post_model.clear_checks()
+                    self.all_files_map = {}
+                    self.post_payloads.clear()
+                    self.current_creator_url = None
+                    self.update_checked_posts()
+                    self.filter_items()
+            else:
+                self.append_log_to_console(translate("log_warning", translate("url_not_found", url)), "WARNING")
 
     def check_creator_from_queue(self, url):
         if not isinstance(url, str):
@@ -1221,29 +1488,26 @@ class CreatorDownloaderTab(QWidget):
         self.append_log_to_console(translate("log_info", translate("viewing_creator", url)), "INFO")
         
         self.current_creator_url = url
-        self.checked_urls.clear()
+        self.creator_post_model.clear_checks()
         self.posts_to_download = []
         
-        self.creator_post_list.clear()
-        self.previous_selected_widget = None
+        self.creator_post_model.clear()
+        self.post_rows = []
+        self.title_index = None
         
         if url in self.all_files_map:
             self.all_detected_posts = self.all_files_map.get(url, [])
             self.start_population_thread(self.all_detected_posts)
-            for i, (queue_url, _) in enumerate(self.creator_queue):
-                if queue_url == url:
-                    self.creator_queue[i] = (url, True)
-                    self.update_creator_queue_list()
-                    break
+            self.creator_queue.mark_viewed(url)
         else:
             if hasattr(self, 'post_detection_thread') and self.post_detection_thread is not None and self.post_detection_thread.isRunning():
                 self.append_log_to_console(translate("log_warning", "Post detection already in progress. Please wait."), "WARNING")
                 return
             self.background_task_label.setText(translate("detecting_posts"))
             self.background_task_progress.setRange(0, 0)
-            self.post_detection_thread = PostDetectionThread(url, self.post_titles_map)
+            self.post_detection_thread = PostDetectionThread(url, self.post_titles_map, self.post_payloads)
             self.post_detection_thread.finished.connect(self.on_post_detection_finished)
-            self.post_detection_thread.log.connect(self.append_log_to_console)
+            self.post_detection_thread.log.connect(self.append_log_batch)
             self.post_detection_thread.error.connect(self.on_post_detection_error)
             self.post_detection_thread.finished.connect(self.cleanup_post_detection_thread) 
             self.active_threads.append(self.post_detection_thread)
@@ -1265,20 +1529,16 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setRange(0, 0)
         self.post_population_thread = PostPopulationThread(detected_posts)
         self.post_population_thread.finished.connect(self.on_post_population_finished)
-        self.post_population_thread.log.connect(self.append_log_to_console)
+        self.post_population_thread.log.connect(self.append_log_batch)
         self.active_threads.append(self.post_population_thread)
         self.post_population_thread.start()
 
-    def on_post_population_finished(self, post_url_map, all_detected_posts):
+    def on_post_population_finished(self, post_url_map, all_detected_posts, post_rows, title_index):
         self.post_url_map = post_url_map
         self.all_detected_posts = all_detected_posts
-        for post_title, (post_id, thumbnail_url) in self.all_detected_posts:
-            self.checked_urls[post_id] = False
-        for i, (queue_url, _) in enumerate(self.creator_queue):
-            if queue_url == self.current_creator_url:
-                self.creator_queue[i] = (self.current_creator_url, True)
-                self.update_creator_queue_list()
-                break
+        self.post_rows = post_rows
+        self.title_index = title_index
+        self.creator_queue.mark_viewed(self.current_creator_url)
         self.filter_items()
         self.append_log_to_console(translate("log_debug", f"Populated {len(self.all_detected_posts)} posts for creator {self.current_creator_url}"), "INFO")
         self.background_task_progress.setRange(0, 100)
@@ -1298,11 +1558,13 @@ class CreatorDownloaderTab(QWidget):
             self.append_log_to_console(translate("log_warning", translate("no_creators_queue")), "WARNING")
             return
 
+        self.posts_to_download = [post_id for _, (post_id, _) in self.all_detected_posts if self.creator_post_model.is_checked(post_id)]
         if not self.posts_to_download:
             self.append_log_to_console(translate("log_warning", translate("no_posts_selected")), "WARNING")
             return
 
         self.downloading = True
+        preview_service().cancel_prefetch()
         self.parent.tabs.setTabEnabled(0, False)
         self.parent.status_label.setText(translate("preparing_files"))
         self.creator_download_btn.setEnabled(False)
@@ -1357,6 +1619,7 @@ class CreatorDownloaderTab(QWidget):
         self.file_preparation_thread = FilePreparationThread(
             post_ids,
             self.all_files_map,
+            self.post_payloads,
             self.creator_ext_checks,
             self.creator_main_check.isChecked(),
             self.creator_attachments_check.isChecked(),
@@ -1365,7 +1628,7 @@ class CreatorDownloaderTab(QWidget):
         )
         self.file_preparation_thread.progress.connect(self.update_background_progress)
         self.file_preparation_thread.finished.connect(lambda files, files_map: self.on_file_preparation_finished(urls, files, files_map))
-        self.file_preparation_thread.log.connect(self.append_log_to_console)
+        self.file_preparation_thread.log.connect(self.append_log_batch)
         self.file_preparation_thread.error.connect(self.on_file_preparation_error)
         self.active_threads.append(self.file_preparation_thread)
         self.file_preparation_thread.start()
@@ -1392,6 +1655,55 @@ class CreatorDownloaderTab(QWidget):
             self.process_next_creator(urls[1:] if len(urls) > 1 else [])
             return
 
+        self.background_task_label.setText(translate("checking_file_sizes"))
+        self.download_plan_thread = DownloadPlanThread(files_to_download, self.parent.download_folder, self.other_files_dir,
+                                                       self.parent.settings_tab.get_storage_mode())
+        self.download_plan_thread.progress.connect(self.update_background_progress)
+        self.download_plan_thread.finished.connect(lambda plan: self.on_download_plan_finished(urls, files_to_download, files_to_posts_map, plan))
+        self.download_plan_thread.log.connect(self.append_log_batch)
+        self.active_threads.append(self.download_plan_thread)
+        self.download_plan_thread.start()
+
+    def on_download_plan_finished(self, urls, files_to_download, files_to_posts_map, plan):
+        if self.download_plan_thread in self.active_threads:
+            self.active_threads.remove(self.download_plan_thread)
+            self.download_plan_thread.deleteLater()
+        self.download_plan_thread = None
+        self.background_task_progress.setValue(0)
+        self.background_task_label.setText(translate("idle"))
+
+        if plan is not None:
+            estimate = plan.estimated_seconds()
+            self.append_log_to_console(translate("log_info", translate(
+                "download_plan_summary", len(plan.needed_urls), format_size(plan.total_bytes), len(plan.present),
+                plan.unknown_count, format_duration(estimate) if estimate is not None else translate("unknown_duration"))), "INFO")
+            if not plan.fits():
+                files_to_download = self.confirm_trimmed_download(plan)
+                if not files_to_download:
+                    self.append_log_to_console(translate("log_warning", translate("download_refused_disk_space", plan.folder)), "WARNING")
+                    self.process_next_creator(urls[1:])
+                    return
+                self.total_files_to_download = len(files_to_download)
+                self.append_log_to_console(translate("log_warning", f"Trimmed the download to {len(files_to_download)} files that fit on disk"), "WARNING")
+
+        self.start_creator_download_thread(urls, files_to_download, files_to_posts_map)
+
+    def confirm_trimmed_download(self, plan):
+        """Ask whether to download only the files that fit on disk. Returns those files, or an empty list to cancel."""
+        kept = plan.trimmed()
+        dialog = QMessageBox(self)
+        dialog.setIcon(QMessageBox.Icon.Warning)
+        dialog.setWindowTitle(translate("not_enough_space_title"))
+        dialog.setText(translate("not_enough_space_message", format_size(plan.total_bytes), format_size(plan.free_bytes),
+                                 plan.folder, len(kept), len(plan.urls)))
+        trim_button = dialog.addButton(translate("download_what_fits"), QMessageBox.ButtonRole.AcceptRole) if kept else None
+        dialog.addButton(QMessageBox.StandardButton.Cancel)
+        dialog.exec()
+        if trim_button is None or dialog.clickedButton() != trim_button:
+            return []
+        return kept
+
+    def start_creator_download_thread(self, urls, files_to_download, files_to_posts_map):
         url = urls[0]
         remaining_urls = urls[1:]
         parts = url.split('/')
@@ -1403,11 +1715,13 @@ class CreatorDownloaderTab(QWidget):
         max_concurrent = self.parent.settings_tab.get_simultaneous_downloads()
         thread = CreatorDownloadThread(service, creator_id, self.parent.download_folder, 
                                     self.posts_to_download, files_to_download, files_to_posts_map, 
-                                    self.creator_console, self.other_files_dir, self.post_titles_map, max_concurrent)
-        thread.file_progress.connect(self.update_creator_file_progress)
+                                    self.creator_console, self.other_files_dir, self.post_titles_map, max_concurrent,
+                                    storage_mode=self.parent.settings_tab.get_storage_mode(),
+                                    verify_files=self.parent.settings_tab.is_verify_existing_files_enabled())
+        thread.files_progress.connect(self.update_creator_files_progress)
         thread.file_completed.connect(self.update_file_completion)
         thread.post_completed.connect(self.update_post_completion)
-        thread.log.connect(self.append_log_to_console)
+        thread.log.connect(self.append_log_batch)
         thread.finished.connect(lambda: self.cleanup_thread(thread, remaining_urls))
         self.active_threads.append(thread)
         thread.start()
@@ -1480,7 +1794,7 @@ class CreatorDownloaderTab(QWidget):
         # Start cancellation thread to handle cleanup
         cancellation_thread = CancellationThread(self.active_threads[:])
         cancellation_thread.finished.connect(self.on_cancellation_finished)
-        cancellation_thread.log.connect(self.append_log_to_console)
+        cancellation_thread.log.connect(self.append_log_batch)
         self.active_threads.append(cancellation_thread)
         cancellation_thread.start()
         
@@ -1509,12 +1823,15 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setValue(0)
         self.background_task_label.setText(translate("idle"))
         self.file_preparation_thread = None
+        self.download_plan_thread = None
         self.post_detection_thread = None
         self.post_population_thread = None
-        self.filter_thread = None
-        self.checkbox_toggle_thread = None
         self.validation_thread = None
 
+    def update_creator_files_progress(self, snapshot):
+        for file_index, progress in snapshot.items():
+            self.update_creator_file_progress(file_index, progress)
+
     def update_creator_file_progress(self, file_index, progress):
         if self.current_file_index == file_index or self.current_file_index == -1:
             self.current_file_index = file_index
@@ -1603,196 +1920,63 @@ class CreatorDownloaderTab(QWidget):
         self.background_task_progress.setValue(0)
         self.background_task_label.setText(translate("idle"))
         self.file_preparation_thread = None
+        self.download_plan_thread = None
         self.post_detection_thread = None
         self.post_population_thread = None
-        self.filter_thread = None
-        self.checkbox_toggle_thread = None
         self.validation_thread = None
 
     def toggle_check_all(self, state):
-        if hasattr(self, 'checkbox_toggle_thread') and self.checkbox_toggle_thread is not None and self.checkbox_toggle_thread.isRunning():
-            self.append_log_to_console(translate("log_warning", "Checkbox toggle already in progress. Please wait."), "WARNING")
-            return
-        
-        # Get the currently visible posts from creator_post_list
-        visible_posts = []
-        for i in range(self.creator_post_list.count()):
-            item = self.creator_post_list.item(i)
-            if not item.isHidden():  # Only include visible items
-                post_title = self.creator_post_list.itemWidget(item).label.text()
-                post_id, thumbnail_url = self.post_url_map.get(post_title, (None, None))
-                if post_id:
-                    visible_posts.append((post_title, (post_id, thumbnail_url)))
-
-        if not visible_posts:
+        visible_post_ids = self.creator_post_model.keys()
+        if not visible_post_ids:
             self.append_log_to_console(translate("log_warning", "No visible posts to toggle."), "WARNING")
             return
-
-        self.background_task_label.setText(translate("updating_checkboxes"))
-        self.background_task_progress.setRange(0, 0)
-        self.checkbox_toggle_thread = CheckboxToggleThread(visible_posts, self.checked_urls, state)
-        self.checkbox_toggle_thread.finished.connect(self.on_toggle_check_all_finished)
-        self.checkbox_toggle_thread.log.connect(self.append_log_to_console)
-        self.checkbox_toggle_thread.finished.connect(self.cleanup_checkbox_toggle_thread)
-        self.active_threads.append(self.checkbox_toggle_thread)
-        self.checkbox_toggle_thread.start()
-    
-    def cleanup_checkbox_toggle_thread(self):
-        """Clean up the checkbox toggle thread after it finishes."""
-        if self.checkbox_toggle_thread in self.active_threads:
-            self.active_threads.remove(self.checkbox_toggle_thread)
-        self.checkbox_toggle_thread.deleteLater()
-        self.checkbox_toggle_thread = None
-
-    def on_toggle_check_all_finished(self, checked_urls, posts_to_download):
-        self.checked_urls = checked_urls
-        self.posts_to_download = posts_to_download
-        self.filter_items()
-        self.background_task_progress.setRange(0, 100)
-        self.background_task_progress.setValue(0)
-        self.background_task_label.setText(translate("idle"))
-        visible_count = sum(1 for i in range(self.creator_post_list.count()) if not self.creator_post_list.item(i).isHidden())
-        self.append_log_to_console(translate("log_debug", f"Check ALL toggle finished, checked posts: {len(self.posts_to_download)}, visible posts: {visible_count}"), "INFO")
+        is_checked = state == 2  # Qt.CheckState.Checked
+        self.creator_post_model.set_checked(visible_post_ids, is_checked)
+        self.update_checked_posts()
+        self.update_check_all_state()
+        self.append_log_to_console(translate("log_debug", f"Check ALL toggled to {is_checked} for {len(visible_post_ids)} visible posts"), "INFO")
 
     def update_checked_posts(self):
-        self.posts_to_download = []
-        seen_ids = set()
-        if not self.current_creator_url:
-            self.append_log_to_console(translate("log_warning", "No current creator URL set."), "WARNING")
-            return
-        current_creator_posts = {post_id for _, (post_id, _) in self.all_files_map.get(self.current_creator_url, [])}
-        for post_id, is_checked in self.checked_urls.items():
-            if is_checked and post_id in current_creator_posts and post_id not in seen_ids:
-                self.posts_to_download.append(post_id)
-                seen_ids.add(post_id)
-        if not self.posts_to_download and current_creator_posts:
-            self.append_log_to_console(translate("log_warning", f"No posts selected for {self.current_creator_url}. Checked URLs: {self.checked_urls}"), "WARNING")
-        self.creator_post_count_label.setText(translate("posts_count", len(self.posts_to_download)))
-        self.append_log_to_console(
-            translate("log_debug", f"Updated checked posts count: {len(self.posts_to_download)}, checked_urls: {len(self.checked_urls)}, all_detected: {len(self.all_detected_posts)}, selected IDs: {self.posts_to_download}"),
-            "INFO"
-        )
+        checked_count = self.creator_post_model.checked_count
+        self.creator_post_count_label.setText(translate("posts_count", checked_count))
+        self.append_log_to_console(translate("log_debug", f"Updated checked posts count: {checked_count}, all_detected: {len(self.all_detected_posts)}"), "INFO")
 
     def filter_items(self):
-        if hasattr(self, 'filter_thread') and self.filter_thread is not None and self.filter_thread.isRunning():
-            self.append_log_to_console(translate("log_warning", "Filtering already in progress. Please wait."), "WARNING")
-            return
-        self.background_task_label.setText(translate("filtering_posts"))
-        self.background_task_progress.setRange(0, 0)
-        self.filter_thread = FilterThread(self.all_detected_posts, self.checked_urls, self.creator_search_input.text())
-        self.filter_thread.finished.connect(self.on_filter_finished)
-        self.filter_thread.log.connect(self.append_log_to_console)
-        self.filter_thread.finished.connect(self.cleanup_filter_thread)
-        self.active_threads.append(self.filter_thread)
-        self.filter_thread.start()
-
-    def on_filter_finished(self, filtered_items):
-        self.creator_post_list.clear()
-        self.previous_selected_widget = None
-        self.post_url_map = {}
-        for post_title, post_id, thumbnail_url, is_checked in filtered_items:
-            unique_title = f"{post_title} (ID: {post_id})"
-            self.post_url_map[unique_title] = (post_id, thumbnail_url)
-            self.add_list_item(unique_title, thumbnail_url, is_checked)
-
+        self.search_timer.stop()
+        if self.title_index is None:
+            rows = []
+        else:
+            rows = [self.post_rows[position] for position in self.title_index.search(self.creator_search_input.text())]
+        self.creator_post_model.update_rows(rows)
         self.update_check_all_state()
         self.update_checked_posts()
-        self.background_task_progress.setRange(0, 100)
-        self.background_task_progress.setValue(0)
-        self.background_task_label.setText(translate("idle"))
-        self.append_log_to_console(translate("log_debug", f"Filtering completed, displayed {self.creator_post_list.count()} posts"), "INFO")
-
-    def cleanup_filter_thread(self):
-        """Clean up the filter thread after it finishes."""
-        if self.filter_thread in self.active_threads:
-            self.active_threads.remove(self.filter_thread)
-        self.filter_thread.deleteLater()
-        self.filter_thread = None
-                
-    def add_list_item(self, text, url, is_checked):
-        item = QListWidgetItem()
-        item.setData(Qt.UserRole, url)  
-        post_id = self.post_url_map[text][0]
-        item.setData(Qt.UserRole + 1, post_id) 
-        widget = QWidget()
-        layout = QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-
-        check_box = QCheckBox()
-        check_box.setStyleSheet("color: white;")
-        check_box.setChecked(is_checked)
-        check_box.clicked.connect(lambda: self.toggle_checkbox_state(text))
-        layout.addWidget(check_box)
-
-        label = QLabel(text)
-        label.setStyleSheet("color: white;")
-        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        layout.addWidget(label, stretch=1)
-
-        widget.setLayout(layout)
-        item.setSizeHint(widget.sizeHint())
-        self.creator_post_list.addItem(item)
-        self.creator_post_list.setItemWidget(item, widget)
-        widget.check_box = check_box
-        widget.label = label
-        widget.setStyleSheet("background-color: #2A3B5A; border-radius: 5px;")
-
-    def toggle_checkbox_state(self, post_title):
-        self.background_task_label.setText(translate("toggling_checkbox"))
-        self.background_task_progress.setRange(0, 0)
-        post_id, thumbnail_url = self.post_url_map.get(post_title, (None, None))
-        if not post_id:
-            self.append_log_to_console(translate("log_error", f"No post ID found for title: {post_title}"), "ERROR")
-            self.background_task_progress.setRange(0, 100)
-            self.background_task_progress.setValue(0)
-            self.background_task_label.setText(translate("idle"))
-            return
-        current_state = self.checked_urls.get(post_id, False)
-        new_state = not current_state
-        self.checked_urls[post_id] = new_state
-        widget = self.get_widget_for_post_title(post_title)
-        if widget:
-            widget.check_box.blockSignals(True)
-            widget.check_box.setChecked(new_state)
-            widget.check_box.blockSignals(False)
+        self.append_log_to_console(translate("log_debug", f"Filtering completed, displayed {len(rows)} posts"), "INFO")
+
+    def on_post_check_toggled(self, post_id, checked):
         self.update_checked_posts()
         self.update_check_all_state()
-        self.append_log_to_console(translate("log_debug", f"Checkbox toggled for post {post_title} (ID: {post_id}) to {new_state}"), "INFO")
-        self.background_task_progress.setRange(0, 100)
-        self.background_task_progress.setValue(0)
-        self.background_task_label.setText(translate("idle"))
-
-    def get_widget_for_post_title(self, post_title):
-        for i in range(self.creator_post_list.count()):
-            item = self.creator_post_list.item(i)
-            widget = self.creator_post_list.itemWidget(item)
-            if widget and widget.label.text() == post_title:
-                return widget
-        return None
+        self.append_log_to_console(translate("log_debug", f"Checkbox toggled for post ID {post_id} to {checked}"), "INFO")
 
     def update_check_all_state(self):
-        all_visible_checked = all(
-            self.creator_post_list.itemWidget(self.creator_post_list.item(i)).check_box.isChecked()
-            for i in range(self.creator_post_list.count()) if not self.creator_post_list.item(i).isHidden()
-        ) and self.creator_post_list.count() > 0
+        all_visible_checked = self.creator_post_model.all_checked()
         self.creator_check_all.blockSignals(True)
         self.creator_check_all.setChecked(all_visible_checked)
         self.creator_check_all.blockSignals(False)
         self.append_log_to_console(translate("log_debug", f"Check ALL state updated to {all_visible_checked}"), "INFO")
 
     def update_current_preview_url(self, current, previous):
-        if current:
-            widget = self.creator_post_list.itemWidget(current)
-            if widget:
-                self.current_preview_url = current.data(Qt.UserRole)
-                self.creator_view_button.setEnabled(True)
-            else:
-                self.current_preview_url = None
-                self.creator_view_button.setEnabled(False)
-        else:
-            self.current_preview_url = None
-            self.creator_view_button.setEnabled(False)
+        self.current_preview_url = current.data(UrlRole) if current.isValid() else None
+        self.creator_view_button.setEnabled(self.current_preview_url is not None)
+        self.prefetch_neighbour_previews(current)
+
+    def prefetch_neighbour_previews(self, current):
+        if self.downloading or not current.isValid():
+            preview_service().cancel_prefetch()
+            return
+        rows = [current.row() + offset for distance in range(1, PREFETCH_NEIGHBOURS + 1) for offset in (distance, -distance)]
+        urls = [self.creator_post_model.index(row).data(UrlRole) for row in rows if 0 <= row < self.creator_post_model.rowCount()]
+        urls = [url for url in urls if url and url.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
+        preview_service().prefetch(urls, self.cache_dir, HEADERS)
 
     def view_current_item(self):
         if self.current_preview_url:
@@ -1802,36 +1986,23 @@ class CreatorDownloaderTab(QWidget):
             else:
                 self.append_log_to_console(translate("log_warning", f"Viewing not supported for {self.current_preview_url}"), "WARNING")
 
-    def handle_item_click(self, item):
-        if item:
-            if self.previous_selected_widget:
-                self.previous_selected_widget.setStyleSheet("background-color: #2A3B5A; border-radius: 5px;")
-            widget = self.creator_post_list.itemWidget(item)
-            if widget:
-                widget.setStyleSheet("background-color: #4A5B7A; border-radius: 5px;")
-                self.previous_selected_widget = widget
-                self.current_preview_url = item.data(Qt.UserRole)
-                self.creator_view_button.setEnabled(True)
-            else:
-                self.current_preview_url = None
-                self.creator_view_button.setEnabled(False)
-        else:
-            if self.previous_selected_widget:
-                self.previous_selected_widget.setStyleSheet("background-color: #2A3B5A; border-radius: 5px;")
-                self.previous_selected_widget = None
-            self.current_preview_url = None
-            self.creator_view_button.setEnabled(False)
+    def handle_item_click(self, index):
+        self.update_current_preview_url(index, None)
 
     def append_log_to_console(self, message, level="INFO"):
-        color = {"INFO": "green", "WARNING": "yellow", "ERROR": "red"}.get(level, "white")
-        self.creator_console.append(f"<span style='color:{color}'>{message}</span>")
+        self.creator_console.append(message, level)
+
+    def append_log_batch(self, lines):
+        for message, level in lines:
+            self.creator_console.append(message, level)
 
 class CancellationThread(QThread):
     finished = pyqtSignal()
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
 
     def __init__(self, threads):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.threads = threads
         self.is_running = True
 
@@ -1841,15 +2012,15 @@ class CancellationThread(QThread):
     def run(self):
         if not self.is_running:
             return
-        self.log.emit(translate("log_info", "Starting cancellation of active threads"), "INFO")
+        self.logger.info("Starting cancellation of active threads")
         # Signal all threads to stop
         for thread in self.threads:
             if hasattr(thread, 'stop'):
                 try:
                     thread.stop()
-                    self.log.emit(translate("log_debug", f"Signaled stop for thread {thread.__class__.__name__}"), "INFO")
+                    self.logger.debug("Signaled stop for thread {0}", thread.__class__.__name__)
                 except RuntimeError:
-                    self.log.emit(translate("log_warning", f"Thread {thread.__class__.__name__} already deleted"), "WARNING")
+                    self.logger.warning("Thread {0} already deleted", thread.__class__.__name__)
         
         # Wait for threads to exit gracefully
         timeout = 5.0  # Maximum wait time in seconds
@@ -1858,23 +2029,24 @@ class CancellationThread(QThread):
             try:
                 time.sleep(0.1)  # Short sleep to avoid freezing
             except RuntimeError:
-                self.log.emit(translate("log_warning", f"A thread was deleted during cancellation wait"), "WARNING")
+                self.logger.warning("A thread was deleted during cancellation wait")
         
         # Log any threads that are still running
         for thread in self.threads:
             try:
                 if hasattr(thread, 'isRunning') and thread.isRunning():
-                    self.log.emit(translate("log_warning", f"Thread {thread.__class__.__name__} did not exit gracefully, attempting termination"), "WARNING")
+                    self.logger.warning("Thread {0} did not exit gracefully, attempting termination", thread.__class__.__name__)
                     try:
                         thread.terminate()
                         thread.wait()
-                        self.log.emit(translate("log_info", f"Terminated thread: {thread.__class__.__name__}"), "INFO")
+                        self.logger.info("Terminated thread: {0}", thread.__class__.__name__)
                     except RuntimeError:
-                        self.log.emit(translate("log_warning", f"Thread {thread.__class__.__name__} already deleted during termination"), "WARNING")
+                        self.logger.warning("Thread {0} already deleted during termination", thread.__class__.__name__)
             except RuntimeError:
-                self.log.emit(translate("log_warning", f"Thread {thread.__class__.__name__} already deleted"), "WARNING")
+                self.logger.warning("Thread {0} already deleted", thread.__class__.__name__)
         
-        self.log.emit(translate("log_info", "Cancellation process completed"), "INFO")
+        self.logger.info("Cancellation process completed")
         if self.is_running:
+            self.logger.flush()
             self.finished.emit()   
             
@@ -0,0 +1,535 @@
+import asyncio
+import errno
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Files at least this large are fetched as several byte ranges over parallel connections
+SEGMENT_THRESHOLD = 32 * 1024 * 1024
+SEGMENT_COUNT = 4
+# Progress of a preallocated file is written to its sidecar after every this many bytes
+CHECKPOINT_INTERVAL = 4 * 1024 * 1024
+# Network chunks are gathered into blocks of this size before they are handed to the disk writer
+WRITE_BLOCK_SIZE = 1024 * 1024
+# Blocks waiting for or being written across all downloads; once reached, network readers pause
+MAX_PENDING_WRITES = 16
+RECEIVE_CHUNK_SIZE = 256 * 1024
+RECEIVE_BUFFER_SIZE = 1024 * 1024
+# Algorithms usable for downloaded file hashes; entries written before this was configurable are md5
+HASH_ALGORITHMS = {
+    'md5': hashlib.md5,
+    'sha256': hashlib.sha256,
+    'blake2b': hashlib.blake2b,
+}
+DEFAULT_HASH_ALGORITHM = 'md5'
+HASH_BUFFER_SIZE = 1024 * 1024
+# How a file whose content is already on disk is materialized at another path
+STORAGE_MODES = ('copy', 'hardlink', 'reflink')
+FICLONE = 0x40049409  # Linux ioctl that shares extents between files on btrfs/xfs
+# Data server paths name files by their content: /xx/yy/<sha256>.<ext>
+DATA_PATH_RE = re.compile(r'/([0-9a-f]{2})/([0-9a-f]{2})/(\1\2[0-9a-f]{60})(?:\.[^/]*)?$')
+CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)')
+UNSATISFIED_RANGE_RE = re.compile(r'bytes\s+\*/(\d+)')
+
+
+def new_hash(algorithm=DEFAULT_HASH_ALGORITHM):
+    return HASH_ALGORITHMS[algorithm]()
+
+
+def update_from_file(hasher, path, limit=None):
+    """Feed the first `limit` bytes of a file (or all of it) into `hasher` through one reused buffer."""
+    buffer = memoryview(bytearray(HASH_BUFFER_SIZE))
+    remaining = limit
+    with open(path, 'rb', buffering=0) as f:
+        while remaining is None or remaining > 0:
+            view = buffer if remaining is None else buffer[:min(HASH_BUFFER_SIZE, remaining)]
+            size = f.readinto(view)
+            if not size:
+                break
+            hasher.update(view[:size])
+            if remaining is not None:
+                remaining -= size
+    return hasher
+
+
+def hash_file(path, algorithm=DEFAULT_HASH_ALGORITHM):
+    return update_from_file(new_hash(algorithm), path).hexdigest()
+
+
+def content_hash_from_url(url):
+    """Return the SHA-256 a data URL is named after, or None for URLs that do not follow the data path layout."""
+    if not url:
+        return None
+    match = DATA_PATH_RE.search(urlsplit(url).path.lower())
+    return match.group(3) if match else None
+
+
+def reflink_file(source, target):
+    """Clone `source` into `target` sharing its blocks. Raises OSError where the filesystem cannot do that."""
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        try:
+            import fcntl
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+        if not hasattr(os, 'copy_file_range'):
+            raise OSError("Reflinks are not supported on this platform")
+        # copy_file_range shares extents on filesystems that support it and copies inside the kernel elsewhere
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                raise OSError("copy_file_range stopped before the end of the file")
+            remaining -= copied
+
+
+def preallocate(f, size):
+    """Reserve `size` bytes on disk for the open file `f` so it is laid out contiguously.
+
+    Running out of space raises OSError (ENOSPC) right away instead of halfway through the download. Where
+    posix_fallocate is missing or unsupported by the filesystem the file is only extended, which leaves it sparse.
+    """
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError as e:
+            if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL, errno.ENOSYS):
+                raise
+    f.truncate(size)
+
+
+def sync_directory(path):
+    """Flush a rename inside `path` to disk. A no-op where directories cannot be opened (Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def place_existing_file(source, target, mode='copy'):
+    """Make `target` hold the bytes of an already downloaded file and return the storage mode actually used.
+
+    Hardlinks and reflinks fall back to a plain copy when the filesystem refuses them (different volumes, FAT,
+    no reflink support). The result is moved into place so a half-written file is never visible.
+    """
+    temp_path = target + '.copying'
+    if os.path.lexists(temp_path):
+        os.remove(temp_path)
+    used = 'copy'
+    try:
+        if mode == 'hardlink':
+            os.link(source, temp_path)
+            used = 'hardlink'
+        elif mode == 'reflink':
+            reflink_file(source, temp_path)
+            used = 'reflink'
+    except OSError:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+    if used == 'copy':
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, target)
+    return used
+
+
+class ContentClaims:
+    """Content hashes being downloaded right now, so identical files queued together are fetched only once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.claimed = set()
+
+    def claim(self, content_sha256):
+        """Return True if the caller should download the content, False if someone else already is."""
+        with self.lock:
+            if content_sha256 in self.claimed:
+                return False
+            self.claimed.add(content_sha256)
+            return True
+
+    def release(self, content_sha256):
+        with self.lock:
+            self.claimed.discard(content_sha256)
+
+
+content_claims = ContentClaims()
+
+
+class DiskWriter:
+    """Worker threads that do the file I/O of the asyncio download path, so a slow disk never blocks the sockets.
+
+    Each download writes through its own WriteSink. At most MAX_PENDING_WRITES blocks are in flight across all
+    sinks; past that, `await sink.write()` waits, which in turn stops reading from the network.
+    Must be created inside the event loop that uses it.
+    """
+
+    def __init__(self, workers=2, max_pending=MAX_PENDING_WRITES):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="DiskWriter")
+        self.slots = asyncio.Semaphore(max_pending)
+
+    def sink(self, write):
+        """Return a WriteSink that hands coalesced blocks to `write(block)` on a writer thread."""
+        return WriteSink(self, write)
+
+    async def run(self, fn, *args):
+        """Run any other blocking file operation (hashing, syncing, renaming) on a writer thread."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+class WriteSink:
+    """Ordered, buffered writes of one download. Errors from the writer thread surface on the next write or drain."""
+
+    def __init__(self, writer, write):
+        self.writer = writer
+        self.write_block = write
+        self.buffer = bytearray()
+        self.pending = None
+
+    async def write(self, chunk):
+        self.buffer += chunk
+        if len(self.buffer) >= WRITE_BLOCK_SIZE:
+            await self.submit()
+
+    async def submit(self):
+        block, self.buffer = self.buffer, bytearray()
+        # Blocks of one file are written one after another, so wait for the previous one first
+        await self.wait_pending()
+        await self.writer.slots.acquire()
+        try:
+            self.pending = asyncio.get_running_loop().run_in_executor(self.writer.executor, self.write_block, block)
+        except BaseException:
+            self.writer.slots.release()
+            raise
+        self.pending.add_done_callback(lambda _: self.writer.slots.release())
+
+    async def wait_pending(self):
+        pending, self.pending = self.pending, None
+        if pending is not None:
+            await pending
+
+    async def drain(self):
+        """Write out everything buffered so far and wait until it is on its way to disk."""
+        if self.buffer:
+            await self.submit()
+        await self.wait_pending()
+
+
+class DirectoryCache:
+    """One os.scandir listing per folder, so checking many files of the same post folder does not stat each path.
+
+    Also remembers the folders it created so os.makedirs runs once per folder instead of once per file.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.listings = {}  # Map folder to {name: DirEntry or stat result}
+        self.created = set()
+
+    def makedirs(self, folder):
+        with self.lock:
+            if folder in self.created:
+                return
+        os.makedirs(folder, exist_ok=True)
+        with self.lock:
+            self.created.add(folder)
+
+    def listing(self, folder):
+        with self.lock:
+            listing = self.listings.get(folder)
+        if listing is None:
+            listing = {}
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        listing[entry.name] = entry
+            except OSError:
+                pass
+            with self.lock:
+                listing = self.listings.setdefault(folder, listing)
+        return listing
+
+    def stat(self, path):
+        """Return the stat result of a regular file, or None if there is no file at `path`."""
+        folder, name = os.path.split(os.path.abspath(path))
+        entry = self.listing(folder).get(name)
+        if entry is None:
+            return None
+        if isinstance(entry, os.DirEntry):
+            try:
+                if not entry.is_file():
+                    return None
+                # DirEntry caches this; on Windows it even comes with the listing for free
+                return entry.stat()
+            except OSError:
+                return None
+        return entry
+
+    def update(self, path):
+        """Refresh one file after it was written, without listing its folder again."""
+        folder, name = os.path.split(os.path.abspath(path))
+        with self.lock:
+            listing = self.listings.get(folder)
+            if listing is None:
+                return
+            try:
+                listing[name] = os.stat(path)
+            except OSError:
+                listing.pop(name, None)
+
+
+class ContentMismatch(ValueError):
+    """A finished download does not hash to the content hash its URL promised."""
+
+
+class ResumeMismatch(Exception):
+    """The server answered a resume request with data that does not continue the partial file."""
+
+
+def parse_content_range(value):
+    """Return (start, end, total) from a Content-Range header. total is None when the server does not know it."""
+    match = CONTENT_RANGE_RE.match(value or '')
+    if not match:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), None if total == '*' else int(total)
+
+
+class PartialDownload:
+    """A download in progress, kept as `<file>.part` next to its target until it is complete.
+
+    A small JSON sidecar remembers the ETag/Last-Modified and size the partial data belongs to, so an interrupted
+    download can continue with a Range request on the next attempt or the next run. Large files can instead be
+    preallocated and split into segments, each with its own progress, that are fetched concurrently.
+
+    Once the size is known the part file is preallocated, so its length no longer tells how much was written;
+    from then on the progress lives in the sidecar as segments, a single one for a file streamed in one piece.
+    """
+
+    def __init__(self, full_path):
+        self.full_path = full_path
+        self.part_path = full_path + '.part'
+        self.meta_path = full_path + '.part.json'
+        self.etag = None
+        self.last_modified = None
+        self.total_size = None
+        self.segments = None  # List of [start, end, written] when the file is fetched as byte ranges
+        self.unsaved = 0  # Bytes written since the sidecar was last saved
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.part_path):
+            self.remove_meta()
+            return
+        try:
+            with open(self.meta_path, 'r') as f:
+                meta = json.load(f)
+            self.etag = meta.get('etag')
+            self.last_modified = meta.get('last_modified')
+            self.total_size = meta.get('total_size')
+            self.segments = meta.get('segments')
+        except (OSError, ValueError):
+            # Without a validator we cannot tell whether the partial data is still good
+            self.reset()
+
+    def save(self):
+        with self.lock:
+            meta = {"etag": self.etag, "last_modified": self.last_modified, "total_size": self.total_size,
+                    "segments": self.segments}
+            with open(self.meta_path, 'w') as f:
+                json.dump(meta, f)
+
+    def remove_meta(self):
+        try:
+            os.remove(self.meta_path)
+        except FileNotFoundError:
+            pass
+
+    def reset(self):
+        """Throw the partial data away so the next attempt starts from zero."""
+        for path in (self.part_path, self.meta_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.etag = self.last_modified = self.total_size = self.segments = None
+
+    @property
+    def offset(self):
+        try:
+            return os.path.getsize(self.part_path)
+        except OSError:
+            return 0
+
+    @property
+    def downloaded(self):
+        if self.segments:
+            return sum(written for _, _, written in self.segments)
+        return self.offset
+
+    def range_headers(self):
+        """Headers that ask the server to continue the partial file, or nothing if there is nothing to resume."""
+        offset = self.offset
+        validator = self.etag or self.last_modified
+        if offset <= 0 or not (validator or self.total_size):
+            return {}
+        headers = {"Range": f"bytes={offset}-"}
+        if validator:
+            # The server sends the full body instead of a range if the file changed since the partial was written
+            headers["If-Range"] = validator
+        return headers
+
+    def start(self, status, headers):
+        """Check a response against the partial file and return the offset its body starts at.
+
+        Returns None when a 416 shows the partial file is already complete. Raises ResumeMismatch when the
+        response does not continue the partial data; the caller should reset() and request the full file.
+        """
+        offset = self.offset
+        etag = headers.get('ETag')
+        if etag and etag.startswith('W/'):
+            # Weak validators are not allowed in If-Range
+            etag = None
+        if status == 416:
+            match = UNSATISFIED_RANGE_RE.match(headers.get('Content-Range') or '')
+            if match and offset > 0 and int(match.group(1)) == offset and self.total_size in (None, offset):
+                return None
+            raise ResumeMismatch(f"Range not satisfiable at offset {offset}")
+        if status == 206:
+            content_range = parse_content_range(headers.get('Content-Range'))
+            if content_range is None or content_range[0] != offset:
+                raise ResumeMismatch(f"Server resumed at {content_range[0] if content_range else 'unknown offset'} instead of {offset}")
+            total = content_range[2]
+            if self.total_size and total and total != self.total_size:
+                raise ResumeMismatch(f"Remote size changed from {self.total_size} to {total}")
+            if self.etag and etag and etag != self.etag:
+                raise ResumeMismatch("Remote file changed since the partial download")
+            self.total_size = total or self.total_size
+            self.etag = etag or self.etag
+            self.last_modified = headers.get('Last-Modified') or self.last_modified
+        else:
+            # A plain 200 means the server ignored the range (or If-Range did not match): start over
+            if offset > 0:
+                with open(self.part_path, 'wb'):
+                    pass
+            offset = 0
+            content_length = headers.get('Content-Length')
+            self.total_size = int(content_length) if content_length and content_length.isdigit() else None
+            self.etag = etag
+            self.last_modified = headers.get('Last-Modified')
+        self.save()
+        return offset
+
+    def can_segment(self, headers):
+        """Whether the file just started from zero is worth splitting into parallel byte ranges."""
+        return (self.total_size is not None and self.total_size >= SEGMENT_THRESHOLD
+                and headers.get('Accept-Ranges', '').lower() == 'bytes')
+
+    def plan_segments(self, count=SEGMENT_COUNT):
+        """Preallocate the partial file and split it into `count` byte ranges.
+
+        Raises OSError when the disk cannot hold the file; the partial download is reset first.
+        """
+        step = -(-self.total_size // count)
+        self.segments = [[start, min(self.total_size, start + step) - 1, 0] for start in range(0, self.total_size, step)]
+        try:
+            with open(self.part_path, 'wb') as f:
+                preallocate(f, self.total_size)
+        except OSError:
+            self.reset()
+            raise
+        self.save()
+
+    def segment_headers(self, index):
+        start, end, written = self.segments[index]
+        headers = {"Range": f"bytes={start + written}-{end}"}
+        validator = self.etag or self.last_modified
+        if validator:
+            headers["If-Range"] = validator
+        return headers
+
+    def check_segment(self, index, status, headers):
+        """Raise ResumeMismatch unless the response is exactly the remaining range of segment `index`."""
+        start, end, written = self.segments[index]
+        content_range = parse_content_range(headers.get('Content-Range')) if status == 206 else None
+        if content_range is None or content_range[0] != start + written:
+            raise ResumeMismatch(f"Server did not return bytes {start + written}-{end} (status {status})")
+        if content_range[2] is not None and content_range[2] != self.total_size:
+            raise ResumeMismatch(f"Remote size changed from {self.total_size} to {content_range[2]}")
+        etag = headers.get('ETag')
+        if self.etag and etag and not etag.startswith('W/') and etag != self.etag:
+            raise ResumeMismatch("Remote file changed since the partial download")
+
+    def segment_done(self, index):
+        start, end, written = self.segments[index]
+        return start + written > end
+
+    def write(self, f, index, chunk):
+        """Write `chunk` at the current position of segment `index` through `f` and return the bytes written.
+
+        Bytes beyond the end of the segment are dropped. The sidecar is saved every CHECKPOINT_INTERVAL bytes.
+        """
+        with self.lock:
+            start, end, written = self.segments[index]
+            size = min(len(chunk), end - start + 1 - written)
+        f.write(chunk[:size] if size < len(chunk) else chunk)
+        if len(self.segments) > 1:
+            # A checkpoint triggered by another segment saves this one's progress too, so the data must be out of
+            # our buffer before the progress is counted
+            f.flush()
+        with self.lock:
+            self.segments[index][2] = written + size
+            self.unsaved += size
+            due = self.unsaved >= CHECKPOINT_INTERVAL
+            if due:
+                self.unsaved = 0
+        if due:
+            self.checkpoint(f)
+        return size
+
+    def checkpoint(self, f):
+        """Save segment progress, flushing `f` first so the sidecar never runs ahead of the data on disk."""
+        f.flush()
+        self.save()
+
+    def open(self, offset):
+        """Open the partial file for writing at `offset`."""
+        if self.segments:
+            # Preallocated: keep the reserved space and write in place
+            f = open(self.part_path, 'r+b')
+            f.seek(offset)
+            return f
+        if offset > 0:
+            f = open(self.part_path, 'r+b')
+            f.seek(offset)
+            f.truncate()
+            return f
+        return open(self.part_path, 'wb')
+
+    def finish(self):
+        """Move the completed partial file into place.
+
+        The data is synced before the rename and the directory after it, so a crash leaves either the old state
+        or the complete file under its final name, never a truncated one.
+        """
+        with open(self.part_path, 'r+b') as f:
+            os.fsync(f.fileno())
+        os.replace(self.part_path, self.full_path)
+        sync_directory(os.path.dirname(os.path.abspath(self.full_path)))
+        self.remove_meta()
@@ -22,7 +22,7 @@ class KDLanguage:
                 "chinese-simplified": "尝试 {1} 次后下载 {0} 失败: {2}"
             },
             "retry_countdown": {
-                "english": "Trying again in {0}...",
+                "english": "Trying again in {0}s...",
                 "japanese": "{0}秒後に再試行します...",
                 "korean": "{0}초 후 다시 시도...",
                 "chinese-simplified": "{0}秒后重试..."
@@ -351,6 +351,54 @@ class KDLanguage:
                 "korean": "동시 다운로드:",
                 "chinese-simplified": "并行下载数:"
             },
+            "storage_mode": {
+                "english": "Identical Files:",
+                "japanese": "同一ファイル:",
+                "korean": "동일한 파일:",
+                "chinese-simplified": "相同文件:"
+            },
+            "storage_mode_copy": {
+                "english": "Separate copies",
+                "japanese": "個別にコピー",
+                "korean": "개별 복사본",
+                "chinese-simplified": "单独副本"
+            },
+            "storage_mode_hardlink": {
+                "english": "Hard links (one copy on disk)",
+                "japanese": "ハードリンク（ディスク上は1つ）",
+                "korean": "하드 링크 (디스크에 한 개)",
+                "chinese-simplified": "硬链接（磁盘上仅一份）"
+            },
+            "storage_mode_reflink": {
+                "english": "Reflinks (copy-on-write, where supported)",
+                "japanese": "リフリンク（対応環境でコピーオンライト）",
+                "korean": "리플링크 (지원 시 기록 중 복사)",
+                "chinese-simplified": "引用链接（支持时写时复制）"
+            },
+            "verify_existing_files": {
+                "english": "Re-hash Existing Files Before Skipping:",
+                "japanese": "スキップ前に既存ファイルを再ハッシュ:",
+                "korean": "건너뛰기 전에 기존 파일 다시 해시:",
+                "chinese-simplified": "跳过前重新校验已有文件:"
+            },
+            "log_level_setting": {
+                "english": "Log Detail:",
+                "japanese": "ログの詳細度:",
+                "korean": "로그 상세 수준:",
+                "chinese-simplified": "日志详细程度:"
+            },
+            "preview_cache_limit": {
+                "english": "Preview Cache Limit:",
+                "japanese": "プレビューキャッシュの上限:",
+                "korean": "미리보기 캐시 한도:",
+                "chinese-simplified": "预览缓存上限:"
+            },
+            "preview_cache_usage": {
+                "english": "{0} in use",
+                "japanese": "使用中: {0}",
+                "korean": "사용 중: {0}",
+                "chinese-simplified": "已使用 {0}"
+            },
             "update_settings": {
                 "english": "Update Settings",
                 "japanese": "更新設定",
@@ -575,6 +623,48 @@ class KDLanguage:
                 "korean": "다운로드할 파일 준비 중...",
                 "chinese-simplified": "准备下载文件..."
             },
+            "checking_file_sizes": {
+                "english": "Checking file sizes...",
+                "japanese": "ファイルサイズを確認中...",
+                "korean": "파일 크기 확인 중...",
+                "chinese-simplified": "正在检查文件大小..."
+            },
+            "download_plan_summary": {
+                "english": "{0} files to download ({1}), {2} already on disk, {3} of unknown size. Estimated time: {4}",
+                "japanese": "ダウンロード対象 {0} ファイル ({1})、{2} ファイルはディスク上に存在、{3} ファイルはサイズ不明。推定時間: {4}",
+                "korean": "다운로드할 파일 {0}개 ({1}), 이미 디스크에 있는 파일 {2}개, 크기를 알 수 없는 파일 {3}개. 예상 시간: {4}",
+                "chinese-simplified": "待下载 {0} 个文件 ({1})，{2} 个已在磁盘上，{3} 个大小未知。预计时间: {4}"
+            },
+            "unknown_duration": {
+                "english": "unknown",
+                "japanese": "不明",
+                "korean": "알 수 없음",
+                "chinese-simplified": "未知"
+            },
+            "not_enough_space_title": {
+                "english": "Not Enough Disk Space",
+                "japanese": "ディスク容量不足",
+                "korean": "디스크 공간 부족",
+                "chinese-simplified": "磁盘空间不足"
+            },
+            "not_enough_space_message": {
+                "english": "The selected files need {0}, but only {1} is free on the volume of {2}.\n\n{3} of {4} files fit. Download only those?",
+                "japanese": "選択したファイルには {0} が必要ですが、{2} のボリュームの空き容量は {1} しかありません。\n\n{4} ファイル中 {3} ファイルが収まります。それらだけをダウンロードしますか？",
+                "korean": "선택한 파일에는 {0}이(가) 필요하지만 {2} 볼륨의 여유 공간은 {1}뿐입니다.\n\n{4}개 중 {3}개 파일이 들어갑니다. 해당 파일만 다운로드하시겠습니까?",
+                "chinese-simplified": "所选文件需要 {0}，但 {2} 所在卷仅剩 {1} 可用空间。\n\n{4} 个文件中有 {3} 个可以容纳。仅下载这些文件吗？"
+            },
+            "download_what_fits": {
+                "english": "Download What Fits",
+                "japanese": "収まる分をダウンロード",
+                "korean": "들어가는 파일만 다운로드",
+                "chinese-simplified": "下载可容纳的文件"
+            },
+            "download_refused_disk_space": {
+                "english": "Download skipped: not enough free space in {0}",
+                "japanese": "ダウンロードをスキップしました: {0} の空き容量が不足しています",
+                "korean": "다운로드 건너뜀: {0}의 여유 공간이 부족합니다",
+                "chinese-simplified": "已跳过下载: {0} 的可用空间不足"
+            },
             "updating_checkboxes": {
                 "english": "Updating checkboxes...",
                 "japanese": "チェックボックスを更新中...",
@@ -631,6 +721,36 @@ class KDLanguage:
                 "korean": "[오류] {0}",
                 "chinese-simplified": "[错误] {0}"
             },
+            "log_level_filter": {
+                "english": "Show:",
+                "japanese": "表示:",
+                "korean": "표시:",
+                "chinese-simplified": "显示:"
+            },
+            "log_level_debug": {
+                "english": "Everything",
+                "japanese": "すべて",
+                "korean": "전체",
+                "chinese-simplified": "全部"
+            },
+            "log_level_info": {
+                "english": "Info and Above",
+                "japanese": "情報以上",
+                "korean": "정보 이상",
+                "chinese-simplified": "消息及以上"
+            },
+            "log_level_warning": {
+                "english": "Warnings and Errors",
+                "japanese": "警告とエラー",
+                "korean": "경고 및 오류",
+                "chinese-simplified": "警告和错误"
+            },
+            "log_level_error": {
+                "english": "Errors Only",
+                "japanese": "エラーのみ",
+                "korean": "오류만",
+                "chinese-simplified": "仅错误"
+            },
             "log_debug": {
                 "english": "[DEBUG] {0}",
                 "japanese": "[デバッグ] {0}",
@@ -1124,7 +1244,7 @@ class KDLanguage:
                            "- Files are named based on their original URLs, with any special characters (e.g., '/') replaced with underscores to ensure compatibility with your filesystem.<br><br>"
                            "<b>2.7 Additional Features</b><br>"
                            "- <b>Concurrent Downloads</b>: The application supports downloading multiple files simultaneously, with the number of concurrent downloads set in the Settings tab (default is 10, adjustable between 1-10).<br>"
-                           "- <b>File Deduplication</b>: The application uses URL hashes to detect and skip previously downloaded files, preventing duplicates. Hash data is stored in the 'Other Files' directory as 'file_hashes.json'.<br>"
+                           "- <b>File Deduplication</b>: The application uses URL hashes to detect and skip previously downloaded files, preventing duplicates. Hash data is stored in the 'Other Files' directory as 'downloads.sqlite3'.<br>"
                            "- <b>Image Caching</b>: When previewing images, they are cached in the 'Cache' directory to speed up future previews of the same image.<br>"
                            "- <b>Logging</b>: The console provides detailed logs of all operations, including file detection, download progress, and errors. This is useful for debugging issues.",
                 "japanese": "投稿ダウンローダータブは、特定のKemono.su投稿からコンテンツをダウンロードするために設計されています。複数の投稿をキューに追加し、その内容を表示し、ダウンロードするファイルを選択し、ダウンロードの進捗を監視できます。以下に、このタブを効果的に使用するための詳細な手順を示します：<br><br>"
@@ -1172,7 +1292,7 @@ class KDLanguage:
                             "- ファイル名は元のURLに基づいて命名され、ファイルシステムとの互換性を確保するために特殊文字（例: 「/」）はアンダースコアに置き換えられます。<br><br>"
                             "<b>2.7 追加機能</b><br>"
                             "- <b>同時ダウンロード</b>：アプリケーションは複数のファイルを同時にダウンロードでき、同時ダウンロードの数は設定タブで設定されます（デフォルトは10、1-10の間で調整可能）。<br>"
-                            "- <b>ファイルの重複排除</b>：アプリケーションはURLハッシュを使用して以前にダウンロードされたファイルを検出し、重複を防ぎます。ハッシュデータは「その他のファイル」ディレクトリ内の「file_hashes.json」に保存されます。<br>"
+                            "- <b>ファイルの重複排除</b>：アプリケーションはURLハッシュを使用して以前にダウンロードされたファイルを検出し、重複を防ぎます。ハッシュデータは「その他のファイル」ディレクトリ内の「downloads.sqlite3」に保存されます。<br>"
                             "- <b>画像キャッシュ</b>：画像をプレビューする際、それらは「キャッシュ」ディレクトリにキャッシュされ、同じ画像の将来のプレビューを高速化します。<br>"
                             "- <b>ログ記録</b>：コンソールは、ファイル検出、ダウンロード進捗、エラーを含むすべての操作の詳細なログを提供し、問題のデバッグに役立ちます。",
                 "korean": "게시물 다운로더 탭은 특정 Kemono.su 게시물에서 콘텐츠를 다운로드하기 위해 설계되었습니다. 여러 게시물을 대기열에 추가하고, 내용을 보고, 다운로드할 파일을 선택하며, 다운로드 진행 상황을 모니터링할 수 있습니다. 아래는 이 탭을 효과적으로 사용하는 자세한 단계입니다:<br><br>"
@@ -1220,7 +1340,7 @@ class KDLanguage:
                           "- 파일 이름은 원래 URL을 기반으로 하며, 파일 시스템 호환성을 보장하기 위해 특수 문자(예: '/')는 밑줄로 대체됩니다.<br><br>"
                           "<b>2.7 추가 기능</b><br>"
                           "- <b>동시 다운로드</b>: 애플리케이션은 여러 파일을 동시에 다운로드할 수 있으며, 동시 다운로드 수는 설정 탭에서 설정됩니다(기본값은 10, 1-10 사이에서 조정 가능).<br>"
-                          "- <b>파일 중복 제거</b>: 애플리케이션은 URL 해시를 사용하여 이전에 다운로드된 파일을 감지하고 중복을 방지합니다. 해시 데이터는 '기타 파일' 디렉토리의 'file_hashes.json'에 저장됩니다.<br>"
+                          "- <b>파일 중복 제거</b>: 애플리케이션은 URL 해시를 사용하여 이전에 다운로드된 파일을 감지하고 중복을 방지합니다. 해시 데이터는 '기타 파일' 디렉토리의 'downloads.sqlite3'에 저장됩니다.<br>"
                           "- <b>이미지 캐싱</b>: 이미지를 미리 볼 때, '캐시' 디렉토리에 캐시되어 동일한 이미지의 향후 미리보기를 빠르게 합니다.<br>"
                           "- <b>로깅</b>: 콘솔은 파일 감지, 다운로드 진행 상황, 오류를 포함한 모든 작업에 대한 자세한 로그를 제공하여 문제 디버깅에 유용합니다."
             },
@@ -1289,7 +1409,7 @@ class KDLanguage:
                            "  - <b>Post Folder</b>: Named 'post_[post_id]' within the creator folder (e.g., 'post_12345678').<br>"
                            "  - Example: If downloading from creator https://kemono.su/patreon/user/12345678, files from post 12345678 will be saved in '[Save Directory]/12345678/post_12345678/'.<br>"
                            "- Files are named based on their original URLs, with any special characters (e.g., '/') replaced with underscores to ensure compatibility with your filesystem.<br>"
-                           "- <b>File Deduplication</b>: The application uses URL hashes to detect and skip previously downloaded files, storing hash data in 'file_hashes.json' in the 'Other Files' directory.<br><br>"
+                           "- <b>File Deduplication</b>: The application uses URL hashes to detect and skip previously downloaded files, storing hash data in 'downloads.sqlite3' in the 'Other Files' directory.<br><br>"
                            "<b>3.8 Additional Features</b><br>"
                            "- <b>Concurrent Downloads</b>: The application supports downloading multiple files simultaneously, with the number of concurrent downloads set in the Settings tab (default is 10, adjustable between 1-10).<br>"
                            "- <b>Image Caching</b>: Thumbnails and preview images are cached in the 'Cache' directory to speed up future previews of the same image.<br>"
@@ -1353,7 +1473,7 @@ class KDLanguage:
                             "  - <b>投稿フォルダ</b>：クリエイターフォルダ内で「post_[post_id]」と命名されます（例: 「post_12345678」）。<br>"
                             "  - 例: クリエイター https://kemono.su/patreon/user/12345678 からダウンロードする場合、投稿12345678のファイルは「[保存ディレクトリ]/12345678/post_12345678/」に保存されます。<br>"
                             "- ファイル名は元のURLに基づいて命名され、ファイルシステムとの互換性を確保するために特殊文字（例: 「/」）はアンダースコアに置き換えられます。<br>"
-                            "- <b>ファイルの重複排除</b>：アプリケーションはURLハッシュを使用して以前にダウンロードされたファイルを検出しスキップし、ハッシュデータは「その他のファイル」ディレクトリの「file_hashes.json」に保存されます。<br><br>"
+                            "- <b>ファイルの重複排除</b>：アプリケーションはURLハッシュを使用して以前にダウンロードされたファイルを検出しスキップし、ハッシュデータは「その他のファイル」ディレクトリの「downloads.sqlite3」に保存されます。<br><br>"
                             "<b>3.8 追加機能</b><br>"
                             "- <b>同時ダウンロード</b>：アプリケーションは複数のファイルを同時にダウンロードでき、同時ダウンロードの数は設定タブで設定されます（デフォルトは10、1-10の間で調整可能）。<br>"
                             "- <b>画像キャッシュ</b>：サムネイルやプレビュー画像は「キャッシュ」ディレクトリにキャッシュされ、同じ画像の将来のプレビューを高速化します。<br>",
@@ -1415,7 +1535,7 @@ class KDLanguage:
                           "  - <b>게시물 폴더</b>: 크리에이터 폴더 내에서 'post_[post_id]'로 명명됩니다(예: 'post_12345678').<br>"
                           "  - 예: 크리에이터 https://kemono.su/patreon/user/12345678에서 다운로드하면 게시물 12345678의 파일은 '[저장 디렉토리]/12345678/post_12345678/'에 저장됩니다.<br>"
                           "- 파일 이름은 원래 URL을 기반으로 하며, 파일 시스템 호환성을 보장하기 위해 특수 문자(예: '/')는 밑줄로 대체됩니다.<br>"
-                          "- <b>파일 중복 제거</b>: 애플리케이션은 URL 해시를 사용하여 이전에 다운로드된 파일을 감지하고 건너뛰며, 해시 데이터는 '기타 파일' 디렉토리의 'file_hashes.json'에 저장됩니다.<br><br>"
+                          "- <b>파일 중복 제거</b>: 애플리케이션은 URL 해시를 사용하여 이전에 다운로드된 파일을 감지하고 건너뛰며, 해시 데이터는 '기타 파일' 디렉토리의 'downloads.sqlite3'에 저장됩니다.<br><br>"
                           "<b>3.8 추가 기능</b><br>"
                           "- <b>동시 다운로드</b>: 애플리케이션은 여러 파일을 동시에 다운로드할 수 있으며, 동시 다운로드 수는 설정 탭에서 설정됩니다(기본값은 10, 1-10 사이에서 조정 가능).<br>"
                           "- <b>이미지 캐싱</b>: 썸네일 및 미리보기 이미지는 '캐시' 디렉토리에 캐시되어 동일한 이미지의 향후 미리보기를 빠르게 합니다.<br>"
@@ -1573,7 +1693,7 @@ class KDLanguage:
                            "- <b>Cause</b>: Corrupted cache or network issues.<br>"
                            "- <b>Solution</b>: Go to the Settings tab and click 'Clear Cache' to remove temporary files. Try previewing again. If the issue persists, check your internet connection or the file’s availability on Kemono.su.<br><br>"
                            "<b>6.5 Duplicate Files Are Downloaded</b><br>"
-                           "- <b>Cause</b>: The 'file_hashes.json' file is missing or corrupted.<br>"
+                           "- <b>Cause</b>: The 'downloads.sqlite3' file is missing or corrupted.<br>"
                            "- <b>Solution</b>: In the Settings tab, click 'Reset File Hashes' to clear the deduplication data, then re-download. The application will rebuild the hash file to prevent future duplicates.<br><br>"
                            "<b>6.6 Application Crashes or Freezes</b><br>"
                            "- <b>Cause</b>: Resource overload or a bug.<br>"
@@ -1595,7 +1715,7 @@ class KDLanguage:
                             "- <b>原因</b>：キャッシュの破損またはネットワークの問題。<br>"
                             "- <b>解決策</b>：設定タブに移動し、「キャッシュのクリア」をクリックして一時ファイルを削除してください。再度プレビューを試してください。問題が続く場合は、インターネット接続やKemono.suでのファイルの可用性を確認してください。<br><br>"
                             "<b>6.5 重複ファイルがダウンロードされる</b><br>"
-                            "- <b>原因</b>：「file_hashes.json」ファイルが欠落しているか破損している。<br>"
+                            "- <b>原因</b>：「downloads.sqlite3」ファイルが欠落しているか破損している。<br>"
                             "- <b>解決策</b>：設定タブで「ファイルハッシュのリセット」をクリックして重複排除データをクリアし、再ダウンロードしてください。アプリケーションは将来の重複を防ぐためにハッシュファイルを再構築します。<br><br>"
                             "<b>6.6 アプリケーションがクラッシュまたはフリーズする</b><br>"
                             "- <b>原因</b>：リソースの過負荷またはバグ。<br>"
@@ -1617,7 +1737,7 @@ class KDLanguage:
                           "- <b>원인</b>: 캐시 손상 또는 네트워크 문제.<br>"
                           "- <b>해결책</b>: 설정 탭으로 이동하여 '캐시 지우기'를 클릭해 임시 파일을 삭제하세요. 다시 미리보기를 시도하세요. 문제가 지속되면 인터넷 연결이나 Kemono.su에서 파일의 가용성을 확인하세요.<br><br>"
                           "<b>6.5 중복 파일이 다운로드됨</b><br>"
-                          "- <b>원인</b>: 'file_hashes.json' 파일이 없거나 손상됨.<br>"
+                          "- <b>원인</b>: 'downloads.sqlite3' 파일이 없거나 손상됨.<br>"
                           "- <b>해결책</b>: 설정 탭에서 '파일 해시 초기화'를 클릭하여 중복 제거 데이터를 지우고 다시 다운로드하세요. 애플리케이션이 해시 파일을 재구축하여 향후 중복을 방지합니다.<br><br>"
                           "<b>6.6 애플리케이션이 충돌하거나 멈춤</b><br>"
                           "- <b>원인</b>: 자원 과부하 또는 버그.<br>"
@@ -0,0 +1,400 @@
+import qtawesome as qta
+from PyQt6.QtCore import QAbstractListModel, QEvent, QModelIndex, QRect, QRectF, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtWidgets import QAbstractItemView, QApplication, QListView, QStyle, QStyledItemDelegate, QStyleOptionButton
+
+ROW_HEIGHT = 28
+ROW_COLOR = "#2A3B5A"
+SELECTED_ROW_COLOR = "#4A5B7A"
+BUTTON_COLOR = "#4A5B7A"
+CHECK_BOX_SIZE = 16
+QUEUE_ROW_HEIGHT = 34
+QUEUE_BUTTON_SIZE = 30
+QUEUE_ICON_SIZE = 16
+# Above this many separate runs of inserted or removed rows, update_rows resets the model instead
+MAX_ROW_CHANGE_RUNS = 50
+
+UrlRole = Qt.ItemDataRole.UserRole
+KeyRole = Qt.ItemDataRole.UserRole + 1
+
+
+def count_runs(rows, keys):
+    """Number of contiguous runs of rows whose key is not in `keys`."""
+    runs = 0
+    previous_missing = False
+    for row in rows:
+        missing = row[2] not in keys
+        if missing and not previous_missing:
+            runs += 1
+        previous_missing = missing
+    return runs
+
+
+class CheckListModel(QAbstractListModel):
+    """Checkable (text, url, key) rows for the post and file lists.
+
+    The check state of every key lives here, including keys that the current filter hides, so filtering only
+    swaps the row list. Keys without a stored state count as `default_checked`. Running counts of checked keys
+    and of checked rows on display keep toggles and the check-all state independent of the list size.
+    """
+
+    # Emitted when the user toggles one row, with its key and new state
+    check_toggled = pyqtSignal(object, bool)
+
+    def __init__(self, default_checked=False, parent=None):
+        super().__init__(parent)
+        self.default_checked = default_checked
+        self.checked = {}  # Map key to its stored check state
+        self.checked_count = 0  # Keys stored as checked
+        self.rows = []
+        self.row_of_key = {}
+        self.visible_checked_count = 0  # Rows on display that are checked, stored or by default
+        self.checkable = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        text, url, key = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self.is_checked(key) else Qt.CheckState.Unchecked
+        if role == UrlRole:
+            return url
+        if role == KeyRole:
+            return key
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if self.checkable:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or not index.isValid() or not self.checkable:
+            return False
+        key = self.rows[index.row()][2]
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        if self.store_check(key, checked):
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.check_toggled.emit(key, checked)
+        return True
+
+    def set_rows(self, rows):
+        """Replace the displayed rows with (text, url, key) tuples. Check states are kept."""
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.row_of_key = {row[2]: index for index, row in enumerate(self.rows)}
+        self.visible_checked_count = sum(1 for row in self.rows if self.is_checked(row[2]))
+        self.endResetModel()
+
+    def update_rows(self, rows):
+        """Change the displayed rows to `rows`, announcing only the rows that were removed or inserted.
+
+        Rows that stay must keep their relative order. When they do not, or when the change is so scattered that
+        announcing every run costs more than redrawing, the model is reset instead.
+        """
+        rows = list(rows)
+        new_keys = {row[2] for row in rows}
+        old_keys = set(self.row_of_key)
+        if len(new_keys) != len(rows) or len(old_keys) != len(self.rows):
+            self.set_rows(rows)
+            return
+        kept = [row[2] for row in self.rows if row[2] in new_keys]
+        if kept != [row[2] for row in rows if row[2] in old_keys] or (
+                count_runs(self.rows, new_keys) + count_runs(rows, old_keys) > MAX_ROW_CHANGE_RUNS):
+            self.set_rows(rows)
+            return
+        # Remove from the end so the positions of runs not handled yet stay valid
+        end = len(self.rows)
+        while end > 0:
+            if self.rows[end - 1][2] in new_keys:
+                end -= 1
+                continue
+            start = end - 1
+            while start > 0 and self.rows[start - 1][2] not in new_keys:
+                start -= 1
+            self.beginRemoveRows(QModelIndex(), start, end - 1)
+            self.visible_checked_count -= sum(1 for row in self.rows[start:end] if self.is_checked(row[2]))
+            del self.rows[start:end]
+            self.endRemoveRows()
+            end = start
+        start = 0
+        while start < len(rows):
+            if rows[start][2] in old_keys:
+                start += 1
+                continue
+            end = start + 1
+            while end < len(rows) and rows[end][2] not in old_keys:
+                end += 1
+            self.beginInsertRows(QModelIndex(), start, end - 1)
+            self.visible_checked_count += sum(1 for row in rows[start:end] if self.is_checked(row[2]))
+            self.rows[start:start] = rows[start:end]
+            self.endInsertRows()
+            start = end
+        self.rows = rows
+        self.row_of_key = {row[2]: index for index, row in enumerate(rows)}
+
+    def row_for_key(self, key):
+        """Row on display for `key`, or None if the current filter hides it."""
+        return self.row_of_key.get(key)
+
+    def clear(self):
+        self.set_rows([])
+
+    def keys(self):
+        return [row[2] for row in self.rows]
+
+    def is_checked(self, key):
+        return self.checked.get(key, self.default_checked)
+
+    def store_check(self, key, checked):
+        """Store the state of one key and update the counts. Returns whether a row on display changed."""
+        previous = self.checked.get(key)
+        self.checked[key] = checked
+        self.checked_count += int(checked) - int(previous is True)
+        if (self.default_checked if previous is None else previous) == checked or key not in self.row_of_key:
+            return False
+        self.visible_checked_count += 1 if checked else -1
+        return True
+
+    def set_checked(self, keys, checked):
+        """Set the state of `keys`. Costs time in proportion to the number of keys, not to the list size."""
+        changed_rows = [self.row_of_key[key] for key in keys if self.store_check(key, checked)]
+        if changed_rows:
+            self.dataChanged.emit(self.index(min(changed_rows)), self.index(max(changed_rows)), [Qt.ItemDataRole.CheckStateRole])
+
+    def clear_checks(self):
+        self.checked.clear()
+        self.checked_count = 0
+        self.visible_checked_count = len(self.rows) if self.default_checked else 0
+        self.refresh_checks()
+
+    def checked_keys(self):
+        """Keys stored as checked, in the order they were first stored."""
+        return [key for key, checked in self.checked.items() if checked]
+
+    def refresh_checks(self):
+        if self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [Qt.ItemDataRole.CheckStateRole])
+
+    def all_checked(self):
+        return bool(self.rows) and self.visible_checked_count == len(self.rows)
+
+    def set_checkable(self, checkable):
+        if checkable != self.checkable:
+            self.checkable = checkable
+            self.refresh_checks()
+
+
+class CheckListDelegate(QStyledItemDelegate):
+    """Paints a CheckListModel row (rounded background, check box, elided text) without creating any widget."""
+
+    def check_rect(self, option):
+        rect = option.rect
+        return QRect(rect.left() + 6, rect.top() + (rect.height() - CHECK_BOX_SIZE) // 2, CHECK_BOX_SIZE, CHECK_BOX_SIZE)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(SELECTED_ROW_COLOR if selected else ROW_COLOR))
+        painter.drawRoundedRect(QRectF(option.rect.adjusted(1, 1, -1, -1)), 5, 5)
+
+        check_option = QStyleOptionButton()
+        check_option.rect = self.check_rect(option)
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        check_option.state = QStyle.StateFlag.State_On if checked else QStyle.StateFlag.State_Off
+        if index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            check_option.state |= QStyle.StateFlag.State_Enabled
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorCheckBox, check_option, painter, option.widget)
+
+        text_rect = option.rect.adjusted(CHECK_BOX_SIZE + 12, 0, -6, 0)
+        text = option.fontMetrics.elidedText(index.data() or "", Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.setPen(QColor("white"))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton or not self.check_rect(option).contains(event.position().toPoint()):
+            return False
+        if not index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            return True
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+            model.setData(index, Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+        # Clicks on the check box toggle it without selecting the row
+        return True
+
+
+def check_list_view(model):
+    """Return a QListView showing `model` through a CheckListDelegate. Only the visible rows are ever painted."""
+    view = QListView()
+    view.setModel(model)
+    view.setItemDelegate(CheckListDelegate(view))
+    view.setUniformItemSizes(True)
+    view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+    view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    view.setStyleSheet(f"background: {ROW_COLOR}; border-radius: 5px;")
+    return view
+
+
+_icons = {}
+_colors = {}
+
+
+def cached_icon(name):
+    """Return the white qtawesome icon `name`, creating it only once per process."""
+    icon = _icons.get(name)
+    if icon is None:
+        icon = _icons[name] = qta.icon(name, color='white')
+    return icon
+
+
+def cached_color(name):
+    color = _colors.get(name)
+    if color is None:
+        color = _colors[name] = QColor(name)
+    return color
+
+
+class QueueModel(QAbstractListModel):
+    """Queued URLs and whether each has been viewed. Iterating yields (url, viewed) pairs in queue order.
+
+    Adding, removing or marking a URL only announces the row it touches.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []  # [url, viewed] pairs
+        self.row_of_url = {}
+
+    def __iter__(self):
+        return (tuple(entry) for entry in self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, url):
+        return url in self.row_of_url
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.entries):
+            return None
+        url, viewed = self.entries[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, UrlRole):
+            return url
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if viewed else Qt.CheckState.Unchecked
+        return None
+
+    def append(self, url):
+        row = len(self.entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.entries.append([url, False])
+        self.row_of_url[url] = row
+        self.endInsertRows()
+
+    def remove(self, url):
+        """Remove `url` from the queue. Returns False if it was not queued."""
+        row = self.row_of_url.get(url)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.entries[row]
+        del self.row_of_url[url]
+        for later_row in range(row, len(self.entries)):
+            self.row_of_url[self.entries[later_row][0]] = later_row
+        self.endRemoveRows()
+        return True
+
+    def mark_viewed(self, url):
+        row = self.row_of_url.get(url)
+        if row is not None and not self.entries[row][1]:
+            self.entries[row][1] = True
+            self.dataChanged.emit(self.index(row), self.index(row), [Qt.ItemDataRole.CheckStateRole])
+
+    def any_viewed(self):
+        return any(viewed for _, viewed in self.entries)
+
+    def urls(self):
+        return [url for url, _ in self.entries]
+
+
+class QueueDelegate(QStyledItemDelegate):
+    """Paints a queue row as a view button, the URL and a remove button, and reports clicks on the buttons."""
+
+    view_clicked = pyqtSignal(str)
+    remove_clicked = pyqtSignal(str)
+
+    def view_rect(self, option):
+        rect = option.rect
+        return QRect(rect.left() + 2, rect.top() + (rect.height() - QUEUE_BUTTON_SIZE) // 2, QUEUE_BUTTON_SIZE, QUEUE_BUTTON_SIZE)
+
+    def remove_rect(self, option):
+        rect = option.rect
+        return QRect(rect.right() - QUEUE_BUTTON_SIZE - 1, rect.top() + (rect.height() - QUEUE_BUTTON_SIZE) // 2,
+                     QUEUE_BUTTON_SIZE, QUEUE_BUTTON_SIZE)
+
+    def paint_button(self, painter, rect, icon_name):
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(cached_color(BUTTON_COLOR))
+        painter.drawRoundedRect(QRectF(rect), 5, 5)
+        icon_rect = QRect(0, 0, QUEUE_ICON_SIZE, QUEUE_ICON_SIZE)
+        icon_rect.moveCenter(rect.center())
+        cached_icon(icon_name).paint(painter, icon_rect)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        view_rect = self.view_rect(option)
+        remove_rect = self.remove_rect(option)
+        self.paint_button(painter, view_rect, 'fa5s.eye')
+        self.paint_button(painter, remove_rect, 'fa5s.times')
+        text_rect = QRect(view_rect.right() + 6, option.rect.top(), remove_rect.left() - view_rect.right() - 12, option.rect.height())
+        text = option.fontMetrics.elidedText(index.data() or "", Qt.TextElideMode.ElideMiddle, text_rect.width())
+        painter.setPen(cached_color("white"))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), QUEUE_ROW_HEIGHT)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        position = event.position().toPoint()
+        if self.view_rect(option).contains(position):
+            self.view_clicked.emit(index.data(UrlRole))
+            return True
+        if self.remove_rect(option).contains(position):
+            self.remove_clicked.emit(index.data(UrlRole))
+            return True
+        return False
+
+
+def queue_list_view(model):
+    """Return a QListView showing a QueueModel. Connect to the `delegate` attribute for button clicks."""
+    view = QListView()
+    view.setModel(model)
+    view.delegate = QueueDelegate(view)
+    view.setItemDelegate(view.delegate)
+    view.setUniformItemSizes(True)
+    view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+    view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    view.setStyleSheet(f"background: {ROW_COLOR}; border-radius: 5px;")
+    return view
@@ -0,0 +1,311 @@
+import atexit
+import collections
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+import weakref
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt, QTimer
+from PyQt6.QtGui import QColor, QKeySequence, QShortcut
+from PyQt6.QtWidgets import QAbstractItemView, QApplication, QComboBox, QHBoxLayout, QLabel, QListView, QVBoxLayout, QWidget
+
+from kemonodownloader.kd_language import translate
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+LEVEL_COLORS = {"DEBUG": "#8FA3BF", "INFO": "green", "WARNING": "yellow", "ERROR": "red"}
+# Lines kept in memory per console; older ones are only in the log file
+MAX_CONSOLE_LINES = 20000
+# Appends are gathered and handed to the view at most this often (milliseconds)
+CONSOLE_FLUSH_INTERVAL = 100
+LOG_FILENAME = "kemono_downloader.log"
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+DEFAULT_LOG_LEVEL = "INFO"
+# Worker thread log lines are sent to the GUI in batches at most this often (seconds)
+THREAD_LOG_INTERVAL = 0.1
+
+
+_min_level = LEVELS.index(DEFAULT_LOG_LEVEL)
+
+
+def set_log_level(level):
+    """Set the lowest level worker threads log at; anything below it is dropped before being formatted."""
+    global _min_level
+    _min_level = LEVELS.index(level) if level in LEVELS else LEVELS.index(DEFAULT_LOG_LEVEL)
+
+
+def get_log_level():
+    return LEVELS[_min_level]
+
+
+class ThreadLogger:
+    """Logger for worker threads.
+
+    Lines below the configured level are dropped before `message` is formatted with `args` or translated. The
+    rest are sent through `emit_batch` as one list of (message, level) pairs per THREAD_LOG_INTERVAL, by a
+    shared flusher thread. Call flush() before the thread's final signal so its last lines arrive first.
+    """
+
+    def __init__(self, emit_batch):
+        self.emit_batch = emit_batch
+        self.lock = threading.Lock()
+        self.lines = []
+        _loggers.add(self)
+        _ensure_flusher()
+
+    def is_enabled_for(self, level):
+        return LEVELS.index(level) >= _min_level
+
+    def log(self, level, message, *args):
+        if LEVELS.index(level) < _min_level:
+            return
+        if args:
+            message = message.format(*args)
+        line = (translate(f"log_{level.lower()}", message), level)
+        with self.lock:
+            self.lines.append(line)
+
+    def debug(self, message, *args):
+        self.log("DEBUG", message, *args)
+
+    def info(self, message, *args):
+        self.log("INFO", message, *args)
+
+    def warning(self, message, *args):
+        self.log("WARNING", message, *args)
+
+    def error(self, message, *args):
+        self.log("ERROR", message, *args)
+
+    def flush(self):
+        with self.lock:
+            lines, self.lines = self.lines, []
+            if not lines:
+                return
+            try:
+                self.emit_batch(lines)
+            except RuntimeError:
+                # The QThread owning the signal was already deleted; nobody is listening any more
+                pass
+
+
+_loggers = weakref.WeakSet()
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def _flush_loggers():
+    while True:
+        time.sleep(THREAD_LOG_INTERVAL)
+        for logger in list(_loggers):
+            logger.flush()
+
+
+def _ensure_flusher():
+    global _flusher
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loggers, name="ThreadLogFlusher", daemon=True)
+            _flusher.start()
+
+
+def message_level(message, level):
+    """Return the level of a console message. Debug lines are still sent as INFO with a translated [DEBUG] prefix."""
+    if level == "INFO" and message.startswith(translate("log_debug", "")):
+        return "DEBUG"
+    return level if level in LEVEL_COLORS else "INFO"
+
+
+class LogModel(QAbstractListModel):
+    """Ring buffer of (level, message) lines. Appends are batched and old lines drop off once the buffer is full."""
+
+    def __init__(self, max_lines=MAX_CONSOLE_LINES, parent=None):
+        super().__init__(parent)
+        self.lines = collections.deque(maxlen=max_lines)
+        self.pending = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(CONSOLE_FLUSH_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.lines)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.lines):
+            return None
+        level, message = self.lines[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return message
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return QColor(LEVEL_COLORS[level])
+        if role == Qt.ItemDataRole.UserRole:
+            return LEVELS.index(level)
+        return None
+
+    def append(self, level, message):
+        self.pending.append((level, message))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        pending, self.pending = self.pending[-self.lines.maxlen:], []
+        if not pending:
+            return
+        overflow = len(self.lines) + len(pending) - self.lines.maxlen
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.lines.popleft()
+            self.endRemoveRows()
+        start = len(self.lines)
+        self.beginInsertRows(QModelIndex(), start, start + len(pending) - 1)
+        self.lines.extend(pending)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.lines.clear()
+        self.pending = []
+        self.endResetModel()
+
+
+class LevelFilterModel(QSortFilterProxyModel):
+    """Hides console lines below a minimum level."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.min_level = 0
+
+    def set_min_level(self, min_level):
+        self.min_level = min_level
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.min_level == 0:
+            return True
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return self.sourceModel().data(index, Qt.ItemDataRole.UserRole) >= self.min_level
+
+
+class LogConsole(QWidget):
+    """Read-only log console. Only the visible lines are rendered, whatever the size of the buffer."""
+
+    def __init__(self, source, log_dir=None, parent=None):
+        super().__init__(parent)
+        self.file_logger = file_logger(source, log_dir) if log_dir else None
+        self.model = LogModel(parent=self)
+        self.filter_model = LevelFilterModel(self)
+        self.filter_model.setSourceModel(self.model)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        filter_layout = QHBoxLayout()
+        self.level_label = QLabel()
+        filter_layout.addWidget(self.level_label)
+        self.level_combo = QComboBox()
+        self.level_combo.setStyleSheet("padding: 3px; background: #3A4B6A; color: white; border-radius: 5px;")
+        self.level_combo.currentIndexChanged.connect(self.filter_model.set_min_level)
+        filter_layout.addWidget(self.level_combo)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        self.view = QListView()
+        self.view.setModel(self.filter_model)
+        self.view.setUniformItemSizes(True)
+        self.view.setWordWrap(False)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setStyleSheet("background: #2A3B5A; border-radius: 5px; padding: 5px;")
+        layout.addWidget(self.view)
+        QShortcut(QKeySequence.StandardKey.Copy, self.view, self.copy_selection)
+
+        self.follow = True
+        self.view.verticalScrollBar().valueChanged.connect(self.update_follow)
+        self.filter_model.rowsInserted.connect(self.scroll_if_following)
+        self.update_ui_text()
+
+    def append(self, message, level="INFO"):
+        level = message_level(message, level)
+        self.model.append(level, message)
+        if self.file_logger is not None:
+            self.file_logger.log(getattr(logging, level), message)
+
+    def clear(self):
+        self.model.clear()
+
+    def update_follow(self, value):
+        scroll_bar = self.view.verticalScrollBar()
+        self.follow = value >= scroll_bar.maximum()
+
+    def scroll_if_following(self):
+        if self.follow:
+            self.view.scrollToBottom()
+
+    def copy_selection(self):
+        rows = sorted(index.row() for index in self.view.selectionModel().selectedIndexes())
+        QApplication.clipboard().setText("\n".join(self.filter_model.index(row, 0).data() for row in rows))
+
+    def update_ui_text(self):
+        self.level_label.setText(translate("log_level_filter"))
+        current = max(0, self.level_combo.currentIndex())
+        self.level_combo.blockSignals(True)
+        self.level_combo.clear()
+        self.level_combo.addItems([translate(f"log_level_{level.lower()}") for level in LEVELS])
+        self.level_combo.setCurrentIndex(current)
+        self.level_combo.blockSignals(False)
+
+
+_log_queue = queue.SimpleQueue()
+_log_listener = None
+_file_handlers = {}
+_file_lock = threading.Lock()
+
+
+class _HandlerDispatcher(logging.Handler):
+    """Sends each record to the rotating file handler of its log directory, on the listener thread."""
+
+    def emit(self, record):
+        handler = _file_handlers.get(record.log_dir)
+        if handler is not None:
+            handler.handle(record)
+
+
+def file_logger(source, log_dir):
+    """Return a logger that mirrors console lines of `source` to a rotating file in `log_dir`.
+
+    Records only go through a queue on the calling thread; a listener thread formats and writes them.
+    """
+    global _log_listener
+    log_dir = os.path.abspath(log_dir)
+    with _file_lock:
+        if log_dir not in _file_handlers:
+            os.makedirs(log_dir, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(os.path.join(log_dir, LOG_FILENAME), maxBytes=LOG_FILE_MAX_BYTES,
+                                                           backupCount=LOG_FILE_BACKUPS, encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s [%(source)s] %(message)s"))
+            _file_handlers[log_dir] = handler
+        if _log_listener is None:
+            _log_listener = logging.handlers.QueueListener(_log_queue, _HandlerDispatcher())
+            _log_listener.start()
+    logger = logging.getLogger(f"kemonodownloader.console.{source}")
+    if not logger.handlers:
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+    return logging.LoggerAdapter(logger, {"source": source, "log_dir": log_dir})
+
+
+@atexit.register
+def close_log_files():
+    global _log_listener
+    with _file_lock:
+        if _log_listener is not None:
+            _log_listener.stop()
+            _log_listener = None
+        for handler in _file_handlers.values():
+            handler.close()
+        _file_handlers.clear()
@@ -0,0 +1,323 @@
+import asyncio
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+import urllib3
+
+# Requests per second and burst size for each kind of endpoint. The API is far stricter than the data servers.
+API_RATE_LIMIT = (2.0, 4)
+DATA_RATE_LIMIT = (8.0, 8)
+THROTTLE_STATUS_CODES = (429, 503)
+# HEAD requests carry no body, so they only take a fraction of a token from the host limiter
+HEAD_REQUEST_COST = 0.25
+SESSION_POOL_SIZE = 32
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds asked for by a Retry-After header value, or None if it is missing or invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RateLimiter:
+    """Adaptive token bucket shared by every thread talking to one host.
+
+    Callers reserve a token before each request and report the response status back. A 429/503 halves the
+    rate and blocks the whole bucket for the Retry-After delay; successful responses slowly restore the rate.
+    """
+
+    def __init__(self, rate, burst, min_rate=0.1):
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.last_throttle = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self, amount=1):
+        """Take `amount` tokens and return how many seconds the caller has to wait before using them."""
+        with self.lock:
+            now = time.monotonic()
+            if now > self.updated:
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+            self.tokens -= amount
+            # While blocked by Retry-After, `updated` lies in the future and nothing refills until then
+            return (self.updated - now) + max(0.0, -self.tokens) / self.rate
+
+    def wait(self, is_running=None, amount=1):
+        """Block until a token is available. Returns False if `is_running` turned false while waiting."""
+        deadline = time.monotonic() + self.reserve(amount)
+        while True:
+            # A throttle signal received while we sleep pushes every waiter back, not only new callers
+            remaining = max(deadline, self.updated) - time.monotonic()
+            if remaining <= 0:
+                return True
+            if is_running is not None and not is_running():
+                return False
+            time.sleep(min(remaining, 0.25))
+
+    async def wait_async(self, amount=1):
+        deadline = time.monotonic() + self.reserve(amount)
+        while True:
+            remaining = max(deadline, self.updated) - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, 1.0))
+
+    def throttle(self, retry_after=None):
+        """Slow the whole bucket down after the server asked us to back off."""
+        with self.lock:
+            now = time.monotonic()
+            # A burst of 429s from concurrent requests should only count as one signal
+            if now - self.last_throttle > 1.0:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.last_throttle = now
+            delay = retry_after if retry_after is not None else 1.0 / self.rate
+            self.updated = max(self.updated, now + delay)
+            self.tokens = min(self.tokens, 0.0)
+
+    def recover(self):
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def observe(self, status_code, retry_after_header=None):
+        """Feed a response status (and its Retry-After header) back into the limiter."""
+        if status_code in THROTTLE_STATUS_CODES:
+            self.throttle(parse_retry_after(retry_after_header))
+        elif status_code < 400:
+            self.recover()
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(url):
+    """Return the process-wide limiter for the host (and endpoint kind) of `url`."""
+    parts = urlsplit(url)
+    is_api = parts.path.startswith('/api/')
+    key = (parts.hostname or '', is_api)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            rate, burst = API_RATE_LIMIT if is_api else DATA_RATE_LIMIT
+            limiter = RateLimiter(rate, burst)
+            _limiters[key] = limiter
+        return limiter
+
+
+def rate_limited_get(url, is_running=None, **kwargs):
+    """requests.get that waits for the host limiter first and reports the response status back to it.
+
+    Returns None if `is_running` turned false while waiting for a token.
+    """
+    limiter = limiter_for(url)
+    if not limiter.wait(is_running):
+        return None
+    response = requests.get(url, **kwargs)
+    limiter.observe(response.status_code, response.headers.get('Retry-After'))
+    return response
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def shared_session():
+    """Return the process-wide requests session, whose connection pool is reused across threads and hosts."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=SESSION_POOL_SIZE)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+
+def rate_limited_head(url, is_running=None, **kwargs):
+    """HEAD request through the shared session and the host limiter, following redirects to the final server.
+
+    Returns None if `is_running` turned false while waiting for a token.
+    """
+    limiter = limiter_for(url)
+    if not limiter.wait(is_running, HEAD_REQUEST_COST):
+        return None
+    response = shared_session().head(url, allow_redirects=True, **kwargs)
+    limiter.observe(response.status_code, response.headers.get('Retry-After'))
+    return response
+
+
+def classify_error(status_code=None, exception=None):
+    """Sort a failed request into an error class that the retry budgets are keyed on.
+
+    Returns one of 'throttled', 'server', 'timeout', 'network' or 'permanent'.
+    """
+    if exception is not None:
+        if isinstance(exception, aiohttp.ClientResponseError):
+            status_code = exception.status
+        elif isinstance(exception, requests.HTTPError) and exception.response is not None:
+            status_code = exception.response.status_code
+        elif isinstance(exception, (requests.Timeout, asyncio.TimeoutError, aiohttp.ServerTimeoutError)):
+            return 'timeout'
+        elif isinstance(exception, (requests.ConnectionError, aiohttp.ClientError, ConnectionError)):
+            return 'network'
+        elif isinstance(exception, (requests.RequestException, urllib3.exceptions.ProtocolError)):
+            # A stream dropped part way: ChunkedEncodingError, ContentDecodingError and the like
+            return 'network'
+        elif isinstance(exception, ValueError):
+            # Truncated or garbled JSON from an overloaded server
+            return 'server'
+        else:
+            return 'permanent'
+    if status_code in THROTTLE_STATUS_CODES:
+        return 'throttled'
+    if status_code == 408:
+        return 'timeout'
+    if status_code is not None and status_code >= 500:
+        return 'server'
+    return 'permanent'
+
+
+def retry_after_from(exception):
+    """Return the Retry-After delay carried by a failed response, if any."""
+    if isinstance(exception, aiohttp.ClientResponseError) and exception.headers:
+        return parse_retry_after(exception.headers.get('Retry-After'))
+    if isinstance(exception, requests.HTTPError) and exception.response is not None:
+        return parse_retry_after(exception.response.headers.get('Retry-After'))
+    return None
+
+
+class RetryLater(Exception):
+    """Raised by a job to have it scheduled again after `delay` seconds."""
+
+    def __init__(self, delay, reason=""):
+        super().__init__(reason)
+        self.delay = delay
+        self.reason = reason
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter and a separate retry budget for each error class."""
+
+    def __init__(self, budgets, base_delay=1.0, max_delay=60.0):
+        self.budgets = budgets
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def start(self):
+        return RetryState(self)
+
+
+class RetryState:
+    """Retry bookkeeping for one job across all of its attempts."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.attempts = {}
+        self.failures = 0
+
+    def next_delay(self, error_class, retry_after=None):
+        """Record a failure and return the delay before the next attempt, or None if the job should give up."""
+        self.failures += 1
+        count = self.attempts.get(error_class, 0) + 1
+        self.attempts[error_class] = count
+        if count > self.policy.budgets.get(error_class, 0):
+            return None
+        delay = random.uniform(0, min(self.policy.max_delay, self.policy.base_delay * 2 ** (count - 1)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def describe(self, error_class):
+        return f"{self.attempts.get(error_class, 0)}/{self.policy.budgets.get(error_class, 0)}"
+
+
+API_RETRY_POLICY = RetryPolicy({'throttled': 20, 'server': 6, 'timeout': 6, 'network': 6}, base_delay=1.0, max_delay=30.0)
+DOWNLOAD_RETRY_POLICY = RetryPolicy({'throttled': 30, 'server': 10, 'timeout': 20, 'network': 20}, base_delay=1.0, max_delay=60.0)
+
+
+def call_with_retries(fn, policy, is_running=None, on_retry=None):
+    """Call fn() until it succeeds, sleeping between attempts according to `policy`.
+
+    Only meant for strictly sequential calls where the caller's thread has nothing else to do; pooled jobs
+    should raise RetryLater and go through run_jobs instead. The last error is re-raised when giving up.
+    """
+    state = policy.start()
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            error_class = classify_error(exception=e)
+            delay = state.next_delay(error_class, retry_after_from(e))
+            if delay is None:
+                raise
+            if on_retry is not None:
+                on_retry(e, delay, state.describe(error_class))
+            deadline = time.monotonic() + delay
+            while time.monotonic() < deadline:
+                if is_running is not None and not is_running():
+                    raise
+                time.sleep(min(0.25, max(0.0, deadline - time.monotonic())))
+
+
+def run_jobs(executor, jobs, on_result, is_running=None, on_error=None):
+    """Run `(key, fn)` jobs on `executor` and hand every result to `on_result(key, result)` on this thread.
+
+    A job raising RetryLater is resubmitted once its delay has passed, so a waiting retry never holds a pool
+    worker. Other exceptions go to `on_error(key, exception)`, or are re-raised if no handler is given.
+    """
+    pending = {executor.submit(fn): (key, fn) for key, fn in jobs}
+    delayed = []  # Heap of (due time, sequence, key, fn)
+    sequence = 0
+    while pending or delayed:
+        if is_running is not None and not is_running():
+            for future in pending:
+                future.cancel()
+            return
+        now = time.monotonic()
+        while delayed and delayed[0][0] <= now:
+            _, _, key, fn = heapq.heappop(delayed)
+            pending[executor.submit(fn)] = (key, fn)
+        timeout = 0.25
+        if delayed:
+            timeout = min(timeout, max(0.0, delayed[0][0] - now))
+        if not pending:
+            time.sleep(timeout)
+            continue
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            key, fn = pending.pop(future)
+            try:
+                result = future.result()
+            except RetryLater as retry:
+                sequence += 1
+                heapq.heappush(delayed, (time.monotonic() + retry.delay, sequence, key, fn))
+                continue
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(key, e)
+                continue
+            on_result(key, result)
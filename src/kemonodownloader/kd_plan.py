@@ -0,0 +1,184 @@
+import hashlib
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from kemonodownloader.kd_files import content_hash_from_url
+from kemonodownloader.kd_network import (RetryLater, RetryPolicy, classify_error, parse_retry_after, rate_limited_head,
+                                         run_jobs)
+
+# Sizes of URLs that are not named after their content are looked up again after this long
+SIZE_CACHE_TTL = 7 * 24 * 3600
+# Space kept free on the target volume on top of what the planned files need
+FREE_SPACE_MARGIN = 256 * 1024 * 1024
+HEAD_RETRY_POLICY = RetryPolicy({'throttled': 10, 'server': 3, 'timeout': 3, 'network': 3}, base_delay=1.0, max_delay=30.0)
+THROUGHPUT_STAT = "download_throughput"
+
+
+def free_space(folder):
+    """Free bytes on the volume `folder` is (or will be) created on, or None if that cannot be determined."""
+    path = os.path.abspath(folder)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    try:
+        return shutil.disk_usage(path).free
+    except OSError:
+        return None
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def record_throughput(store, size, seconds):
+    """Fold the speed of a finished download run into the moving average used for time estimates."""
+    if size < 1024 * 1024 or seconds <= 0:
+        return
+    sample = size / seconds
+    previous = store.get_stat(THROUGHPUT_STAT)
+    store.put_stat(THROUGHPUT_STAT, sample if previous is None else 0.7 * previous + 0.3 * sample)
+
+
+class DownloadPlan:
+    """What a download is about to fetch: file sizes, files already on disk, and whether the target volume fits them."""
+
+    def __init__(self, urls, folder):
+        self.urls = list(urls)
+        self.folder = folder
+        self.sizes = {}  # Map URL to its size in bytes, or None if the server did not say
+        self.present = set()  # URLs whose file is already on disk and will be skipped
+        self.free_bytes = free_space(folder)
+        self.throughput = None  # Bytes per second measured on earlier runs
+
+    @property
+    def needed_urls(self):
+        return [url for url in self.urls if url not in self.present]
+
+    @property
+    def total_bytes(self):
+        return sum(self.sizes.get(url) or 0 for url in self.needed_urls)
+
+    @property
+    def unknown_count(self):
+        return sum(1 for url in self.needed_urls if self.sizes.get(url) is None)
+
+    def estimated_seconds(self):
+        if not self.throughput:
+            return None
+        return self.total_bytes / self.throughput
+
+    def fits(self):
+        return self.free_bytes is None or self.total_bytes + FREE_SPACE_MARGIN <= self.free_bytes
+
+    def trimmed(self):
+        """Return the URLs, in queue order, that fit into the free space.
+
+        Files already on disk cost nothing and files of unknown size cannot be judged, so both are kept.
+        """
+        if self.free_bytes is None:
+            return list(self.urls)
+        budget = self.free_bytes - FREE_SPACE_MARGIN
+        kept = []
+        for url in self.urls:
+            size = 0 if url in self.present else self.sizes.get(url) or 0
+            if size > budget:
+                continue
+            budget -= size
+            kept.append(url)
+        return kept
+
+
+def fetch_size(url, headers, retry_state, is_running=None):
+    """Return the Content-Length a HEAD request reports for `url`, or None. Raises RetryLater on transient errors."""
+    try:
+        response = rate_limited_head(url, is_running, headers=headers, timeout=15)
+    except requests.RequestException as e:
+        delay = retry_state.next_delay(classify_error(exception=e))
+        if delay is None:
+            return None
+        raise RetryLater(delay)
+    if response is None:
+        return None
+    if response.status_code != 200:
+        delay = retry_state.next_delay(classify_error(response.status_code),
+                                       parse_retry_after(response.headers.get('Retry-After')))
+        if delay is None:
+            return None
+        raise RetryLater(delay)
+    length = response.headers.get('Content-Length', '')
+    return int(length) if length.isdigit() else None
+
+
+def plan_downloads(urls, folder, store, headers, storage_mode='copy', is_running=None, max_workers=8, on_progress=None):
+    """Build a DownloadPlan, sending concurrent HEAD requests for every size the store has not cached yet."""
+    plan = DownloadPlan(urls, folder)
+    plan.throughput = store.get_stat(THROUGHPUT_STAT)
+    url_hashes = {url: hashlib.md5(url.encode()).hexdigest() for url in plan.urls}
+    to_fetch = []
+    for url in plan.urls:
+        entry = store.get(url_hashes[url])
+        if entry and store.is_intact(entry):
+            plan.present.add(url)
+            continue
+        content_sha256 = content_hash_from_url(url)
+        entry = store.find_content(content_sha256) if content_sha256 else None
+        if entry:
+            # Linked copies take no extra space; plain copies need as much as the original
+            if storage_mode != 'copy':
+                plan.present.add(url)
+                continue
+            if entry["file_size"] is not None:
+                plan.sizes[url] = entry["file_size"]
+                continue
+        to_fetch.append(url)
+
+    cached = store.get_remote_sizes(url_hashes[url] for url in to_fetch)
+    now = time.time()
+    missing = []
+    for url in to_fetch:
+        size, updated_at = cached.get(url_hashes[url], (None, 0))
+        # Data server URLs are named after their content, so their size never changes
+        if size is not None and (content_hash_from_url(url) or now - updated_at < SIZE_CACHE_TTL):
+            plan.sizes[url] = size
+        else:
+            missing.append(url)
+
+    done = len(plan.urls) - len(missing)
+
+    def add_size(url, size):
+        nonlocal done
+        plan.sizes[url] = size
+        if size is not None:
+            store.put_remote_size(url_hashes[url], size)
+        done += 1
+        if on_progress is not None:
+            on_progress(done, len(plan.urls))
+
+    def skip_size(url, e):
+        add_size(url, None)
+
+    if missing:
+        jobs = [(url, lambda url=url, state=HEAD_RETRY_POLICY.start(): fetch_size(url, headers, state, is_running))
+                for url in missing]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            run_jobs(executor, jobs, add_size, is_running, skip_size)
+    return plan
@@ -0,0 +1,500 @@
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from PyQt6.QtCore import QCoreApplication, QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from kemonodownloader.kd_files import DATA_PATH_RE
+from kemonodownloader.kd_language import translate
+from kemonodownloader.kd_network import limiter_for, shared_session
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+# Previews at most this many at once, whatever the number of open dialogs
+PREVIEW_WORKERS = 4
+PREVIEW_TIMEOUT = (10, 30)
+PREVIEW_CHUNK_SIZE = 64 * 1024
+# Larger images are scaled down to fit this box before being cached, unless loaded full size
+PREVIEW_MAX_DIMENSION = 800
+# Decoded images kept in memory, counted in bytes of pixel data
+PREVIEW_MEMORY_BYTES = 128 * 1024 * 1024
+# Previews of this many posts on each side of the selection are fetched ahead, on one throttled worker
+PREFETCH_NEIGHBOURS = 3
+PREFETCH_BANDWIDTH = 512 * 1024  # bytes per second
+PREVIEW_INDEX_FILENAME = "preview_index.json"
+DEFAULT_PREVIEW_CACHE_LIMIT_MB = 1024
+# An eviction pass brings the cache folder down to this share of its limit, so passes stay rare
+PREVIEW_CACHE_LOW_WATER = 0.9
+
+
+def preview_cache_path(cache_dir, url, full_size=False):
+    """Return where the preview of `url` is cached. Full size images get their own file next to the scaled one."""
+    ext = os.path.splitext(url.lower())[1]
+    suffix = "_full" if full_size and ext in IMAGE_EXTENSIONS else ""
+    return os.path.join(cache_dir, hashlib.md5(url.encode()).hexdigest() + suffix + ext)
+
+
+def thumbnail_url(url):
+    """Return the URL of the downscaled copy the site's thumbnail server keeps of an image data URL, or None.
+
+    https://n1.kemono.su/data/ab/cd/abcd....png -> https://img.kemono.su/thumbnail/data/ab/cd/abcd....png
+    """
+    parts = urlsplit(url)
+    path = parts.path.lower()
+    match = DATA_PATH_RE.search(path)
+    if not match or os.path.splitext(path)[1] not in IMAGE_EXTENSIONS:
+        return None
+    if not parts.hostname or parts.hostname.replace(".", "").isdigit():
+        return None
+    domain = ".".join(parts.hostname.split(".")[-2:])
+    return f"{parts.scheme}://img.{domain}/thumbnail/data{match.group(0)}"
+
+
+class ImageCache:
+    """Decoded images by key. The least recently used ones are dropped once their pixel data passes max_bytes."""
+
+    def __init__(self, max_bytes=PREVIEW_MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self.images = collections.OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            image = self.images.get(key)
+            if image is not None:
+                self.images.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.images.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous.sizeInBytes()
+            self.images[key] = image
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, dropped = self.images.popitem(last=False)
+                self.total_bytes -= dropped.sizeInBytes()
+
+    def clear(self):
+        with self.lock:
+            self.images.clear()
+            self.total_bytes = 0
+
+
+_cache_limit = DEFAULT_PREVIEW_CACHE_LIMIT_MB * 1024 * 1024
+
+
+def set_preview_cache_limit(max_bytes):
+    """Set the byte budget of the preview cache folders; folders already over it are trimmed in the background."""
+    global _cache_limit
+    _cache_limit = max_bytes
+    with _disk_caches_lock:
+        caches = list(_disk_caches.values())
+    for cache in caches:
+        cache.trim_if_needed()
+
+
+def get_preview_cache_limit():
+    return _cache_limit
+
+
+class PreviewDiskCache:
+    """Files of a preview cache folder in least recently used order.
+
+    The order and the file sizes are kept in PREVIEW_INDEX_FILENAME, which is all that is read on creation. The
+    folder itself is scanned on a background thread that reconciles the index with it: files the index does not
+    know count as the oldest, by modification time, and files that are gone are dropped. Once the folder passes
+    the cache limit, that same thread deletes the oldest files until it is back under PREVIEW_CACHE_LOW_WATER of it.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, PREVIEW_INDEX_FILENAME)
+        self.entries = collections.OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.load_index()
+        self.trimming = True
+        threading.Thread(target=self.trim, args=(True,), name="PreviewCacheTrim", daemon=True).start()
+
+    def load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        for item in index if isinstance(index, list) else []:
+            # Indexes written before sizes were recorded list bare names; their sizes arrive with the scan
+            name, size = (item, 0) if isinstance(item, str) else item
+            self.entries[name] = size
+            self.total_bytes += size
+
+    def reconcile(self):
+        """Bring the entries in line with the files actually in the folder."""
+        files = {}
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name == PREVIEW_INDEX_FILENAME or entry.name.endswith('.part') or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime, stat.st_size)
+        except OSError:
+            return
+        with self.lock:
+            unknown = sorted((mtime, name) for name, (mtime, _) in files.items() if name not in self.entries)
+            entries = collections.OrderedDict((name, files[name][1]) for _, name in unknown)
+            for name, size in self.entries.items():
+                if name in files:
+                    entries[name] = files[name][1]
+                elif os.path.exists(os.path.join(self.cache_dir, name)):
+                    # Added while the folder was being scanned
+                    entries[name] = size
+            self.entries = entries
+            self.total_bytes = sum(entries.values())
+
+    def save(self):
+        with self.lock:
+            items = [[name, size] for name, size in self.entries.items()]
+        temp_path = self.index_path + '.part'
+        with self.save_lock:
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(items, f)
+                os.replace(temp_path, self.index_path)
+            except OSError:
+                pass
+
+    def touch(self, path):
+        name = os.path.basename(path)
+        with self.lock:
+            if name in self.entries:
+                self.entries.move_to_end(name)
+
+    def add(self, path):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        name = os.path.basename(path)
+        with self.lock:
+            self.total_bytes += size - self.entries.pop(name, 0)
+            self.entries[name] = size
+        self.trim_if_needed()
+
+    def usage(self):
+        return self.total_bytes
+
+    def trim_if_needed(self):
+        with self.lock:
+            if self.trimming or self.total_bytes <= _cache_limit:
+                return
+            self.trimming = True
+        threading.Thread(target=self.trim, name="PreviewCacheTrim", daemon=True).start()
+
+    def trim(self, reconcile=False):
+        try:
+            if reconcile:
+                self.reconcile()
+                if self.total_bytes <= _cache_limit:
+                    self.save()
+                    return
+            while True:
+                with self.lock:
+                    # Keep the newest file even when it alone is over the limit; it is likely on screen
+                    if self.total_bytes <= _cache_limit * PREVIEW_CACHE_LOW_WATER or len(self.entries) <= 1:
+                        break
+                    name, size = self.entries.popitem(last=False)
+                    self.total_bytes -= size
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # Still open elsewhere, e.g. a video being played; retry on a later pass
+                    with self.lock:
+                        self.entries[name] = size
+                        self.entries.move_to_end(name, last=False)
+                        self.total_bytes += size
+                    break
+            self.save()
+        finally:
+            with self.lock:
+                self.trimming = False
+
+
+_disk_caches = {}
+_disk_caches_lock = threading.Lock()
+
+
+def disk_cache(cache_dir):
+    """Return the process-wide PreviewDiskCache of `cache_dir`."""
+    cache_dir = os.path.abspath(cache_dir)
+    with _disk_caches_lock:
+        cache = _disk_caches.get(cache_dir)
+        if cache is None:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache = PreviewDiskCache(cache_dir)
+            _disk_caches[cache_dir] = cache
+        return cache
+
+
+class BandwidthLimiter:
+    """Paces a byte stream to `rate` bytes per second, allowing bursts of up to one second's worth."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.allowance = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, amount, cancelled):
+        """Account for `amount` bytes, sleeping as long as needed to stay under the rate or until `cancelled` is set."""
+        with self.lock:
+            now = time.monotonic()
+            self.allowance = min(self.rate, self.allowance + (now - self.updated) * self.rate) - amount
+            self.updated = now
+            delay = -self.allowance / self.rate
+        if delay > 0:
+            cancelled.wait(delay)
+
+
+class PreviewError(Exception):
+    pass
+
+
+# Owner of the loads started by PreviewService.prefetch
+PREFETCH_OWNER = "prefetch"
+
+
+class PreviewJob:
+    def __init__(self, url, full_size, cache_path, headers, disk_cache):
+        self.url = url
+        self.full_size = full_size
+        self.cache_path = cache_path
+        self.headers = headers
+        self.disk_cache = disk_cache
+        self.owners = set()
+        self.cancelled = threading.Event()
+        self.future = None
+        self.prefetch = False
+
+
+class PreviewService(QObject):
+    """Loads previews on a small worker pool over the shared HTTP session.
+
+    Images (.jpg/.jpeg/.png) arrive as a QImage kept in an ImageCache, scaled down to PREVIEW_MAX_DIMENSION unless
+    the load asks for `full_size`. They are fetched from the thumbnail server when it has a copy, from the original
+    otherwise; full size images always come from the original. Anything else arrives as the path of its file in
+    the cache folder. Signals carry the url and the `full_size` flag of the load they answer. Loads of a url
+    already in flight at the same size join the running one. Each load is held by its owner; once every owner
+    cancelled, the download stops.
+
+    Prefetches run on a single worker capped at PREFETCH_BANDWIDTH, and move to the regular pool, uncapped, as
+    soon as a regular load asks for the same url.
+    """
+    preview_ready = pyqtSignal(str, bool, object)
+    progress = pyqtSignal(str, bool, int)
+    error = pyqtSignal(str, bool, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.images = ImageCache()
+        self.executor = ThreadPoolExecutor(max_workers=PREVIEW_WORKERS, thread_name_prefix="Preview")
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PreviewPrefetch")
+        self.prefetch_bandwidth = BandwidthLimiter(PREFETCH_BANDWIDTH)
+        self.jobs = {}  # Map (url, full_size) to its PreviewJob
+        self.lock = threading.Lock()
+        # Thumbnail hosts that could not be reached; their images are fetched from the originals for the session
+        self.thumbnail_hosts_down = set()
+
+    def load(self, url, cache_dir, headers, owner, prefetch=False, full_size=False):
+        key = (url, full_size)
+        image = self.images.get(key)
+        if image is not None:
+            disk_cache(cache_dir).touch(preview_cache_path(cache_dir, url, full_size))
+            if not prefetch:
+                self.preview_ready.emit(url, full_size, image)
+            return
+        with self.lock:
+            job = self.jobs.get(key)
+            if job is None or job.cancelled.is_set():
+                job = PreviewJob(url, full_size, preview_cache_path(cache_dir, url, full_size), headers, disk_cache(cache_dir))
+                job.prefetch = prefetch
+                self.jobs[key] = job
+                job.future = (self.prefetch_executor if prefetch else self.executor).submit(self.run_job, job)
+            elif job.prefetch and not prefetch:
+                job.prefetch = False
+                if job.future.cancel():
+                    job.future = self.executor.submit(self.run_job, job)
+            job.owners.add(owner)
+
+    def prefetch(self, urls, cache_dir, headers):
+        """Fetch `urls` ahead of need, in order, and drop the earlier prefetches that are not among them."""
+        self.cancel_prefetch(keep=urls)
+        for url in urls:
+            self.load(url, cache_dir, headers, PREFETCH_OWNER, prefetch=True)
+
+    def cancel_prefetch(self, keep=()):
+        with self.lock:
+            urls = [url for (url, full_size), job in self.jobs.items()
+                    if not full_size and PREFETCH_OWNER in job.owners and url not in keep]
+        for url in urls:
+            self.cancel(url, PREFETCH_OWNER)
+
+    def cancel(self, url, owner, full_size=False):
+        key = (url, full_size)
+        with self.lock:
+            job = self.jobs.get(key)
+            if job is None or owner not in job.owners:
+                return
+            job.owners.discard(owner)
+            if job.owners:
+                return
+            job.cancelled.set()
+            del self.jobs[key]
+        job.future.cancel()
+
+    def shutdown(self):
+        with self.lock:
+            jobs, self.jobs = list(self.jobs.values()), {}
+        for job in jobs:
+            job.cancelled.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        with _disk_caches_lock:
+            caches = list(_disk_caches.values())
+        for cache in caches:
+            cache.save()
+
+    def run_job(self, job):
+        try:
+            result = self.fetch(job)
+        except (requests.RequestException, PreviewError) as e:
+            result, message = None, f"{translate('failed_to_download')}: {job.url}: {str(e)}"
+        except Exception as e:
+            result, message = None, f"{translate('unexpected_error')}: {job.url}: {str(e)}"
+        key = (job.url, job.full_size)
+        with self.lock:
+            if self.jobs.get(key) is job:
+                del self.jobs[key]
+            waiting = job.owners != {PREFETCH_OWNER}
+        if job.cancelled.is_set() or not waiting:
+            return
+        if result is None:
+            self.error.emit(job.url, job.full_size, message)
+        else:
+            self.preview_ready.emit(job.url, job.full_size, result)
+
+    def fetch(self, job):
+        os.makedirs(os.path.dirname(job.cache_path), exist_ok=True)
+        if os.path.splitext(job.cache_path)[1] not in IMAGE_EXTENSIONS:
+            return self.fetch_file(job)
+
+        image = QImage(job.cache_path) if os.path.exists(job.cache_path) else QImage()
+        if not image.isNull():
+            job.disk_cache.touch(job.cache_path)
+        elif job.full_size:
+            # Full size images come from the original data path, kept byte for byte
+            image = QImage(self.fetch_file(job))
+            if image.isNull():
+                raise PreviewError(translate('invalid_image_data'))
+        else:
+            image = self.download_image(job)
+            if not job.full_size and (image.width() > PREVIEW_MAX_DIMENSION or image.height() > PREVIEW_MAX_DIMENSION):
+                image = image.scaled(PREVIEW_MAX_DIMENSION, PREVIEW_MAX_DIMENSION, Qt.AspectRatioMode.KeepAspectRatio,
+                                     Qt.TransformationMode.SmoothTransformation)
+            temp_path = f"{job.cache_path}.{id(job)}.part"
+            if image.save(temp_path, os.path.splitext(job.cache_path)[1][1:].upper()):
+                os.replace(temp_path, job.cache_path)
+                job.disk_cache.add(job.cache_path)
+        self.images.put((job.url, job.full_size), image)
+        return image
+
+    def fetch_file(self, job):
+        """Download job.url into its cache file unless it is there already, and return the file's path."""
+        if os.path.exists(job.cache_path):
+            job.disk_cache.touch(job.cache_path)
+            return job.cache_path
+        temp_path = f"{job.cache_path}.{id(job)}.part"
+        try:
+            with open(temp_path, 'wb') as f:
+                self.download(job, f.write)
+            os.replace(temp_path, job.cache_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        job.disk_cache.add(job.cache_path)
+        return job.cache_path
+
+    def download_image(self, job):
+        """Return the decoded image of job.url, taken from the thumbnail server when it has a copy."""
+        thumbnail = thumbnail_url(job.url)
+        if thumbnail and urlsplit(thumbnail).hostname not in self.thumbnail_hosts_down:
+            data = bytearray()
+            try:
+                self.download(job, data.extend, thumbnail)
+                image = QImage.fromData(bytes(data))
+                if not image.isNull():
+                    return image
+            except (requests.ConnectionError, requests.Timeout):
+                self.thumbnail_hosts_down.add(urlsplit(thumbnail).hostname)
+            except requests.RequestException:
+                pass
+        data = bytearray()
+        self.download(job, data.extend)
+        image = QImage.fromData(bytes(data))
+        if image.isNull():
+            raise PreviewError(translate('invalid_image_data'))
+        return image
+
+    def download(self, job, write, url=None):
+        """Stream the body of `url` (job.url by default) into `write`. Raises PreviewError if the job is cancelled
+        part way."""
+        url = url or job.url
+        limiter = limiter_for(url)
+        if not limiter.wait(lambda: not job.cancelled.is_set()):
+            raise PreviewError("cancelled")
+        with shared_session().get(url, headers=job.headers, stream=True, timeout=PREVIEW_TIMEOUT) as response:
+            limiter.observe(response.status_code, response.headers.get('Retry-After'))
+            response.raise_for_status()
+            total_size = int(response.headers.get('content-length', 0)) or 1
+            downloaded_size = 0
+            last_percent = -1
+            for chunk in response.iter_content(chunk_size=PREVIEW_CHUNK_SIZE):
+                if job.cancelled.is_set():
+                    raise PreviewError("cancelled")
+                write(chunk)
+                if job.prefetch:
+                    self.prefetch_bandwidth.consume(len(chunk), job.cancelled)
+                downloaded_size += len(chunk)
+                percent = min(int(downloaded_size * 100 / total_size), 100)
+                if percent != last_percent:
+                    last_percent = percent
+                    self.progress.emit(job.url, job.full_size, percent)
+
+
+_service = None
+
+
+def preview_service():
+    """Return the process-wide preview service. Create it from the GUI thread so its signals reach the GUI."""
+    global _service
+    if _service is None:
+        _service = PreviewService()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_service.shutdown)
+    return _service
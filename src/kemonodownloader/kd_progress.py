@@ -0,0 +1,71 @@
+import threading
+
+# Seconds between two progress snapshots, i.e. at most 10 progress signals per second per download thread
+PUBLISH_INTERVAL = 0.1
+
+_paused = threading.Event()
+
+
+def set_paused(paused):
+    """Stop or resume publishing progress everywhere, e.g. while the main window is minimized."""
+    if paused:
+        _paused.set()
+    else:
+        _paused.clear()
+
+
+class ProgressAggregator:
+    """Per-file byte counters that download workers may update after every chunk.
+
+    A background thread publishes the files whose progress changed as one {file_index: percent} snapshot every
+    `interval` seconds. While publishing is paused the changes pile up and go out together once it resumes.
+    """
+
+    def __init__(self, publish, interval=PUBLISH_INTERVAL):
+        self.publish = publish
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.counters = {}  # Map file index to (bytes done, bytes total)
+        self.changed = set()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def update(self, file_index, done, total):
+        with self.lock:
+            self.counters[file_index] = (done, total)
+            self.changed.add(file_index)
+
+    def finish(self, file_index):
+        """Forget a file that completed or failed, so no snapshot published after this call mentions it."""
+        with self.lock:
+            self.counters.pop(file_index, None)
+            self.changed.discard(file_index)
+
+    def flush(self):
+        # Publishing under the lock orders every snapshot before the completion signals sent after finish()
+        with self.lock:
+            if not self.changed:
+                return
+            snapshot = {}
+            for file_index in self.changed:
+                done, total = self.counters[file_index]
+                snapshot[file_index] = min(100, int(done / total * 100)) if total else 0
+            self.changed.clear()
+            self.publish(snapshot)
+
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="ProgressAggregator", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            if not _paused.is_set():
+                self.flush()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
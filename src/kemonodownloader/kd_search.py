@@ -0,0 +1,39 @@
+NGRAM_SIZE = 3
+# Milliseconds of typing pause before a search runs
+SEARCH_DEBOUNCE_INTERVAL = 200
+
+
+def ngrams(text):
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class TitleIndex:
+    """Case-insensitive substring search over a fixed list of titles.
+
+    Titles are lowercased once and every trigram maps to the positions of the titles containing it. Searches
+    return positions in title order. A query that extends the previous one only re-checks the previous matches.
+    """
+
+    def __init__(self, titles):
+        self.titles = [title.lower() for title in titles]
+        self.postings = {}
+        for position, title in enumerate(self.titles):
+            for gram in ngrams(title):
+                self.postings.setdefault(gram, []).append(position)
+        self.last_query = ""
+        self.last_result = range(len(self.titles))
+
+    def search(self, query):
+        query = query.lower()
+        if not query:
+            result = range(len(self.titles))
+        elif self.last_query and self.last_query in query:
+            result = [position for position in self.last_result if query in self.titles[position]]
+        elif len(query) < NGRAM_SIZE:
+            result = [position for position, title in enumerate(self.titles) if query in title]
+        else:
+            postings = sorted((self.postings.get(gram, ()) for gram in ngrams(query)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            result = [position for position in sorted(candidates) if query in self.titles[position]]
+        self.last_query, self.last_result = query, result
+        return result
@@ -7,6 +7,10 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QSettings, pyqtSignal
 from kemonodownloader.kd_language import language_manager, translate
+from kemonodownloader.kd_files import STORAGE_MODES
+from kemonodownloader.kd_logging import DEFAULT_LOG_LEVEL, LEVELS, set_log_level
+from kemonodownloader.kd_plan import format_size
+from kemonodownloader.kd_preview import DEFAULT_PREVIEW_CACHE_LIMIT_MB, disk_cache, set_preview_cache_limit
 
 class SettingsTab(QWidget):
     settings_applied = pyqtSignal()
@@ -20,6 +24,10 @@ class SettingsTab(QWidget):
             "base_folder_name": "Kemono Downloader",
             "base_directory": self.get_default_base_directory(),
             "simultaneous_downloads": 5,
+            "storage_mode": "copy",
+            "verify_existing_files": False,
+            "log_level": DEFAULT_LOG_LEVEL,
+            "preview_cache_limit": DEFAULT_PREVIEW_CACHE_LIMIT_MB,
             "auto_check_updates": True,
             "language": "english"
         }
@@ -27,6 +35,8 @@ class SettingsTab(QWidget):
         self.temp_settings = self.settings.copy()
         
         language_manager.set_language(self.settings["language"])
+        set_log_level(self.settings["log_level"])
+        set_preview_cache_limit(self.settings["preview_cache_limit"] * 1024 * 1024)
         
         self.setup_ui()
 
@@ -44,6 +54,10 @@ class SettingsTab(QWidget):
         settings_dict["base_folder_name"] = self.qsettings.value("base_folder_name", self.default_settings["base_folder_name"], type=str)
         settings_dict["base_directory"] = self.qsettings.value("base_directory", self.default_settings["base_directory"], type=str)
         settings_dict["simultaneous_downloads"] = self.qsettings.value("simultaneous_downloads", self.default_settings["simultaneous_downloads"], type=int)
+        settings_dict["storage_mode"] = self.qsettings.value("storage_mode", self.default_settings["storage_mode"], type=str)
+        settings_dict["verify_existing_files"] = self.qsettings.value("verify_existing_files", self.default_settings["verify_existing_files"], type=bool)
+        settings_dict["log_level"] = self.qsettings.value("log_level", self.default_settings["log_level"], type=str)
+        settings_dict["preview_cache_limit"] = self.qsettings.value("preview_cache_limit", self.default_settings["preview_cache_limit"], type=int)
         settings_dict["auto_check_updates"] = self.qsettings.value("auto_check_updates", self.default_settings["auto_check_updates"], type=bool)
         settings_dict["language"] = self.qsettings.value("language", self.default_settings["language"], type=str)
         return settings_dict
@@ -52,6 +66,10 @@ class SettingsTab(QWidget):
         self.qsettings.setValue("base_folder_name", self.settings["base_folder_name"])
         self.qsettings.setValue("base_directory", self.settings["base_directory"])
         self.qsettings.setValue("simultaneous_downloads", self.settings["simultaneous_downloads"])
+        self.qsettings.setValue("storage_mode", self.settings["storage_mode"])
+        self.qsettings.setValue("verify_existing_files", self.settings["verify_existing_files"])
+        self.qsettings.setValue("log_level", self.settings["log_level"])
+        self.qsettings.setValue("preview_cache_limit", self.settings["preview_cache_limit"])
         self.qsettings.setValue("auto_check_updates", self.settings["auto_check_updates"])
         self.qsettings.setValue("language", self.settings["language"])
         self.qsettings.sync()
@@ -106,6 +124,43 @@ class SettingsTab(QWidget):
         self.download_spinbox.setStyleSheet("padding: 5px; border-radius: 5px;")
         self.download_spinbox.valueChanged.connect(self.update_simultaneous_downloads)
         download_layout.addWidget(self.download_spinbox, 0, 2)
+
+        self.storage_mode_label = QLabel()
+        download_layout.addWidget(self.storage_mode_label, 1, 0)
+        self.storage_mode_combo = QComboBox()
+        self.storage_mode_combo.setStyleSheet("padding: 5px; border-radius: 5px;")
+        self.storage_mode_combo.currentIndexChanged.connect(lambda index: self.update_temp_setting("storage_mode", self.storage_mode_combo.itemData(index)))
+        download_layout.addWidget(self.storage_mode_combo, 1, 1, 1, 2)
+
+        self.verify_files_label = QLabel()
+        download_layout.addWidget(self.verify_files_label, 2, 0)
+        self.verify_files_checkbox = QCheckBox()
+        self.verify_files_checkbox.setChecked(self.temp_settings["verify_existing_files"])
+        self.verify_files_checkbox.setStyleSheet("QCheckBox::indicator { width: 16px; height: 16px; }"
+                                                 "QCheckBox::indicator:unchecked { background: #2A3B5A; border: 1px solid #4A5B7A; }"
+                                                 "QCheckBox::indicator:checked { background: #4A6B9A; border: 1px solid #5A7BA9; }")
+        self.verify_files_checkbox.stateChanged.connect(lambda state: self.update_temp_setting("verify_existing_files", state == Qt.CheckState.Checked.value))
+        download_layout.addWidget(self.verify_files_checkbox, 2, 1)
+
+        self.log_level_label = QLabel()
+        download_layout.addWidget(self.log_level_label, 3, 0)
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.setStyleSheet("padding: 5px; border-radius: 5px;")
+        self.log_level_combo.currentIndexChanged.connect(lambda index: self.update_temp_setting("log_level", self.log_level_combo.itemData(index)))
+        download_layout.addWidget(self.log_level_combo, 3, 1, 1, 2)
+
+        self.preview_cache_label = QLabel()
+        download_layout.addWidget(self.preview_cache_label, 4, 0)
+        self.preview_cache_spinbox = QSpinBox()
+        self.preview_cache_spinbox.setRange(64, 1024 * 1024)
+        self.preview_cache_spinbox.setSingleStep(256)
+        self.preview_cache_spinbox.setSuffix(" MB")
+        self.preview_cache_spinbox.setValue(self.temp_settings["preview_cache_limit"])
+        self.preview_cache_spinbox.setStyleSheet("padding: 5px; border-radius: 5px;")
+        self.preview_cache_spinbox.valueChanged.connect(lambda value: self.update_temp_setting("preview_cache_limit", value))
+        download_layout.addWidget(self.preview_cache_spinbox, 4, 1)
+        self.preview_cache_usage_label = QLabel()
+        download_layout.addWidget(self.preview_cache_usage_label, 4, 2)
         
         self.download_group.setLayout(download_layout)
         layout.addWidget(self.download_group)
@@ -179,6 +234,33 @@ class SettingsTab(QWidget):
                 break
         self.language_combo.blockSignals(False)
 
+    def update_storage_mode_combo(self):
+        self.storage_mode_combo.blockSignals(True)
+        self.storage_mode_combo.clear()
+        for mode in STORAGE_MODES:
+            self.storage_mode_combo.addItem(translate(f"storage_mode_{mode}"), mode)
+        index = self.storage_mode_combo.findData(self.temp_settings["storage_mode"])
+        self.storage_mode_combo.setCurrentIndex(max(index, 0))
+        self.storage_mode_combo.blockSignals(False)
+
+    def update_log_level_combo(self):
+        self.log_level_combo.blockSignals(True)
+        self.log_level_combo.clear()
+        for level in LEVELS:
+            self.log_level_combo.addItem(translate(f"log_level_{level.lower()}"), level)
+        index = self.log_level_combo.findData(self.temp_settings["log_level"])
+        self.log_level_combo.setCurrentIndex(max(index, 0))
+        self.log_level_combo.blockSignals(False)
+
+    def update_preview_cache_usage(self):
+        cache_folder = getattr(self.parent, "cache_folder", None)
+        usage = disk_cache(cache_folder).usage() if cache_folder else 0
+        self.preview_cache_usage_label.setText(translate("preview_cache_usage", format_size(usage)))
+
+    def showEvent(self, event):
+        self.update_preview_cache_usage()
+        super().showEvent(event)
+
     def update_language(self, index):
         language = self.language_combo.itemData(index)
         self.update_temp_setting("language", language)
@@ -244,6 +326,8 @@ class SettingsTab(QWidget):
         
         self.settings = self.temp_settings.copy()
         self.save_settings()
+        set_log_level(self.settings["log_level"])
+        set_preview_cache_limit(self.settings["preview_cache_limit"] * 1024 * 1024)
         old_base_folder = self.parent.base_folder
         self.parent.base_folder = os.path.join(self.settings["base_directory"], self.settings["base_folder_name"])
         self.parent.download_folder = os.path.join(self.parent.base_folder, "Downloads")
@@ -256,6 +340,7 @@ class SettingsTab(QWidget):
             self.parent.post_tab.other_files_dir = self.parent.other_files_folder
             self.parent.creator_tab.cache_dir = self.parent.cache_folder
             self.parent.creator_tab.other_files_dir = self.parent.other_files_folder
+        self.update_preview_cache_usage()
 
         if language_changed:
             language_manager.set_language(self.settings["language"])
@@ -303,6 +388,10 @@ class SettingsTab(QWidget):
         self.download_slider.setValue(self.temp_settings["simultaneous_downloads"])
         self.download_spinbox.setValue(self.temp_settings["simultaneous_downloads"])
         self.auto_update_checkbox.setChecked(self.temp_settings["auto_check_updates"])
+        self.update_storage_mode_combo()
+        self.verify_files_checkbox.setChecked(self.temp_settings["verify_existing_files"])
+        self.update_log_level_combo()
+        self.preview_cache_spinbox.setValue(self.temp_settings["preview_cache_limit"])
         
         # Update language combo box
         self.update_language_combo()
@@ -321,6 +410,13 @@ class SettingsTab(QWidget):
 
         self.download_group.setTitle(translate("download_settings"))
         self.simultaneous_downloads_label.setText(translate("simultaneous_downloads"))
+        self.storage_mode_label.setText(translate("storage_mode"))
+        self.verify_files_label.setText(translate("verify_existing_files"))
+        self.update_storage_mode_combo()
+        self.log_level_label.setText(translate("log_level_setting"))
+        self.update_log_level_combo()
+        self.preview_cache_label.setText(translate("preview_cache_limit"))
+        self.update_preview_cache_usage()
 
         self.update_group.setTitle(translate("update_settings"))
         self.auto_update_label.setText(translate("auto_check_updates"))
@@ -335,5 +431,17 @@ class SettingsTab(QWidget):
     def get_simultaneous_downloads(self):
         return self.settings["simultaneous_downloads"]
 
+    def get_storage_mode(self):
+        return self.settings["storage_mode"]
+
+    def is_verify_existing_files_enabled(self):
+        return self.settings["verify_existing_files"]
+
+    def get_log_level(self):
+        return self.settings["log_level"]
+
+    def get_preview_cache_limit(self):
+        return self.settings["preview_cache_limit"]
+
     def is_auto_check_updates_enabled(self):
         return self.settings["auto_check_updates"]
\ No newline at end of file
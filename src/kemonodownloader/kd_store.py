@@ -0,0 +1,304 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from kemonodownloader.kd_files import content_hash_from_url, hash_file
+
+STORE_FILENAME = "downloads.sqlite3"
+LEGACY_HASHES_FILENAME = "file_hashes.json"
+# A batch that fails to commit is tried this many more times, waiting twice as long each time, before it is dropped
+WRITE_RETRIES = 3
+WRITE_RETRY_DELAY = 0.5  # seconds
+
+logger = logging.getLogger(__name__)
+
+# Each entry upgrades the schema by one version; PRAGMA user_version records how many have been applied
+MIGRATIONS = [
+    """
+    CREATE TABLE downloads (
+        url_hash TEXT PRIMARY KEY,
+        url TEXT,
+        file_path TEXT NOT NULL,
+        file_hash TEXT NOT NULL,
+        hash_algorithm TEXT NOT NULL DEFAULT 'md5',
+        updated_at REAL NOT NULL
+    );
+    CREATE INDEX idx_downloads_file_hash ON downloads (file_hash);
+    CREATE INDEX idx_downloads_file_path ON downloads (file_path);
+    """,
+    """
+    ALTER TABLE downloads ADD COLUMN content_sha256 TEXT;
+    UPDATE downloads SET content_sha256 = content_hash_from_url(url);
+    CREATE INDEX idx_downloads_content_sha256 ON downloads (content_sha256);
+    """,
+    """
+    ALTER TABLE downloads ADD COLUMN file_size INTEGER;
+    ALTER TABLE downloads ADD COLUMN mtime_ns INTEGER;
+    ALTER TABLE downloads ADD COLUMN inode INTEGER;
+    """,
+    """
+    CREATE TABLE remote_sizes (
+        url_hash TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        updated_at REAL NOT NULL
+    );
+    CREATE TABLE stats (
+        name TEXT PRIMARY KEY,
+        value REAL NOT NULL
+    );
+    """,
+]
+
+COLUMNS = ("url_hash", "url", "file_path", "file_hash", "hash_algorithm", "updated_at", "content_sha256",
+           "file_size", "mtime_ns", "inode")
+
+
+class DownloadStore:
+    """Record of downloaded files shared by every download thread.
+
+    Reads use one SQLite connection per thread. All writes go through a queue to a single writer thread that
+    commits them in batches, and writes that are still queued are visible to readers right away.
+    """
+
+    def __init__(self, db_path, batch_size=200, flush_interval=1.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.local = threading.local()
+        self.pending = {}  # Map url_hash to rows queued but not committed yet
+        self.pending_lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.migrate()
+        self.writer = threading.Thread(target=self.write_loop, name="DownloadStoreWriter", daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.create_function("content_hash_from_url", 1, content_hash_from_url, deterministic=True)
+        return connection
+
+    def migrate(self):
+        connection = self.connect()
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            for index, script in enumerate(MIGRATIONS[version:], start=version + 1):
+                connection.executescript(f"BEGIN; {script} PRAGMA user_version = {index}; COMMIT;")
+        finally:
+            connection.close()
+
+    def reader(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.connect()
+            self.local.connection = connection
+        return connection
+
+    def get(self, url_hash):
+        """Return the entry recorded for a URL hash as a dict, or None."""
+        with self.pending_lock:
+            row = self.pending.get(url_hash)
+        if row is not None:
+            return dict(row)
+        row = self.reader().execute("SELECT * FROM downloads WHERE url_hash = ?", (url_hash,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def is_intact(self, entry, stat_result=None, verify=False):
+        """Whether the file recorded by `entry` still holds the recorded content.
+
+        A file whose size, mtime and inode all match the record is trusted without reading it, unless `verify`
+        asks for a full re-hash. A file that re-hashes correctly gets its record refreshed so the next check is
+        cheap again.
+        """
+        if stat_result is None:
+            try:
+                stat_result = os.stat(entry["file_path"])
+            except OSError:
+                return False
+        # Directory listings on Windows report an inode of 0, so only compare inodes that are known
+        inode_matches = not stat_result.st_ino or entry.get("inode") == stat_result.st_ino
+        if (not verify and inode_matches and entry.get("file_size") == stat_result.st_size
+                and entry.get("mtime_ns") == stat_result.st_mtime_ns):
+            return True
+        try:
+            if hash_file(entry["file_path"], entry["hash_algorithm"]) != entry["file_hash"]:
+                return False
+        except OSError:
+            return False
+        self.put(entry["url_hash"], entry["url"], entry["file_path"], entry["file_hash"], entry["hash_algorithm"],
+                 entry.get("content_sha256"), stat_result)
+        return True
+
+    def find_content(self, content_sha256, stat=os.stat, verify=False):
+        """Return an entry whose file on disk still holds the given content, or None.
+
+        `stat` returns the stat result for a path, or None (or raises OSError) if the file is gone.
+        """
+        with self.pending_lock:
+            entries = [dict(row) for row in self.pending.values() if row["content_sha256"] == content_sha256]
+        entries += [dict(row) for row in self.reader().execute("SELECT * FROM downloads WHERE content_sha256 = ?", (content_sha256,))]
+        for entry in entries:
+            try:
+                stat_result = stat(entry["file_path"])
+            except OSError:
+                continue
+            if stat_result is not None and self.is_intact(entry, stat_result, verify):
+                return entry
+        return None
+
+    def put(self, url_hash, url, file_path, file_hash, hash_algorithm="md5", content_sha256=None, stat_result=None):
+        """Record a downloaded file. Without `stat_result` the next check of this file re-hashes it."""
+        row = {"url_hash": url_hash, "url": url, "file_path": file_path, "file_hash": file_hash,
+               "hash_algorithm": hash_algorithm, "updated_at": time.time(),
+               "content_sha256": content_sha256 or content_hash_from_url(url),
+               "file_size": stat_result.st_size if stat_result else None,
+               "mtime_ns": stat_result.st_mtime_ns if stat_result else None,
+               "inode": stat_result.st_ino if stat_result else None}
+        with self.pending_lock:
+            self.pending[url_hash] = row
+        self.queue.put(row)
+
+    def get_remote_sizes(self, url_hashes):
+        """Return {url_hash: (size, updated_at)} for the URLs whose size was looked up before."""
+        sizes = {}
+        url_hashes = list(url_hashes)
+        # Stay well below SQLite's limit on bound parameters
+        for start in range(0, len(url_hashes), 500):
+            batch = url_hashes[start:start + 500]
+            placeholders = ", ".join("?" for _ in batch)
+            for row in self.reader().execute(f"SELECT * FROM remote_sizes WHERE url_hash IN ({placeholders})", batch):
+                sizes[row["url_hash"]] = (row["size"], row["updated_at"])
+        return sizes
+
+    def put_remote_size(self, url_hash, size):
+        """Remember the size a server reported for a URL. Unlike put(), readers only see it once committed."""
+        self.queue.put(("INSERT OR REPLACE INTO remote_sizes (url_hash, size, updated_at) VALUES (?, ?, ?)",
+                        (url_hash, size, time.time())))
+
+    def get_stat(self, name, default=None):
+        row = self.reader().execute("SELECT value FROM stats WHERE name = ?", (name,)).fetchone()
+        return row["value"] if row is not None else default
+
+    def put_stat(self, name, value):
+        self.queue.put(("INSERT OR REPLACE INTO stats (name, value) VALUES (?, ?)", (name, value)))
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far has been committed."""
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join()
+
+    def write_loop(self):
+        connection = self.connect()
+        running = True
+        while running:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            rows, statements, events = [], [], []
+            # Drain whatever else is already queued so it lands in the same transaction
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                elif isinstance(item, tuple):
+                    statements.append(item)
+                else:
+                    rows.append(item)
+                if not running or len(rows) + len(statements) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            if rows or statements:
+                self.write_rows(connection, rows, statements)
+            for event in events:
+                event.set()
+        connection.close()
+
+    def write_rows(self, connection, rows, statements=()):
+        """Commit download rows, plus any (sql, params) statements for the other tables, in one transaction.
+
+        A failed commit is retried in place so later writes cannot land before it. Rows that still fail are
+        dropped from the overlay too, so lookups stop reporting files that were never recorded.
+        """
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        for attempt in range(WRITE_RETRIES + 1):
+            try:
+                with connection:
+                    connection.executemany(f"INSERT OR REPLACE INTO downloads ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                                           [tuple(row[column] for column in COLUMNS) for row in rows])
+                    for sql, params in statements:
+                        connection.execute(sql, params)
+                break
+            except sqlite3.Error as e:
+                if attempt == WRITE_RETRIES:
+                    logger.error("Failed to write %d download records, dropping them: %s", len(rows) + len(statements), e)
+                    break
+                logger.warning("Failed to write download records, retrying: %s", e)
+                time.sleep(WRITE_RETRY_DELAY * 2 ** attempt)
+        with self.pending_lock:
+            for row in rows:
+                # A newer put for the same URL may have replaced this row in the meantime
+                if self.pending.get(row["url_hash"]) is row:
+                    del self.pending[row["url_hash"]]
+
+    def import_legacy_hashes(self, json_path):
+        """Copy entries from the old file_hashes.json into the store. Returns how many were imported."""
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        imported = []
+        for url_hash, entry in data.items():
+            if isinstance(entry, dict) and entry.get("file_path") and entry.get("file_hash"):
+                self.put(url_hash, entry.get("url"), entry["file_path"], entry["file_hash"], entry.get("hash_algorithm", "md5"))
+                imported.append(url_hash)
+        self.flush()
+        # Entries that failed to commit were dropped from the overlay, so they read back as missing
+        if any(self.get(url_hash) is None for url_hash in imported):
+            raise sqlite3.Error("Imported entries could not be committed")
+        return len(imported)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_download_store(other_files_dir):
+    """Return the process-wide store kept in `other_files_dir`, importing file_hashes.json on first use."""
+    db_path = os.path.abspath(os.path.join(other_files_dir, STORE_FILENAME))
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            os.makedirs(other_files_dir, exist_ok=True)
+            store = DownloadStore(db_path)
+            legacy_path = os.path.join(other_files_dir, LEGACY_HASHES_FILENAME)
+            if os.path.exists(legacy_path):
+                try:
+                    store.import_legacy_hashes(legacy_path)
+                    os.replace(legacy_path, legacy_path + ".migrated")
+                except (OSError, ValueError, sqlite3.Error) as e:
+                    logger.error("Failed to migrate %s: %s", legacy_path, e)
+            _stores[db_path] = store
+        return store
+
+
+@atexit.register
+def close_download_stores():
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
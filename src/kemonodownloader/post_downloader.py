@@ -6,18 +6,28 @@ import json
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, 
-                             QGroupBox, QGridLayout, QProgressBar, QTextEdit, QListWidget, 
-                             QListWidgetItem, QAbstractItemView, QMessageBox, QCheckBox, 
+                             QGroupBox, QGridLayout, QProgressBar, 
+                             QMessageBox, QCheckBox, 
                              QLabel, QDialog, QSlider, QComboBox, QApplication)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl, QSize, QTimer
 from PyQt6.QtGui import QColor, QPixmap, QMovie
 import qtawesome as qta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import time
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 import subprocess
 from kemonodownloader.kd_language import translate
+from kemonodownloader.kd_logging import LogConsole, ThreadLogger
+from kemonodownloader.kd_files import (DEFAULT_HASH_ALGORITHM, ContentMismatch, DirectoryCache, PartialDownload,
+                                       ResumeMismatch, content_claims, content_hash_from_url, hash_file, new_hash,
+                                       place_existing_file, update_from_file)
+from kemonodownloader.kd_lists import CheckListModel, QueueModel, UrlRole, check_list_view, queue_list_view
+from kemonodownloader.kd_network import (API_RETRY_POLICY, DOWNLOAD_RETRY_POLICY, RetryLater, classify_error,
+                                         parse_retry_after, rate_limited_get, retry_after_from, run_jobs)
+from kemonodownloader.kd_preview import preview_service
+from kemonodownloader.kd_progress import ProgressAggregator
+from kemonodownloader.kd_store import get_download_store
 import locale
 import ctypes
 from fake_useragent import UserAgent
@@ -51,68 +61,6 @@ HEADERS = {
 }
 API_BASE = "https://kemono.su/api/v1"
 
-class PreviewThread(QThread):
-    preview_ready = pyqtSignal(str, object)
-    progress = pyqtSignal(int)
-    error = pyqtSignal(str)
-
-    def __init__(self, url, cache_dir):
-        super().__init__()
-        self.url = url
-        self.cache_dir = cache_dir
-        self.total_size = 0
-        self.downloaded_size = 0
-        os.makedirs(self.cache_dir, exist_ok=True)
-
-    def run(self):
-        ext = os.path.splitext(self.url.lower())[1]
-        cache_key = hashlib.md5(self.url.encode()).hexdigest() + ext
-        cache_path = os.path.join(self.cache_dir, cache_key)
-        
-        if os.path.exists(cache_path):
-            if ext in ['.jpg', '.jpeg', '.png']:
-                pixmap = QPixmap()
-                if pixmap.load(cache_path):
-                    self.preview_ready.emit(self.url, pixmap)
-                    return
-            elif ext == '.gif':
-                self.preview_ready.emit(self.url, cache_path)
-                return
-            else:  
-                self.preview_ready.emit(self.url, None)  
-                return
-
-        try:
-            response = requests.get(self.url, headers=HEADERS, stream=True)
-            response.raise_for_status()
-            self.total_size = int(response.headers.get('content-length', 0)) or 1
-            downloaded_data = bytearray()
-            with open(cache_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        downloaded_data.extend(chunk)
-                        f.write(chunk)
-                        self.downloaded_size += len(chunk)
-                        progress = int((self.downloaded_size / self.total_size) * 100)
-                        self.progress.emit(min(progress, 100))
-            
-            if ext in ['.jpg', '.jpeg', '.png']:
-                pixmap = QPixmap()
-                if not pixmap.loadFromData(downloaded_data):
-                    self.error.emit(f"{translate('error_loading_image')}: {self.url}: {translate('invalid_image_data')}")
-                    return
-                scaled_pixmap = pixmap.scaled(800, 800, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                scaled_pixmap.save(cache_path)
-                self.preview_ready.emit(self.url, scaled_pixmap)
-            elif ext == '.gif':
-                self.preview_ready.emit(self.url, cache_path)
-            else: 
-                self.preview_ready.emit(self.url, None) 
-        except requests.RequestException as e:
-            self.error.emit(f"{translate('failed_to_download')}: {self.url}: {str(e)}")
-        except Exception as e:
-            self.error.emit(f"{translate('unexpected_error')}: {self.url}: {str(e)}")
-
 class MediaPreviewModal(QDialog):
     def __init__(self, media_url, cache_dir, tab_parent=None):
         super().__init__(tab_parent)  
@@ -124,6 +72,7 @@ class MediaPreviewModal(QDialog):
         self.cache_dir = cache_dir
         self.tab_parent = tab_parent  
         self.player = None
+        self.preview_service = None
         self.movie = None  
         self.display_mode = "Fit"
         self.original_size = None
@@ -222,19 +171,14 @@ class MediaPreviewModal(QDialog):
     def start_preview(self):
         ext = os.path.splitext(self.media_url.lower())[1]
 
-        if ext in ['.jpg', '.jpeg', '.png', '.gif']:
-            self.preview_thread = PreviewThread(self.media_url, self.cache_dir)
-            self.preview_thread.preview_ready.connect(self.display_image)
-            self.preview_thread.progress.connect(self.update_progress)
-            self.preview_thread.error.connect(self.display_error)
-            self.preview_thread.start()
-        elif ext in ['.mp4', '.mov', '.mp3', '.wav']:
-            self.setup_media_player()
-            self.preview_thread = PreviewThread(self.media_url, self.cache_dir)
-            self.preview_thread.preview_ready.connect(self.play_media)
-            self.preview_thread.progress.connect(self.update_progress)
-            self.preview_thread.error.connect(self.display_error)
-            self.preview_thread.start()
+        if ext in ['.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mov', '.mp3', '.wav']:
+            if ext in ['.mp4', '.mov', '.mp3', '.wav']:
+                self.setup_media_player()
+            self.preview_service = preview_service()
+            self.preview_service.preview_ready.connect(self.preview_ready)
+            self.preview_service.progress.connect(self.update_progress)
+            self.preview_service.error.connect(self.preview_failed)
+            self.preview_service.load(self.media_url, self.cache_dir, HEADERS, self, full_size=True)
         else:
             if self.tab_parent:
                 self.tab_parent.append_log_to_console(translate("preview_not_supported", ext, self.media_url), "WARNING")
@@ -257,7 +201,30 @@ class MediaPreviewModal(QDialog):
         self.player.positionChanged.connect(self.update_position)
         self.player.mediaStatusChanged.connect(self.media_status_changed)
 
-    def update_progress(self, value):
+    def preview_ready(self, url, full_size, media):
+        if url != self.media_url or not full_size:
+            return
+        if self.player:
+            self.play_media(url, media)
+        else:
+            self.display_image(url, media)
+
+    def preview_failed(self, url, full_size, error_message):
+        if url == self.media_url and full_size:
+            self.display_error(error_message)
+
+    def release_preview(self):
+        if self.preview_service is None:
+            return
+        self.preview_service.preview_ready.disconnect(self.preview_ready)
+        self.preview_service.progress.disconnect(self.update_progress)
+        self.preview_service.error.disconnect(self.preview_failed)
+        self.preview_service.cancel(self.media_url, self, full_size=True)
+        self.preview_service = None
+
+    def update_progress(self, url, full_size, value):
+        if url != self.media_url or not full_size:
+            return
         self.progress_bar.setValue(value)
         if self.progress_bar.value() < 100:
             while self.content_layout.count():
@@ -290,7 +257,7 @@ class MediaPreviewModal(QDialog):
                 self.original_size = QSize(400, 300)  
             self.movie.start()
         else:
-            self.original_pixmap = QPixmap(media)
+            self.original_pixmap = QPixmap.fromImage(media)
             self.original_size = self.original_pixmap.size()
             if self.original_size.isEmpty() or self.original_size.height() == 0:
                 self.original_size = QSize(400, 300)  
@@ -302,7 +269,7 @@ class MediaPreviewModal(QDialog):
         self.controls_widget.setVisible(False)
         self.display_options_widget.setVisible(True)
 
-    def play_media(self, url, _):
+    def play_media(self, url, cache_path):
         while self.content_layout.count():
             item = self.content_layout.takeAt(0)
             if item.widget():
@@ -311,8 +278,6 @@ class MediaPreviewModal(QDialog):
         if ext in ['.mp4', '.mov']:
             self.content_layout.addWidget(self.video_widget)
             QTimer.singleShot(100, self.get_video_size)
-        cache_key = hashlib.md5(self.media_url.encode()).hexdigest() + os.path.splitext(self.media_url)[1]
-        cache_path = os.path.join(self.cache_dir, cache_key)
         self.progress_bar.hide()
         self.player.setSource(QUrl.fromLocalFile(cache_path))
         self.controls_widget.setVisible(True)
@@ -480,6 +445,10 @@ class MediaPreviewModal(QDialog):
         self.apply_display_mode()
         super().resizeEvent(event)
 
+    def done(self, result):
+        self.release_preview()
+        super().done(result)
+
     def closeEvent(self, event):
         if self.player:
             self.player.stop()
@@ -489,61 +458,69 @@ class MediaPreviewModal(QDialog):
         
 class PostDetectionThread(QThread):
     finished = pyqtSignal(list)
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
     error = pyqtSignal(str)
     file_detected = pyqtSignal(list)
+    post_fetched = pyqtSignal(str, dict)  # (post url, post JSON), kept by the tab to list the files without refetching
 
     def __init__(self, url):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.url = url
         self.is_running = True
 
     def stop(self):
         self.is_running = False
-        self.log.emit(translate("log_info", "PostDetectionThread cancellation initiated"), "INFO")
+        self.logger.info("PostDetectionThread cancellation initiated")
 
     def run(self):
-        self.log.emit(translate("log_info", f"Checking post with URL: {self.url}"), "INFO")
+        self.logger.info("Checking post with URL: {0}", self.url)
         if not self.is_running:
-            self.log.emit(translate("log_info", "PostDetectionThread stopped before starting"), "INFO")
+            self.logger.info("PostDetectionThread stopped before starting")
             return
 
         parts = self.url.split('/')
         if len(parts) < 7 or 'kemono.su' not in self.url:
+            self.logger.flush()
             self.error.emit(translate("invalid_url_format"))
             return
         service, creator_id, post_id = parts[-5], parts[-3], parts[-1]
         api_url = f"{API_BASE}/{service}/user/{creator_id}/post/{post_id}"
 
         try:
-            response = requests.get(api_url, headers=HEADERS, timeout=10)
+            response = rate_limited_get(api_url, headers=HEADERS, timeout=10)
             if not self.is_running:
-                self.log.emit(translate("log_info", "PostDetectionThread stopped during request"), "INFO")
+                self.logger.info("PostDetectionThread stopped during request")
                 return
             if response.status_code != 200:
-                self.log.emit(translate("log_error", f"Failed to fetch post - Status code: {response.status_code}"), "ERROR")
+                self.logger.error("Failed to fetch post - Status code: {0}", response.status_code)
+                self.logger.flush()
                 self.error.emit(translate("failed_to_fetch_post", response.status_code))
                 return
 
             post_data = response.json()
             if not post_data or (isinstance(post_data, list) and not post_data) or (isinstance(post_data, dict) and not post_data):
-                self.log.emit(translate("log_error", "No valid post data returned! Response: " + json.dumps(post_data, indent=2)), "ERROR")
+                self.logger.error("No valid post data returned! Response: " + json.dumps(post_data, indent=2))
+                self.logger.flush()
                 self.error.emit(translate("no_valid_post_data"))
                 return
 
             post = post_data if isinstance(post_data, dict) and 'post' not in post_data else post_data.get('post', {})
             detected_files = [(post.get('title', f"File {post_id}"), post_id)]
-            self.log.emit(translate("log_info", f"Post fetched for {self.url}: {post.get('title', f'File {post_id}')}"), "INFO")
+            self.logger.info("Post fetched for {0}: {1}", self.url, post.get('title', f'File {post_id}'))
             
             files = self.detect_files(post)
             if self.is_running:
+                self.post_fetched.emit(self.url, post)
                 self.file_detected.emit(files)
+                self.logger.flush()
                 self.finished.emit(detected_files)
             else:
-                self.log.emit(translate("log_info", "PostDetectionThread stopped before emitting results"), "INFO")
+                self.logger.info("PostDetectionThread stopped before emitting results")
 
         except requests.RequestException as e:
-            self.log.emit(translate("log_error", f"Failed to fetch post: {str(e)}"), "ERROR")
+            self.logger.error("Failed to fetch post: {0}", e)
+            self.logger.flush()
             self.error.emit(translate("failed_to_fetch_post_error", str(e)))
             return
 
@@ -590,14 +567,62 @@ class PostDetectionThread(QThread):
 
         return list(dict.fromkeys(detected_files))
 
+class ValidationThread(QThread):
+    result = pyqtSignal(bool)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
+
+    def __init__(self, url):
+        super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
+        self.url = url
+
+    def run(self):
+        valid = self.validate()
+        self.logger.flush()
+        self.result.emit(valid)
+
+    def validate(self):
+        parts = self.url.split('/')
+        if len(parts) < 7 or 'kemono.su' not in self.url:
+            return False
+        service, creator_id, post_id = parts[-5], parts[-3], parts[-1]
+        api_url = f"{API_BASE}/{service}/user/{creator_id}/post/{post_id}"
+
+        try:
+            response = rate_limited_get(api_url, headers=HEADERS, timeout=5)
+            if response.status_code == 200:
+                return True
+            self.logger.info(translate("first_validation_failed", self.url))
+        except requests.RequestException:
+            self.logger.info(translate("first_validation_failed_exception", self.url))
+
+        try:
+            self.logger.info(translate("attempting_fallback_validation", self.url))
+            fallback_headers = {
+                'User-Agent': user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': accept_language,
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+                'Cache-Control': 'max-age=0'
+            }
+            direct_response = rate_limited_get(self.url, headers=fallback_headers, timeout=10)
+            if direct_response.status_code == 200 and 'kemono' in direct_response.text.lower():
+                self.logger.info(translate("url_validated_fallback", self.url))
+                return True
+        except requests.RequestException as e:
+            self.logger.error(translate("fallback_validation_failed", str(e)))
+        return False
+
 class FilePreparationThread(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal(list, dict)
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
     error = pyqtSignal(str)
 
     def __init__(self, post_ids, all_files_map, post_ext_checks, file_url_map, max_concurrent=10):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.post_ids = post_ids
         self.all_files_map = all_files_map
         self.post_ext_checks = post_ext_checks
@@ -607,11 +632,11 @@ class FilePreparationThread(QThread):
 
     def stop(self):
         self.is_running = False
-        self.log.emit(translate("log_info", "FilePreparationThread cancellation initiated"), "INFO")
+        self.logger.info("FilePreparationThread cancellation initiated")
 
     def detect_files(self, post, allowed_extensions):
         files_to_download = []
-        self.log.emit(translate("log_debug", f"Detecting files for post with allowed extensions: {allowed_extensions}"), "INFO")
+        self.logger.debug("Detecting files for post with allowed extensions: {0}", allowed_extensions)
         
         def get_effective_extension(file_path, file_name):
             name_ext = os.path.splitext(file_name)[1].lower()
@@ -625,12 +650,12 @@ class FilePreparationThread(QThread):
             file_url = urljoin("https://kemono.su", file_path)
             if 'f=' not in file_url and file_name:
                 file_url += f"?f={file_name}"
-            self.log.emit(translate("log_debug", f"Checking main file: {file_name} ({file_ext})"), "INFO")
+            self.logger.debug("Checking main file: {0} ({1})", file_name, file_ext)
             if '.jpg' in allowed_extensions and file_ext in ['.jpg', '.jpeg']:
-                self.log.emit(translate("log_debug", f"Added main file: {file_name}"), "INFO")
+                self.logger.debug("Added main file: {0}", file_name)
                 files_to_download.append((file_name, file_url))
             elif file_ext in allowed_extensions:
-                self.log.emit(translate("log_debug", f"Added main file: {file_name}"), "INFO")
+                self.logger.debug("Added main file: {0}", file_name)
                 files_to_download.append((file_name, file_url))
 
         if 'attachments' in post:
@@ -642,12 +667,12 @@ class FilePreparationThread(QThread):
                     attachment_url = urljoin("https://kemono.su", attachment_path)
                     if 'f=' not in attachment_url and attachment_name:
                         attachment_url += f"?f={attachment_name}"
-                    self.log.emit(translate("log_debug", f"Checking attachment: {attachment_name} ({attachment_ext})"), "INFO")
+                    self.logger.debug("Checking attachment: {0} ({1})", attachment_name, attachment_ext)
                     if '.jpg' in allowed_extensions and attachment_ext in ['.jpg', '.jpeg']:
-                        self.log.emit(translate("log_debug", f"Added attachment: {attachment_name}"), "INFO")
+                        self.logger.debug("Added attachment: {0}", attachment_name)
                         files_to_download.append((attachment_name, attachment_url))
                     elif attachment_ext in allowed_extensions:
-                        self.log.emit(translate("log_debug", f"Added attachment: {attachment_name}"), "INFO")
+                        self.logger.debug("Added attachment: {0}", attachment_name)
                         files_to_download.append((attachment_name, attachment_url))
 
         if 'content' in post and post['content']:
@@ -656,94 +681,98 @@ class FilePreparationThread(QThread):
                 img_url = urljoin("https://kemono.su", img['src'])
                 img_ext = os.path.splitext(img_url)[1].lower() 
                 img_name = os.path.basename(img_url)
-                self.log.emit(translate("log_debug", f"Checking content image: {img_name} ({img_ext})"), "INFO")
+                self.logger.debug("Checking content image: {0} ({1})", img_name, img_ext)
                 if '.jpg' in allowed_extensions and img_ext in ['.jpg', '.jpeg']:
-                    self.log.emit(translate("log_debug", f"Added content image: {img_name}"), "INFO")
+                    self.logger.debug("Added content image: {0}", img_name)
                     files_to_download.append((img_name, img_url))
                 elif img_ext in allowed_extensions:
-                    self.log.emit(translate("log_debug", f"Added content image: {img_name}"), "INFO")
+                    self.logger.debug("Added content image: {0}", img_name)
                     files_to_download.append((img_name, img_url))
 
-        self.log.emit(translate("log_debug", f"Total files detected: {len(files_to_download)}"), "INFO")
+        self.logger.debug("Total files detected: {0}", len(files_to_download))
         return list(dict.fromkeys(files_to_download))
 
-    def fetch_and_detect_files(self, post_id, post_url):
+    def fetch_and_detect_files(self, post_id, post_url, retry_state):
+        """Fetch one post and detect its files. Raises RetryLater on transient errors and returns None on give-up."""
         if not self.is_running:
-            self.log.emit(translate("log_info", "FilePreparationThread stopped during fetch"), "INFO")
+            self.logger.info("FilePreparationThread stopped during fetch")
             return None
 
         parts = post_url.split('/')
         service, creator_id = parts[-5], parts[-3]
         api_url = f"{API_BASE}/{service}/user/{creator_id}/post/{post_id}"
-        max_retries = 50
-        retry_delay_seconds = 5
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = requests.get(api_url, headers=HEADERS)
-                if not self.is_running:
-                    self.log.emit(translate("log_info", "FilePreparationThread stopped during request"), "INFO")
-                    return None
-                if response.status_code != 200:
-                    if response.status_code == 429 and attempt < max_retries:
-                        self.log.emit(translate("log_warning", f"Rate limit hit for {api_url} (attempt {attempt}/{max_retries}). Retrying..."), "WARNING")
-                        for i in range(retry_delay_seconds, 0, -1):
-                            self.log.emit(translate("log_info", f"Trying again in {i}"), "INFO")
-                            time.sleep(1)
-                        continue
-                    self.log.emit(translate("log_error", f"Failed to fetch {api_url} - Status code: {response.status_code}"), "ERROR")
-                    return None
-                post_data = response.json()
-                post = post_data if isinstance(post_data, dict) and 'post' not in post_data else post_data.get('post', {})
-                self.log.emit(translate("log_debug", f"Post data for {post_id}: {json.dumps(post, indent=2)}"), "INFO")
-                allowed_extensions = [ext.lower() for ext, check in self.post_ext_checks.items() if check]
-                detected_files = self.detect_files(post, allowed_extensions)
-                files_to_download = [(file_name, file_url) for file_name, file_url in detected_files]
-                return (post_id, files_to_download)
-            except Exception as e:
-                if attempt == max_retries:
-                    self.log.emit(translate("log_error", f"Error fetching post {post_id} after {max_retries} attempts: {str(e)}"), "ERROR")
+        try:
+            response = rate_limited_get(api_url, headers=HEADERS, timeout=10)
+            if not self.is_running:
+                self.logger.info("FilePreparationThread stopped during request")
+                return None
+            if response.status_code != 200:
+                error_class = classify_error(response.status_code)
+                delay = retry_state.next_delay(error_class, parse_retry_after(response.headers.get('Retry-After')))
+                if delay is None:
+                    self.logger.error("Failed to fetch {0} - Status code: {1}", api_url, response.status_code)
                     return None
-                self.log.emit(translate("log_warning", f"Error fetching post {post_id} (attempt {attempt}/{max_retries}): {str(e)}. Retrying..."), "WARNING")
-                for i in range(retry_delay_seconds, 0, -1):
-                    self.log.emit(translate("log_info", f"Trying again in {i}"), "INFO")
-                    time.sleep(1)
+                self.logger.warning("Failed to fetch {0} - Status code: {1}. Retrying in {2:.1f}s ({3})", api_url, response.status_code, delay, retry_state.describe(error_class))
+                raise RetryLater(delay)
+            post_data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            error_class = classify_error(exception=e)
+            delay = retry_state.next_delay(error_class)
+            if delay is None:
+                self.logger.error("Error fetching post {0} after {1} attempts: {2}", post_id, retry_state.failures, e)
+                return None
+            self.logger.warning("Error fetching post {0}: {1}. Retrying in {2:.1f}s ({3})", post_id, e, delay, retry_state.describe(error_class))
+            raise RetryLater(delay)
+        post = post_data if isinstance(post_data, dict) and 'post' not in post_data else post_data.get('post', {})
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug("Post data for {0}: {1}", post_id, json.dumps(post, indent=2))
+        allowed_extensions = [ext.lower() for ext, check in self.post_ext_checks.items() if check]
+        detected_files = self.detect_files(post, allowed_extensions)
+        files_to_download = [(file_name, file_url) for file_name, file_url in detected_files]
+        return (post_id, files_to_download)
 
     def run(self):
         files_to_download = []
         files_to_posts_map = {}
         allowed_extensions = [ext.lower() for ext, check in self.post_ext_checks.items() if check]
-        self.log.emit(translate("log_debug", f"Allowed extensions for download: {allowed_extensions}"), "INFO")
+        self.logger.debug("Allowed extensions for download: {0}", allowed_extensions)
 
         total_posts = len(self.post_ids)
         completed_posts = 0
 
+        def add_result(post_id, result):
+            nonlocal completed_posts
+            if result:
+                post_id, detected_files = result
+                for file_name, file_url in detected_files:
+                    self.logger.debug("Detected file: {0} from {1}", file_name, file_url)
+                    files_to_download.append(file_url)
+                    files_to_posts_map[file_url] = post_id
+            completed_posts += 1
+            progress = min(int((completed_posts / total_posts) * 100), 100)
+            self.progress.emit(progress)
+
+        def on_error(post_id, e):
+            self.logger.error("Error fetching post {0}: {1}", post_id, e)
+            add_result(post_id, None)
+
+        jobs = [(post_id, lambda post_id=post_id, post_url=post_url, state=API_RETRY_POLICY.start():
+                     self.fetch_and_detect_files(post_id, post_url, state))
+                for post_url, posts in self.all_files_map.items()
+                for _, post_id in posts
+                if post_id in self.post_ids]
         with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-            future_to_post = {executor.submit(self.fetch_and_detect_files, post_id, post_url): post_id
-                             for post_url, posts in self.all_files_map.items()
-                             for _, post_id in posts
-                             if post_id in self.post_ids}
-            
-            for future in as_completed(future_to_post):
-                if not self.is_running:
-                    self.log.emit(translate("log_info", "FilePreparationThread stopped during execution"), "INFO")
-                    break
-                result = future.result()
-                if result:
-                    post_id, detected_files = result
-                    for file_name, file_url in detected_files:
-                        self.log.emit(translate("log_debug", f"Detected file: {file_name} from {file_url}"), "INFO")
-                        files_to_download.append(file_url)
-                        files_to_posts_map[file_url] = post_id
-                completed_posts += 1
-                progress = min(int((completed_posts / total_posts) * 100), 100)
-                self.progress.emit(progress)
+            run_jobs(executor, jobs, add_result, lambda: self.is_running, on_error)
+        if not self.is_running:
+            self.logger.info("FilePreparationThread stopped during execution")
 
         if self.is_running:
             files_to_download = list(dict.fromkeys(files_to_download))
-            self.log.emit(translate("log_debug", f"Total files to download: {len(files_to_download)}"), "INFO")
+            self.logger.debug("Total files to download: {0}", len(files_to_download))
+            self.logger.flush()
             self.finished.emit(files_to_download, files_to_posts_map)
         else:
-            self.log.emit(translate("log_info", "FilePreparationThread stopped before emitting results"), "INFO")
+            self.logger.info("FilePreparationThread stopped before emitting results")
 
 def sanitize_filename(name, max_length=100):
     """Sanitize a filename by removing invalid characters, trailing dots, and limiting length."""
@@ -766,14 +795,15 @@ def sanitize_filename(name, max_length=100):
     return sanitized if sanitized else "unnamed"
 
 class DownloadThread(QThread):
-    file_progress = pyqtSignal(int, int)
+    files_progress = pyqtSignal(dict)  # {file_index: percent} snapshots from progress_counters
     file_completed = pyqtSignal(int, str)
     post_completed = pyqtSignal(str)
-    log = pyqtSignal(str, str)
+    log = pyqtSignal(list)  # Batches of (message, level) from self.logger
     finished = pyqtSignal()
 
-    def __init__(self, url, download_folder, selected_files, files_to_posts_map, console, other_files_dir, post_id, max_concurrent=5):
+    def __init__(self, url, download_folder, selected_files, files_to_posts_map, console, other_files_dir, post_id, max_concurrent=5, hash_algorithm=DEFAULT_HASH_ALGORITHM, storage_mode='copy', verify_files=False):
         super().__init__()
+        self.logger = ThreadLogger(self.log.emit)
         self.url = url
         self.download_folder = download_folder
         self.selected_files = selected_files
@@ -781,34 +811,39 @@ class DownloadThread(QThread):
         self.console = console
         self.is_running = True
         self.other_files_dir = other_files_dir
-        self.hash_file_path = os.path.join(self.other_files_dir, "file_hashes.json")
-        self.file_hashes = self.load_hashes()
+        self.hash_algorithm = hash_algorithm  # Any key of HASH_ALGORITHMS
+        self.storage_mode = storage_mode  # Any of STORAGE_MODES
+        self.verify_files = verify_files  # Re-hash existing files instead of trusting matching size/mtime/inode
+        self.directory_cache = DirectoryCache()
+        self.progress_counters = ProgressAggregator(self.files_progress.emit)
+        self.store = get_download_store(self.other_files_dir)
         self.max_concurrent = max_concurrent
         self.post_id = post_id
         self.service = self.extract_service_from_url(url)
         self.post_files_map = self.build_post_files_map()
         self.completed_files = set()
+        self.no_resume = set()  # Files whose partial data the server failed to continue; restarted whole from now on
         self.post_title = None  # Store post title
 
     def fetch_post_info(self):
         """Fetch post title."""
         parts = self.url.split('/')
         if len(parts) < 7 or 'kemono.su' not in self.url:
-            self.log.emit(translate("log_error", "Invalid URL format for fetching post info"), "ERROR")
+            self.logger.error("Invalid URL format for fetching post info")
             return
         service, creator_id, post_id = parts[-5], parts[-3], parts[-1]
         api_url = f"{API_BASE}/{service}/user/{creator_id}/post/{post_id}"
         try:
-            response = requests.get(api_url, headers=HEADERS, timeout=10)
+            response = rate_limited_get(api_url, headers=HEADERS, timeout=10)
             if response.status_code == 200:
                 post_data = response.json()
                 post = post_data if isinstance(post_data, dict) and 'post' not in post_data else post_data.get('post', {})
                 self.post_title = sanitize_filename(post.get('title', f"Post_{post_id}"))
             else:
-                self.log.emit(translate("log_error", f"Failed to fetch post title - Status code: {response.status_code}"), "ERROR")
+                self.logger.error("Failed to fetch post title - Status code: {0}", response.status_code)
                 self.post_title = f"Post_{post_id}"
         except requests.RequestException as e:
-            self.log.emit(translate("log_error", f"Error fetching post info: {str(e)}"), "ERROR")
+            self.logger.error("Error fetching post info: {0}", e)
             self.post_title = f"Post_{post_id}"
 
     def extract_service_from_url(self, url):
@@ -825,32 +860,14 @@ class DownloadThread(QThread):
                 post_files_map[post_id].append(file_url)
         return post_files_map
 
-    def load_hashes(self):
-        os.makedirs(self.other_files_dir, exist_ok=True)
-        if os.path.exists(self.hash_file_path):
-            try:
-                with open(self.hash_file_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                self.log.emit(translate("log_error", f"Failed to load file hashes: {str(e)}"), "ERROR")
-                return {}
-        return {}
-
-    def save_hashes(self):
-        os.makedirs(self.other_files_dir, exist_ok=True)
-        try:
-            with open(self.hash_file_path, 'w') as f:
-                json.dump(self.file_hashes, f, indent=4)
-        except IOError as e:
-            self.log.emit(translate("log_error", f"Failed to save file hashes: {str(e)}"), "ERROR")
-
     def stop(self):
         self.is_running = False
-        self.log.emit(translate("log_info", "DownloadThread cancellation initiated"), "INFO")
+        self.logger.info("DownloadThread cancellation initiated")
 
-    def download_file(self, file_url, folder, file_index, total_files):
+    def download_file(self, file_url, folder, file_index, total_files, retry_state):
+        """Make one download attempt. Raises RetryLater on transient errors so the worker can pick up other files."""
         if not self.is_running or file_url not in self.selected_files:
-            self.log.emit(translate("log_info", f"Skipping {file_url} due to cancellation"), "INFO")
+            self.logger.info("Skipping {0} due to cancellation", file_url)
             return
 
         post_id = self.files_to_posts_map.get(file_url, self.post_id)
@@ -863,73 +880,179 @@ class DownloadThread(QThread):
         full_path = os.path.join(post_folder, filename.replace('/', '_'))
         url_hash = hashlib.md5(file_url.encode()).hexdigest()
 
-        file_hashes_keys = list(self.file_hashes.keys())
-        for hash_key in file_hashes_keys:
-            if hash_key == url_hash:
-                existing_path = self.file_hashes[hash_key]["file_path"]
-                if os.path.exists(existing_path):
-                    with open(existing_path, 'rb') as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                    stored_hash = self.file_hashes[hash_key]["file_hash"]
-                    if file_hash == stored_hash:
-                        self.log.emit(translate("log_info", translate("file_already_downloaded", filename, existing_path)), "INFO")
-                        self.file_progress.emit(file_index, 100)
-                        self.file_completed.emit(file_index, file_url)
-                        self.completed_files.add(file_url)
-                        self.check_post_completion(file_url)
-                        return
-
-        self.log.emit(translate("log_info", translate("starting_download", file_index + 1, total_files, file_url, post_folder)), "INFO")
-        
-        max_retries = 50
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = requests.get(file_url, headers=HEADERS, stream=True)
-                response.raise_for_status()
-                file_size = int(response.headers.get('content-length', 0)) or 1
-                downloaded_size = 0
-                
-                with open(full_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if not self.is_running:
-                            self.log.emit(translate("log_warning", translate("download_interrupted", file_url)), "WARNING")
-                            os.remove(full_path) if os.path.exists(full_path) else None
-                            return
-                        if chunk:
-                            f.write(chunk)
-                            downloaded_size += len(chunk)
-                            progress = int((downloaded_size / file_size) * 100)
-                            self.file_progress.emit(file_index, progress)
-                            if progress == 100:
-                                self.file_completed.emit(file_index, file_url)
-
-                with open(full_path, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
-                self.file_hashes[url_hash] = {
-                    "file_path": full_path,
-                    "file_hash": file_hash,
-                    "url": file_url
-                }
-                self.save_hashes()
-                self.log.emit(translate("log_info", translate("successfully_downloaded", full_path)), "INFO")
-                self.completed_files.add(file_url)
-                self.check_post_completion(file_url)
-                return
+        entry = self.store.get(url_hash)
+        existing_stat = self.directory_cache.stat(entry["file_path"]) if entry else None
+        if existing_stat and self.store.is_intact(entry, existing_stat, self.verify_files):
+            existing_path = entry["file_path"]
+            self.logger.info(translate("file_already_downloaded", filename, existing_path))
+            self.complete_file(file_index, file_url)
+            self.completed_files.add(file_url)
+            self.check_post_completion(file_url)
+            return
 
-            except Exception as e:
-                if attempt == max_retries:
-                    self.log.emit(translate("log_error", translate("error_downloading_after_retries", file_url, max_retries, str(e))), "ERROR")
-                    self.file_progress.emit(file_index, 0)
-                    return
+        content_sha256 = content_hash_from_url(file_url)
+        # Data URLs are named after their SHA-256, so hash those downloads with it and check the result against the URL
+        hash_algorithm = 'sha256' if content_sha256 else self.hash_algorithm
+        if content_sha256 and not retry_state.failures:
+            entry = self.store.find_content(content_sha256, self.directory_cache.stat, self.verify_files)
+            if entry:
+                existing_path = entry["file_path"]
+                try:
+                    if os.path.abspath(existing_path) != os.path.abspath(full_path):
+                        used_mode = place_existing_file(existing_path, full_path, self.storage_mode)
+                        self.logger.debug("Placed {0} from {1} ({2})", full_path, existing_path, used_mode)
+                except OSError as e:
+                    self.logger.warning("Failed to reuse {0} for {1}: {2}", existing_path, file_url, e)
                 else:
-                    self.log.emit(translate("log_warning", translate("download_failed_retrying", file_url, attempt, max_retries, str(e))), "WARNING")
-                    for i in range(3, 0, -1):
-                        if not self.is_running:
-                            self.log.emit(translate("log_info", f"Retry for {file_url} cancelled during countdown"), "INFO")
-                            return
-                        self.log.emit(translate("log_info", translate("retry_countdown", i)), "INFO")
-                        time.sleep(1)
-                    continue
+                    self.directory_cache.update(full_path)
+                    self.store.put(url_hash, file_url, full_path, entry["file_hash"], entry["hash_algorithm"], content_sha256, os.stat(full_path))
+                    self.logger.info(translate("file_already_downloaded", filename, existing_path))
+                    self.complete_file(file_index, file_url)
+                    self.completed_files.add(file_url)
+                    self.check_post_completion(file_url)
+                    return
+
+        if not retry_state.failures:
+            self.logger.info(translate("starting_download", file_index + 1, total_files, file_url, post_folder))
+
+        if content_sha256 and not content_claims.claim(content_sha256):
+            # The same content is downloading for another post; check again once that one had time to finish
+            self.logger.debug("Waiting for an identical file to finish before {0}", file_url)
+            raise RetryLater(2.0)
+        file_hash = None
+        try:
+            # Set up the part file inside the try, so a bad sidecar or a permission error still releases the claim
+            partial = PartialDownload(full_path)
+            if file_url in self.no_resume:
+                # The server could not continue this file before, so fetch it whole in a single stream
+                partial.reset()
+            if not partial.segments:
+                # Ranges apply to the encoded body, so ask for identity to keep offsets meaningful
+                request_headers = {**HEADERS, "Accept-Encoding": "identity", **partial.range_headers()}
+                response = rate_limited_get(file_url, headers=request_headers, stream=True, timeout=30)
+                with response:
+                    if response.status_code != 416:
+                        response.raise_for_status()
+                    offset = partial.start(response.status_code, response.headers)
+                    if offset is None:
+                        self.logger.info("Partial file for {0} was already complete", file_url)
+                    elif offset == 0 and file_url not in self.no_resume and partial.can_segment(response.headers):
+                        # Leave this response unread and fetch the file as parallel byte ranges instead
+                        partial.plan_segments()
+                        self.logger.info("Downloading {0} in {1} segments", file_url, len(partial.segments))
+                    else:
+                        if offset > 0:
+                            self.logger.info("Resuming {0} at byte {1}", file_url, offset)
+                        elif partial.total_size and file_url not in self.no_resume:
+                            # Reserve the whole file up front as one segment; a full disk fails here, not midway
+                            partial.plan_segments(1)
+                        file_size = partial.total_size or (offset + int(response.headers.get('content-length', 0))) or 1
+                        downloaded_size = offset
+                        hasher = new_hash(hash_algorithm)
+                        if offset > 0:
+                            # Hash the bytes kept from the earlier attempt before continuing with the new ones
+                            update_from_file(hasher, partial.part_path, offset)
+
+                        with partial.open(offset) as f:
+                            try:
+                                for chunk in response.iter_content(chunk_size=8192):
+                                    if not self.is_running:
+                                        # Keep the partial file so the next run can resume it
+                                        self.logger.warning(translate("download_interrupted", file_url))
+                                        return
+                                    if chunk:
+                                        if partial.segments:
+                                            chunk = chunk[:partial.write(f, 0, chunk)]
+                                        else:
+                                            f.write(chunk)
+                                        hasher.update(chunk)
+                                        downloaded_size += len(chunk)
+                                        self.progress_counters.update(file_index, downloaded_size, file_size)
+                            finally:
+                                if partial.segments:
+                                    partial.checkpoint(f)
+
+                        file_hash = hasher.hexdigest()
+                        if partial.total_size and downloaded_size < partial.total_size:
+                            raise requests.ConnectionError(f"Connection closed at byte {downloaded_size} of {partial.total_size}")
+
+            if partial.segments:
+                self.download_segments(file_url, partial, file_index)
+                if not self.is_running:
+                    self.logger.warning(translate("download_interrupted", file_url))
+                    return
+
+            if file_hash is None:
+                # Segmented or already complete downloads were not written in order, so hash them from disk
+                file_hash = hash_file(partial.part_path, hash_algorithm)
+            if content_sha256 and file_hash != content_sha256:
+                partial.reset()
+                raise ContentMismatch(f"Downloaded data hashes to {file_hash} instead of {content_sha256}")
+            partial.finish()
+            self.directory_cache.update(full_path)
+            self.store.put(url_hash, file_url, full_path, file_hash, hash_algorithm, content_sha256, os.stat(full_path))
+            self.logger.info(translate("successfully_downloaded", full_path))
+            self.complete_file(file_index, file_url)
+            self.completed_files.add(file_url)
+            self.check_post_completion(file_url)
+
+        except ResumeMismatch as e:
+            partial.reset()
+            self.no_resume.add(file_url)
+            delay = retry_state.next_delay('server')
+            if delay is None:
+                self.logger.error(translate("error_downloading_after_retries", file_url, retry_state.failures, str(e)))
+                self.progress_counters.update(file_index, 0, 100)
+                return
+            self.logger.warning("Cannot resume {0}: {1}. Restarting from the beginning", file_url, e)
+            raise RetryLater(delay)
+        except Exception as e:
+            error_class = classify_error(exception=e)
+            delay = retry_state.next_delay(error_class, retry_after_from(e))
+            if delay is None:
+                self.logger.error(translate("error_downloading_after_retries", file_url, retry_state.failures, str(e)))
+                self.progress_counters.update(file_index, 0, 100)
+                return
+            self.logger.warning(translate("download_failed_retrying", file_url, retry_state.attempts[error_class], retry_state.policy.budgets[error_class], str(e)))
+            self.logger.info(translate("retry_countdown", f"{delay:.1f}"))
+            raise RetryLater(delay)
+        finally:
+            if content_sha256:
+                content_claims.release(content_sha256)
+
+    def download_segments(self, file_url, partial, file_index):
+        """Fetch the unfinished byte ranges of a segmented download concurrently into the preallocated part file."""
+        def fetch_segment(index):
+            request_headers = {**HEADERS, "Accept-Encoding": "identity", **partial.segment_headers(index)}
+            response = rate_limited_get(file_url, headers=request_headers, stream=True, timeout=30)
+            with response:
+                response.raise_for_status()
+                partial.check_segment(index, response.status_code, response.headers)
+                start, _, written = partial.segments[index]
+                with open(partial.part_path, 'r+b') as f:
+                    f.seek(start + written)
+                    try:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            if not self.is_running:
+                                return
+                            partial.write(f, index, chunk)
+                            self.progress_counters.update(file_index, partial.downloaded, partial.total_size)
+                    finally:
+                        partial.checkpoint(f)
+            if not partial.segment_done(index) and self.is_running:
+                raise requests.ConnectionError(f"Segment {index} closed early")
+
+        pending = [i for i in range(len(partial.segments)) if not partial.segment_done(i)]
+        with ThreadPoolExecutor(max_workers=len(pending) or 1) as executor:
+            futures = [executor.submit(fetch_segment, i) for i in pending]
+        # Let every segment keep its progress, then report the first failure so the retry resumes what is left
+        for future in futures:
+            future.result()
+
+    def complete_file(self, file_index, file_url):
+        """Report a finished file, making sure no progress for it is published afterwards."""
+        self.progress_counters.finish(file_index)
+        self.file_completed.emit(file_index, file_url)
 
     def check_post_completion(self, file_url):
         post_id = self.files_to_posts_map.get(file_url)
@@ -937,33 +1060,35 @@ class DownloadThread(QThread):
             post_files = self.post_files_map[post_id]
             if all(f in self.completed_files for f in post_files):
                 self.post_completed.emit(post_id)
-                self.log.emit(translate("log_info", translate("all_files_downloaded", post_id)), "INFO")
+                self.logger.info(translate("all_files_downloaded", post_id))
 
     def run(self):
-        self.log.emit(translate("log_info", f"DownloadThread started with URL: {self.url}"), "INFO")
+        self.logger.info("DownloadThread started with URL: {0}", self.url)
         self.fetch_post_info()  # Fetch post title before starting
         service_folder = os.path.join(self.download_folder, self.service)
         os.makedirs(service_folder, exist_ok=True)
-        self.log.emit(translate("log_info", f"Created directory: {service_folder}"), "INFO")
+        self.logger.info("Created directory: {0}", service_folder)
 
         total_files = len(self.selected_files)
-        self.log.emit(translate("log_info", f"Total selected files to download for this post: {total_files}"), "INFO")
+        self.logger.info("Total selected files to download for this post: {0}", total_files)
 
         if total_files > 0:
-            with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-                futures = {executor.submit(self.download_file, file_url, self.download_folder, i, total_files): i
-                           for i, file_url in enumerate(self.selected_files)}
-                for future in as_completed(futures):
-                    if not self.is_running:
-                        break
-                    try:
-                        future.result()
-                    except Exception as e:
-                        self.log.emit(translate("log_error", f"Error in download: {e}"), "ERROR")
+            jobs = [(file_url, lambda file_url=file_url, i=i, state=DOWNLOAD_RETRY_POLICY.start():
+                         self.download_file(file_url, self.download_folder, i, total_files, state))
+                    for i, file_url in enumerate(self.selected_files)]
+            self.progress_counters.start()
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+                    run_jobs(executor, jobs, lambda file_url, result: None, lambda: self.is_running,
+                             lambda file_url, e: self.logger.error("Error in download: {0}", e))
+            finally:
+                self.progress_counters.stop()
         else:
-            self.log.emit(translate("log_warning", "No files selected for download for this post."), "WARNING")
+            self.logger.warning("No files selected for download for this post.")
 
-        self.log.emit(translate("log_info", f"DownloadThread for post {self.post_id} finished"), "INFO")
+        self.store.flush()
+        self.logger.info("DownloadThread for post {0} finished", self.post_id)
+        self.logger.flush()
         self.finished.emit()
 
 class PostDownloaderTab(QWidget):
@@ -973,17 +1098,19 @@ class PostDownloaderTab(QWidget):
         self.files_to_download = []
         self.file_url_map = {}
         self.all_detected_files = []
-        self.post_queue = []
+        self.post_queue = QueueModel(self)
         self.downloading = False
         self.current_preview_url = None
-        self.previous_selected_widget = None
         self.cache_dir = self.parent.cache_folder
         self.other_files_dir = self.parent.other_files_folder
         self.current_file_index = -1
-        self.checked_urls = {}
+        self.post_file_model = CheckListModel(default_checked=True, parent=self)
+        self.post_file_model.check_toggled.connect(self.on_file_check_toggled)
         self.active_threads = []
         self.current_post_url = None
+        self.validation_thread = None
         self.all_files_map = {}
+        self.post_data_map = {}  # Post JSON by post url, from PostDetectionThread
         self.all_detected_posts = []
         self.post_url_map = {}
         self.total_files_to_download = 0
@@ -1017,9 +1144,10 @@ class PostDownloaderTab(QWidget):
         self.post_queue_group = QGroupBox()
         self.post_queue_group.setStyleSheet("QGroupBox { color: white; font-weight: bold; padding: 10px; }")
         post_queue_layout = QVBoxLayout()
-        self.post_queue_list = QListWidget()
+        self.post_queue_list = queue_list_view(self.post_queue)
         self.post_queue_list.setFixedHeight(100)
-        self.post_queue_list.setStyleSheet("background: #2A3B5A; border-radius: 5px;")
+        self.post_queue_list.delegate.view_clicked.connect(self.check_post_from_queue)
+        self.post_queue_list.delegate.remove_clicked.connect(self.remove_post_from_queue)
         post_queue_layout.addWidget(self.post_queue_list)
         self.post_queue_group.setLayout(post_queue_layout)
         left_layout.addWidget(self.post_queue_group)
@@ -1041,9 +1169,7 @@ class PostDownloaderTab(QWidget):
         left_layout.addLayout(post_progress_layout)
 
         # Console
-        self.post_console = QTextEdit()
-        self.post_console.setReadOnly(True)
-        self.post_console.setStyleSheet("background: #2A3B5A; border-radius: 5px; padding: 5px;")
+        self.post_console = LogConsole("post", self.other_files_dir)
         left_layout.addWidget(self.post_console)
 
         # Buttons layout
@@ -1108,11 +1234,9 @@ class PostDownloaderTab(QWidget):
         file_list_layout.addWidget(self.post_filter_group)
 
         # File list
-        self.post_file_list = QListWidget()
-        self.post_file_list.setStyleSheet("background: #2A3B5A; border-radius: 5px;")
-        self.post_file_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.post_file_list.itemClicked.connect(self.handle_item_click)
-        self.post_file_list.currentItemChanged.connect(self.update_current_preview_url)
+        self.post_file_list = check_list_view(self.post_file_model)
+        self.post_file_list.clicked.connect(self.handle_item_click)
+        self.post_file_list.selectionModel().currentChanged.connect(self.update_current_preview_url)
         file_list_layout.addWidget(self.post_file_list)
 
         # Bottom layout with file count and view button
@@ -1159,6 +1283,7 @@ class PostDownloaderTab(QWidget):
         self.post_queue_group.setTitle(translate("post_queue"))
         self.file_list_group.setTitle(translate("files_to_download"))
         self.post_filter_group.setTitle(translate("filter_by_type"))
+        self.post_console.update_ui_text()
         
         self.post_file_progress_label.setText(translate("file_progress", 0))
         self.post_overall_progress_label.setText(translate("overall_progress", 0, 0, 0, 0))
@@ -1172,8 +1297,6 @@ class PostDownloaderTab(QWidget):
         self.download_all_links.setText(translate("download_all_links"))
         
         self.post_search_input.setPlaceholderText(translate("search_items"))
-        
-        self.update_post_queue_list()
 
     def update_progress_bar_style(self):
         separator_style = "QProgressBar { border: 1px solid #4A5B7A; border-radius: 5px; background: #2A3B5A; } QProgressBar::chunk { background: #4A5B7A; }"
@@ -1201,12 +1324,34 @@ class PostDownloaderTab(QWidget):
         if not url:
             self.append_log_to_console(translate("log_error", translate("no_url_entered")), "ERROR")
             return
-        if any(item[0] == url for item in self.post_queue):
+        if url in self.post_queue:
             self.append_log_to_console(translate("log_warning", translate("url_already_in_queue")), "WARNING")
             return
-        if self.check_post_url_validity(url):
-            self.post_queue.append((url, False))
-            self.update_post_queue_list()
+        if self.validation_thread is not None and self.validation_thread.isRunning():
+            self.append_log_to_console(translate("log_warning", "Validation already in progress. Please wait."), "WARNING")
+            return
+        self.background_task_label.setText(translate("validating_url"))
+        self.background_task_progress.setRange(0, 0)
+        self.validation_thread = ValidationThread(url)
+        self.validation_thread.result.connect(lambda valid: self.on_validation_finished(url, valid))
+        self.validation_thread.log.connect(self.append_log_batch)
+        self.validation_thread.finished.connect(self.cleanup_validation_thread)
+        self.active_threads.append(self.validation_thread)
+        self.validation_thread.start()
+
+    def cleanup_validation_thread(self):
+        """Clean up the validation thread after it finishes."""
+        if self.validation_thread in self.active_threads:
+            self.active_threads.remove(self.validation_thread)
+        self.validation_thread.deleteLater()
+        self.validation_thread = None
+
+    def on_validation_finished(self, url, valid):
+        self.background_task_progress.setRange(0, 100)
+        self.background_task_progress.setValue(0)
+        self.background_task_label.setText(translate("idle"))
+        if valid:
+            self.post_queue.append(url)
             self.post_url_input.clear()
             self.append_log_to_console(translate("log_info", translate("added_post_url", url)), "INFO")
             if self.download_all_links.isChecked():
@@ -1214,113 +1359,30 @@ class PostDownloaderTab(QWidget):
         else:
             self.append_log_to_console(translate("log_error", translate("invalid_post_url", url)), "ERROR")
 
-    def check_post_url_validity(self, url):
-        parts = url.split('/')
-        if len(parts) < 7 or 'kemono.su' not in url:
-            return False
-        service, creator_id, post_id = parts[-5], parts[-3], parts[-1]
-        api_url = f"{API_BASE}/{service}/user/{creator_id}/post/{post_id}"
-        
-        try:
-            response = requests.get(api_url, headers=HEADERS, timeout=5)
-            if response.status_code == 200:
-                return True
-            
-            self.append_log_to_console(translate("log_info", translate("first_validation_failed", url)), "INFO")
-        except requests.RequestException:
-            self.append_log_to_console(translate("log_info", translate("first_validation_failed_exception", url)), "INFO")
-        
-        try:
-            self.append_log_to_console(translate("log_info", translate("attempting_fallback_validation", url)), "INFO")
-            
-            fallback_headers = {
-                'User-Agent': user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': accept_language,
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Cache-Control': 'max-age=0'
-            }
-            
-            direct_response = requests.get(url, headers=fallback_headers, timeout=10)
-            
-            if direct_response.status_code == 200:
-                content = direct_response.text.lower()
-                if 'kemono' in content:
-                    self.append_log_to_console(translate("log_info", translate("url_validated_fallback", url)), "INFO")
-                    return True
-            
-        except requests.RequestException as e:
-            self.append_log_to_console(translate("log_error", translate("fallback_validation_failed", str(e))), "ERROR")
-            
-        return False
-
-    def create_view_handler(self, url, checked):
-        def handler():
-            self.check_post_from_queue(url)
-        return handler
-
-    def create_remove_handler(self, url):
-        def handler():
-            reply = QMessageBox.question(self, translate("confirm_removal"), 
-                                        translate("confirm_removal_message", url),
-                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-            if reply == QMessageBox.StandardButton.Yes:
-                found = False
-                for i, (queue_url, _) in enumerate(self.post_queue):
-                    if queue_url == url:
-                        del self.post_queue[i]
-                        found = True
-                        break
-                if found:
-                    self.update_post_queue_list()
-                    self.append_log_to_console(translate("log_info", translate("link_removed", url)), "INFO")
-                    if not any(c for _, c in self.post_queue):
-                        self.post_file_list.clear()
-                        self.all_detected_files = []
-                        self.files_to_download = []
-                        self.file_url_map = {}
-                        self.checked_urls = {}
-                        self.all_files_map = {}
-                        self.all_detected_posts = []
-                        self.post_url_map = {}
-                        self.current_post_url = None
-                        self.previous_selected_widget = None
-                        self.update_checked_files()
-                        self.filter_items()
-                    elif self.download_all_links.isChecked():
-                        self.check_all_posts()
-                else:
-                    self.append_log_to_console(translate("log_warning", translate("url_not_found", url)), "WARNING")
-        return handler
-
-    def update_post_queue_list(self):
-        self.post_queue_list.clear()
-        for url, checked in self.post_queue:
-            item = QListWidgetItem()
-            widget = QWidget()
-            layout = QHBoxLayout()
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setSpacing(5)
-            view_button = QPushButton(qta.icon('fa5s.eye', color='white'), "")
-            view_button.setStyleSheet("background: #4A5B7A; padding: 2px; border-radius: 5px; min-width: 30px; max-width: 30px; min-height: 30px; max-height: 30px;")
-            view_button.clicked.connect(self.create_view_handler(url, checked))
-            layout.addWidget(view_button)
-            label = QLabel(url)
-            label.setStyleSheet("color: white;")
-            label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            layout.addWidget(label, stretch=1)
-            remove_button = QPushButton(qta.icon('fa5s.times', color='white'), "")
-            remove_button.setStyleSheet("background: #4A5B7A; padding: 2px; border-radius: 5px; min-width: 30px; max-width: 30px; min-height: 30px; max-height: 30px;")
-            remove_button.clicked.connect(self.create_remove_handler(url))
-            layout.addWidget(remove_button)
-            widget.setLayout(layout)
-            item.setSizeHint(widget.sizeHint())
-            self.post_queue_list.addItem(item)
-            self.post_queue_list.setItemWidget(item, widget)
-            widget.view_button = view_button
-            widget.label = label
-            widget.remove_button = remove_button
+    def remove_post_from_queue(self, url):
+        reply = QMessageBox.question(self, translate("confirm_removal"), 
+                                    translate("confirm_removal_message", url),
+                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            if self.post_queue.remove(url):
+                self.post_data_map.pop(url, None)
+                self.append_log_to_console(translate("log_info", translate("link_removed", url)), "INFO")
+                if not self.post_queue.any_viewed():
+                    self.post_file_model.clear()
+                    self.all_detected_files = []
+                    self.files_to_download = []
+                    self.file_url_map = {}
+                    self.post_file_model.clear_checks()
+                    self.all_files_map = {}
+                    self.all_detected_posts = []
+                    self.post_url_map = {}
+                    self.current_post_url = None
+                    self.update_checked_files()
+                    self.filter_items()
+                elif self.download_all_links.isChecked():
+                    self.check_all_posts()
+            else:
+                self.append_log_to_console(translate("log_warning", translate("url_not_found", url)), "WARNING")
 
     def check_post_from_queue(self, url):
         if not isinstance(url, str):
@@ -1329,22 +1391,17 @@ class PostDownloaderTab(QWidget):
         self.append_log_to_console(translate("log_info", translate("viewing_post", url)), "INFO")
         
         self.current_post_url = url
-        self.checked_urls.clear()
+        self.post_file_model.clear_checks()
         self.files_to_download = []
         
-        self.post_file_list.clear()
-        self.previous_selected_widget = None
+        self.post_file_model.clear()
         
         if url in self.all_files_map:
             self.all_detected_posts = [(title, post_id) for title, post_id in self.all_files_map.get(url, [])]
             self.post_url_map = {title: post_id for title, post_id in self.all_detected_posts}
             self.append_log_to_console(translate("log_debug", f"Total detected posts: {len(self.all_detected_posts)}"), "INFO")
             self.display_files_for_post(url)
-            for i, (queue_url, _) in enumerate(self.post_queue):
-                if queue_url == url:
-                    self.post_queue[i] = (url, True)
-                    self.update_post_queue_list()
-                    break
+            self.post_queue.mark_viewed(url)
             self.update_checked_files()
             self.filter_items()
             self.append_log_to_console(translate("log_debug", f"Displayed files for post {url}"), "INFO")
@@ -1355,8 +1412,9 @@ class PostDownloaderTab(QWidget):
             self.background_task_label.setText(translate("detecting_post"))
             self.background_task_progress.setRange(0, 0)
             self.post_detection_thread = PostDetectionThread(url)
+            self.post_detection_thread.post_fetched.connect(self.store_post_data)
             self.post_detection_thread.finished.connect(self.on_post_detection_finished)
-            self.post_detection_thread.log.connect(self.append_log_to_console)
+            self.post_detection_thread.log.connect(self.append_log_batch)
             self.post_detection_thread.error.connect(self.on_post_detection_error)
             self.post_detection_thread.finished.connect(lambda posts: self.cleanup_thread(self.post_detection_thread, []))
             self.post_detection_thread.error.connect(lambda err: self.cleanup_thread(self.post_detection_thread, []))
@@ -1369,11 +1427,7 @@ class PostDownloaderTab(QWidget):
         self.post_url_map = {title: post_id for title, post_id in self.all_detected_posts}
         self.append_log_to_console(translate("log_debug", f"Total detected posts: {len(self.all_detected_posts)}"), "INFO")
         self.display_files_for_post(self.current_post_url)
-        for i, (queue_url, _) in enumerate(self.post_queue):
-            if queue_url == self.current_post_url:
-                self.post_queue[i] = (self.current_post_url, True)
-                self.update_post_queue_list()
-                break
+        self.post_queue.mark_viewed(self.current_post_url)
         self.update_checked_files()
         self.filter_items()
         self.append_log_to_console(translate("log_debug", f"Displayed files for post {self.current_post_url}"), "INFO")
@@ -1387,24 +1441,20 @@ class PostDownloaderTab(QWidget):
         self.background_task_progress.setValue(0)
         self.background_task_label.setText(translate("idle"))
 
+    def store_post_data(self, url, post):
+        self.post_data_map[url] = post
+
     def display_files_for_post(self, url):
-        parts = url.split('/')
-        service, creator_id, post_id = parts[-5], parts[-3], parts[-1]
-        api_url = f"{API_BASE}/{service}/user/{creator_id}/post/{post_id}"
+        post = self.post_data_map.get(url)
+        if post is None:
+            self.append_log_to_console(translate("log_error", f"No post data fetched for {url}"), "ERROR")
+            return
         try:
-            response = requests.get(api_url, headers=HEADERS)
-            if response.status_code != 200:
-                self.append_log_to_console(translate("log_error", f"Failed to fetch {api_url} - Status code: {response.status_code}"), "ERROR")
-                return
-            post_data = response.json()
-            post = post_data if isinstance(post_data, dict) and 'post' not in post_data else post_data.get('post', {})
             allowed_extensions = [ext.lower() for ext, check in self.post_filter_checks.items() if check.isChecked()]
             self.all_detected_files = self.detect_files(post, allowed_extensions)
             self.file_url_map = {file_name: file_url for file_name, file_url in self.all_detected_files}
-            self.checked_urls.clear()
-            for file_name, file_url in self.all_detected_files:
-                self.checked_urls[file_url] = True
-                self.add_list_item(file_name, file_url)
+            self.post_file_model.clear_checks()
+            self.post_file_model.set_checked([file_url for _, file_url in self.all_detected_files], True)
             self.update_checked_files()
         except Exception as e:
             self.append_log_to_console(translate("log_error", f"Error fetching files for post {url}: {str(e)}"), "ERROR")
@@ -1458,7 +1508,7 @@ class PostDownloaderTab(QWidget):
 
     def check_all_posts(self):
         self.all_files_map.clear()
-        self.checked_urls.clear()
+        self.post_file_model.clear_checks()
         self.detected_files_during_check_all = []
         self.files_to_download = []
         self.file_url_map.clear()
@@ -1470,9 +1520,10 @@ class PostDownloaderTab(QWidget):
                 self.background_task_label.setText(translate("detecting_posts"))
                 self.background_task_progress.setRange(0, 0)
                 thread = PostDetectionThread(url)
+                thread.post_fetched.connect(self.store_post_data)
                 thread.finished.connect(lambda posts, u=url: self.on_check_all_posts_detected(u, posts))
                 thread.file_detected.connect(self.on_files_detected_during_check_all)
-                thread.log.connect(self.append_log_to_console)
+                thread.log.connect(self.append_log_batch)
                 thread.error.connect(self.on_post_detection_error)
                 thread.finished.connect(lambda posts: self.cleanup_thread(thread, []))
                 thread.error.connect(lambda err: self.cleanup_thread(thread, []))
@@ -1482,8 +1533,8 @@ class PostDownloaderTab(QWidget):
     def on_files_detected_during_check_all(self, detected_files):
         for file_name, file_url in detected_files:
             self.detected_files_during_check_all.append(file_url)
-            self.checked_urls[file_url] = True
             self.file_url_map[file_name] = file_url
+        self.post_file_model.set_checked([file_url for _, file_url in detected_files], True)
         self.files_to_download = list(dict.fromkeys(self.detected_files_during_check_all))
         self.post_file_count_label.setText(translate("files_count", f"{len(self.files_to_download)} (Detecting...)"))
         self.append_log_to_console(translate("log_debug", f"Files detected so far: {len(self.files_to_download)}"), "INFO")
@@ -1507,13 +1558,14 @@ class PostDownloaderTab(QWidget):
             return
 
         self.update_checked_files()
-        checked_files = [file_url for file_url, is_checked in self.checked_urls.items() if is_checked]
+        checked_files = self.post_file_model.checked_keys()
         self.append_log_to_console(translate("log_debug", f"Checked files for download: {checked_files}"), "INFO")
         if not checked_files:
             self.append_log_to_console(translate("log_warning", translate("no_files_selected")), "WARNING")
             return
 
         self.downloading = True
+        preview_service().cancel_prefetch()
         self.parent.tabs.setTabEnabled(1, False)
         self.parent.status_label.setText(translate("preparing_files"))
         self.post_download_btn.setEnabled(False)
@@ -1579,7 +1631,7 @@ class PostDownloaderTab(QWidget):
         )
         self.file_preparation_thread.progress.connect(self.update_background_progress)
         self.file_preparation_thread.finished.connect(lambda files, files_map: self.on_file_preparation_finished(urls, files, files_map))
-        self.file_preparation_thread.log.connect(self.append_log_to_console)
+        self.file_preparation_thread.log.connect(self.append_log_batch)
         self.file_preparation_thread.error.connect(self.on_file_preparation_error)
         self.file_preparation_thread.finished.connect(lambda files, files_map: self.cleanup_thread(self.file_preparation_thread, []))
         self.file_preparation_thread.error.connect(lambda err: self.cleanup_thread(self.file_preparation_thread, []))
@@ -1591,15 +1643,13 @@ class PostDownloaderTab(QWidget):
 
     def on_file_preparation_finished(self, urls, files_to_download, files_to_posts_map):
         self.append_log_to_console(translate("log_debug", f"Files prepared for URLs: {urls}, Total files: {len(files_to_download)}"), "INFO")
-        for file_url in files_to_download:
-            if file_url not in self.checked_urls:
-                self.checked_urls[file_url] = True
-        self.append_log_to_console(translate("log_debug", f"Updated checked_urls after preparation: {self.checked_urls}"), "INFO")
+        self.post_file_model.set_checked([file_url for file_url in files_to_download if file_url not in self.post_file_model.checked], True)
+        self.append_log_to_console(translate("log_debug", f"Checked files after preparation: {self.post_file_model.checked_count}"), "INFO")
 
         active_filters = [ext.lower() for ext, check in self.post_filter_checks.items() if check.isChecked()]
         checked_files = []
         for file_url in files_to_download:
-            if not self.checked_urls.get(file_url, False):
+            if not self.post_file_model.is_checked(file_url):
                 continue
             file_name = file_url.split('f=')[-1] if 'f=' in file_url else file_url.split('/')[-1]
             file_ext = os.path.splitext(file_name)[1].lower()
@@ -1622,12 +1672,14 @@ class PostDownloaderTab(QWidget):
 
         max_concurrent = self.parent.settings_tab.get_simultaneous_downloads()
         self.thread = DownloadThread(url, self.parent.download_folder, checked_files, files_to_posts_map, 
-                                    self.post_console, self.other_files_dir, post_id, max_concurrent)
+                                    self.post_console, self.other_files_dir, post_id, max_concurrent,
+                                    storage_mode=self.parent.settings_tab.get_storage_mode(),
+                                    verify_files=self.parent.settings_tab.is_verify_existing_files_enabled())
         self.active_threads.append(self.thread)
-        self.thread.file_progress.connect(self.update_file_progress)
+        self.thread.files_progress.connect(self.update_files_progress)
         self.thread.file_completed.connect(self.update_file_completion)
         self.thread.post_completed.connect(self.update_post_completion)
-        self.thread.log.connect(self.append_log_to_console)
+        self.thread.log.connect(self.append_log_batch)
         self.thread.finished.connect(lambda: self.cleanup_thread(self.thread, remaining_urls))
         self.thread.start()
 
@@ -1692,6 +1744,10 @@ class PostDownloaderTab(QWidget):
             self.background_task_progress.setValue(0)
             self.background_task_label.setText(translate("idle"))
 
+    def update_files_progress(self, snapshot):
+        for file_index, progress in snapshot.items():
+            self.update_file_progress(file_index, progress)
+
     def update_file_progress(self, file_index, progress):
         if self.current_file_index == file_index or self.current_file_index == -1:
             self.current_file_index = file_index
@@ -1751,75 +1807,38 @@ class PostDownloaderTab(QWidget):
 
     def toggle_check_all(self, state):
         is_checked = state == 2  # Qt.CheckState.Checked
-        new_state = Qt.CheckState.Checked if is_checked else Qt.CheckState.Unchecked
-        
-        # Collect only visible items from the filtered list
-        visible_urls = []
-        for i in range(self.post_file_list.count()):
-            item = self.post_file_list.item(i)
-            if not item.isHidden():
-                file_url = item.data(Qt.UserRole)
-                visible_urls.append(file_url)
-        
+        visible_urls = self.post_file_model.keys()
         if not visible_urls:
             self.append_log_to_console(translate("log_warning", "No visible files to toggle."), "WARNING")
             return
-        
-        # Update checked_urls only for visible items
-        for file_url in self.checked_urls:
-            if file_url in visible_urls:
-                self.checked_urls[file_url] = (new_state == Qt.CheckState.Checked)
-        
-        # Update the UI for visible items
-        for i in range(self.post_file_list.count()):
-            item = self.post_file_list.item(i)
-            if not item.isHidden():
-                widget = self.post_file_list.itemWidget(item)
-                file_url = item.data(Qt.UserRole)
-                if widget and file_url in visible_urls:
-                    widget.check_box.blockSignals(True)
-                    widget.check_box.setCheckState(new_state)
-                    widget.check_box.blockSignals(False)
-        
+        self.post_file_model.set_checked(visible_urls, is_checked)
         self.update_checked_files()
         self.append_log_to_console(translate("log_debug", f"Check ALL toggled to {is_checked} for {len(visible_urls)} visible files"), "INFO")
 
     def toggle_download_all_links(self, state):
         is_checked = state == 2
+        self.post_check_all.setEnabled(not is_checked)
+        self.post_file_model.set_checkable(not is_checked)
         if is_checked:
-            self.post_check_all.setEnabled(False)
-            for i in range(self.post_file_list.count()):
-                item = self.post_file_list.item(i)
-                widget = self.post_file_list.itemWidget(item)
-                if widget:
-                    widget.check_box.setEnabled(False)
             self.check_all_posts()
         else:
-            self.post_check_all.setEnabled(True)
-            for i in range(self.post_file_list.count()):
-                item = self.post_file_list.item(i)
-                widget = self.post_file_list.itemWidget(item)
-                if widget:
-                    widget.check_box.setEnabled(True)
             self.update_checked_files()
             self.filter_items()
             self.append_log_to_console(translate("log_info", translate("download_all_disabled")), "INFO")
 
     def update_checked_files(self):
-        # Update files_to_download based on checked_urls, considering only visible items if filtered
-        visible_urls = {item.data(Qt.UserRole) for i in range(self.post_file_list.count()) 
-                    for item in [self.post_file_list.item(i)] if not item.isHidden()}
+        # Update files_to_download based on the check states, considering only visible items if filtered
+        visible_urls = self.post_file_model.keys()
         
         if visible_urls:  # If there are visible items, only include checked files from those
             self.files_to_download = [file_url for file_url in visible_urls 
-                                    if self.checked_urls.get(file_url, False)]
+                                    if self.post_file_model.is_checked(file_url)]
         else:  # If no filtering, include all checked files
-            self.files_to_download = [file_url for file_url, is_checked in self.checked_urls.items() 
-                                    if is_checked]
+            self.files_to_download = self.post_file_model.checked_keys()
         
         self.post_file_count_label.setText(translate("files_count", len(self.files_to_download)))
         self.append_log_to_console(
-            translate("log_debug", f"Updated checked files count: {len(self.files_to_download)}, checked_urls: {len(self.checked_urls)}"),
+            translate("log_debug", f"Updated checked files count: {len(self.files_to_download)}, checked: {self.post_file_model.checked_count}"),
             "INFO"
         )
 
@@ -1827,106 +1846,34 @@ class PostDownloaderTab(QWidget):
         search_text = self.post_search_input.text().lower()
         active_filters = [ext.lower() for ext, check in self.post_filter_checks.items() if check.isChecked()]
         
-        # Preserve current checked states of visible items
-        current_states = {item.data(Qt.UserRole): self.checked_urls.get(item.data(Qt.UserRole), True)
-                        for i in range(self.post_file_list.count())
-                        for item in [self.post_file_list.item(i)] if not item.isHidden()}
-        
-        self.post_file_list.clear()
-        self.previous_selected_widget = None
-        
         # Add items matching search and filter criteria
+        rows = []
         for file_name, file_url in self.all_detected_files:
             file_ext = os.path.splitext(file_name)[1].lower()
             if (not search_text or search_text in file_name.lower()) and (not active_filters or file_ext in active_filters or (file_ext == '.jpeg' and '.jpg' in active_filters)):
-                self.add_list_item(file_name, file_url)
-        
-        # Restore checked states for visible items
-        for i in range(self.post_file_list.count()):
-            item = self.post_file_list.item(i)
-            if not item.isHidden():
-                widget = self.post_file_list.itemWidget(item)
-                file_url = item.data(Qt.UserRole)
-                if widget and file_url in current_states:
-                    widget.check_box.blockSignals(True)
-                    widget.check_box.setChecked(current_states[file_url])
-                    widget.check_box.blockSignals(False)
-                    self.checked_urls[file_url] = current_states[file_url]
-                if self.download_all_links.isChecked():
-                    widget.check_box.setEnabled(False)
+                rows.append((file_name, file_url, file_url))
+        self.post_file_model.set_rows(rows)
+        self.current_preview_url = None
+        self.post_view_button.setEnabled(False)
         
         self.update_check_all_state()
         self.update_checked_files()  
 
-    def add_list_item(self, text, url):
-        item = QListWidgetItem()
-        item.setData(Qt.UserRole, url)
-        widget = QWidget()
-        layout = QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-        check_box = QCheckBox()
-        check_box.setStyleSheet("color: white;")
-        initial_state = self.checked_urls.get(url, True)
-        check_box.setChecked(initial_state)
-        check_box.clicked.connect(lambda: self.toggle_checkbox_state(url))
-        if self.download_all_links.isChecked():
-            check_box.setEnabled(False)
-        layout.addWidget(check_box)
-        label = QLabel(text)
-        label.setStyleSheet("color: white;")
-        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        layout.addWidget(label, stretch=1)
-        widget.setLayout(layout)
-        item.setSizeHint(widget.sizeHint())
-        self.post_file_list.addItem(item)
-        self.post_file_list.setItemWidget(item, widget)
-        widget.check_box = check_box
-        widget.label = label
-        widget.setStyleSheet("background-color: #2A3B5A; border-radius: 5px;")
-
-    def toggle_checkbox_state(self, url):
-        current_state = self.checked_urls.get(url, True)
-        new_state = not current_state
-        self.checked_urls[url] = new_state
-        widget = self.get_widget_for_url(url)
-        if widget:
-            widget.check_box.blockSignals(True)
-            widget.check_box.setChecked(new_state)
-            widget.check_box.blockSignals(False)
-        self.append_log_to_console(translate("log_debug", f"Checkbox toggled for {url} to {new_state}, checked_urls count: {len(self.checked_urls)}"), "INFO")
-        self.update_checked_files()
+    def on_file_check_toggled(self, url, checked):
+        self.append_log_to_console(translate("log_debug", f"Checkbox toggled for {url} to {checked}"), "INFO")
+        self.post_file_count_label.setText(translate("files_count", self.post_file_model.visible_checked_count))
         self.update_check_all_state()
 
-    def get_widget_for_url(self, url):
-        for i in range(self.post_file_list.count()):
-            item = self.post_file_list.item(i)
-            if item and item.data(Qt.UserRole) == url:
-                return self.post_file_list.itemWidget(item)
-        return None
-
     def update_check_all_state(self):
-        all_visible_checked = all(
-            self.post_file_list.itemWidget(self.post_file_list.item(i)).check_box.isChecked()
-            for i in range(self.post_file_list.count()) if not self.post_file_list.item(i).isHidden()
-        ) and self.post_file_list.count() > 0
+        all_visible_checked = self.post_file_model.all_checked()
         self.post_check_all.blockSignals(True)
         self.post_check_all.setChecked(all_visible_checked)
         self.post_check_all.blockSignals(False)
         self.append_log_to_console(translate("log_debug", f"Check ALL state updated to {all_visible_checked}"), "INFO")
 
     def update_current_preview_url(self, current, previous):
-        if current:
-            widget = self.post_file_list.itemWidget(current)
-            if widget:
-                self.current_preview_url = current.data(Qt.UserRole)
-                self.post_view_button.setEnabled(True)
-            else:
-                self.current_preview_url = None
-                self.post_view_button.setEnabled(False)
-        else:
-            self.current_preview_url = None
-            self.post_view_button.setEnabled(False)
+        self.current_preview_url = current.data(UrlRole) if current.isValid() else None
+        self.post_view_button.setEnabled(self.current_preview_url is not None)
 
     def view_current_item(self):
         if self.current_preview_url:
@@ -1946,27 +1893,13 @@ class PostDownloaderTab(QWidget):
         else:
             self.append_log_to_console(translate("log_warning", translate("no_item_selected")), "WARNING")
 
-    def handle_item_click(self, item):
-        if item:
-            if self.previous_selected_widget:
-                self.previous_selected_widget.setStyleSheet("background-color: #2A3B5A; border-radius: 5px;")
-            widget = self.post_file_list.itemWidget(item)
-            if widget:
-                widget.setStyleSheet("background-color: #4A5B7A; border-radius: 5px;")
-                self.previous_selected_widget = widget
-                self.current_preview_url = item.data(Qt.UserRole)
-                self.post_view_button.setEnabled(True)
-            else:
-                self.current_preview_url = None
-                self.post_view_button.setEnabled(False)
-        else:
-            if self.previous_selected_widget:
-                self.previous_selected_widget.setStyleSheet("background-color: #2A3B5A; border-radius: 5px;")
-                self.previous_selected_widget = None
-            self.current_preview_url = None
-            self.post_view_button.setEnabled(False)
+    def handle_item_click(self, index):
+        self.update_current_preview_url(index, None)
 
     def append_log_to_console(self, message, level="INFO"):
-        color = {"INFO": "green", "WARNING": "yellow", "ERROR": "red"}.get(level, "white")
-        self.post_console.append(f"<span style='color:{color}'>{message}</span>")
+        self.post_console.append(message, level)
+
+    def append_log_batch(self, lines):
+        for message, level in lines:
+            self.post_console.append(message, level)
 
@@ -0,0 +1,65 @@
+import asyncio
+
+import aiohttp
+import requests
+import urllib3
+
+from kemonodownloader.kd_network import DOWNLOAD_RETRY_POLICY, RetryPolicy, classify_error
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def test_classify_status_codes():
+    assert classify_error(429) == 'throttled'
+    assert classify_error(503) == 'throttled'
+    assert classify_error(408) == 'timeout'
+    assert classify_error(500) == 'server'
+    assert classify_error(404) == 'permanent'
+    assert classify_error(exception=http_error(502)) == 'server'
+    assert classify_error(exception=http_error(403)) == 'permanent'
+
+
+def test_classify_dropped_streams_as_network():
+    for exception in (requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead"),
+                      requests.exceptions.ContentDecodingError("bad gzip"),
+                      urllib3.exceptions.ProtocolError("Connection aborted"),
+                      requests.ConnectionError("refused"),
+                      aiohttp.ClientPayloadError("payload not completed"),
+                      ConnectionResetError()):
+        assert classify_error(exception=exception) == 'network', exception
+
+
+def test_classify_timeouts_and_garbled_json():
+    assert classify_error(exception=requests.ReadTimeout()) == 'timeout'
+    assert classify_error(exception=asyncio.TimeoutError()) == 'timeout'
+    assert classify_error(exception=ValueError("Expecting value")) == 'server'
+    assert classify_error(exception=KeyError("file")) == 'permanent'
+
+
+def test_retry_budgets_are_kept_per_error_class():
+    state = RetryPolicy({'network': 2, 'server': 1}, base_delay=1.0, max_delay=4.0).start()
+    assert state.next_delay('network') is not None
+    assert state.next_delay('server') is not None
+    assert state.next_delay('network') is not None
+    assert state.next_delay('network') is None
+    assert state.next_delay('server') is None
+    assert state.next_delay('permanent') is None
+    assert state.failures == 6
+    assert state.describe('network') == "3/2"
+
+
+def test_retry_delays_back_off_within_bounds():
+    state = RetryPolicy({'timeout': 10}, base_delay=1.0, max_delay=4.0).start()
+    for attempt in range(10):
+        delay = state.next_delay('timeout')
+        assert 0 <= delay <= min(4.0, 2 ** attempt)
+    assert state.next_delay('timeout') is None
+
+
+def test_retry_after_raises_the_delay():
+    state = DOWNLOAD_RETRY_POLICY.start()
+    assert state.next_delay('throttled', retry_after=30) >= 30
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import sqlite3
+
+from kemonodownloader import kd_store
+from kemonodownloader.kd_store import MIGRATIONS, DownloadStore, get_download_store
+
+SHA256 = "ab" + "cd" + "0" * 60
+DATA_URL = f"https://kemono.cr/data/ab/cd/{SHA256}.png?f=image.png"
+
+
+def write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return hashlib.md5(data).hexdigest()
+
+
+def test_round_trip(tmp_path):
+    file_path = str(tmp_path / "image.png")
+    file_hash = write_file(file_path, b"image data")
+    db_path = str(tmp_path / kd_store.STORE_FILENAME)
+
+    store = DownloadStore(db_path)
+    store.put("url-hash", DATA_URL, file_path, file_hash, stat_result=os.stat(file_path))
+    # Queued writes are visible before they are committed
+    assert store.get("url-hash")["file_path"] == file_path
+    store.put_remote_size("url-hash", 10)
+    store.put_stat("bytes", 10.0)
+    store.flush()
+    store.close()
+
+    store = DownloadStore(db_path)
+    try:
+        entry = store.get("url-hash")
+        assert entry["url"] == DATA_URL
+        assert entry["file_hash"] == file_hash
+        assert entry["content_sha256"] == SHA256
+        assert entry["file_size"] == len(b"image data")
+        assert store.get("missing") is None
+        assert store.get_remote_sizes(["url-hash", "missing"])["url-hash"][0] == 10
+        assert store.get_stat("bytes") == 10.0
+        assert store.get_stat("missing", 0) == 0
+        assert store.is_intact(entry)
+        assert store.find_content(SHA256)["url_hash"] == "url-hash"
+    finally:
+        store.close()
+
+
+def test_changed_file_is_not_intact(tmp_path):
+    file_path = str(tmp_path / "image.png")
+    file_hash = write_file(file_path, b"image data")
+    store = DownloadStore(str(tmp_path / kd_store.STORE_FILENAME))
+    try:
+        store.put("url-hash", DATA_URL, file_path, file_hash, stat_result=os.stat(file_path))
+        write_file(file_path, b"other data")
+        assert not store.is_intact(store.get("url-hash"))
+        assert store.find_content(SHA256) is None
+        os.remove(file_path)
+        assert not store.is_intact(store.get("url-hash"))
+    finally:
+        store.close()
+
+
+def test_failed_write_is_not_reported_as_recorded(tmp_path, monkeypatch):
+    monkeypatch.setattr(kd_store, "WRITE_RETRY_DELAY", 0)
+    store = DownloadStore(str(tmp_path / kd_store.STORE_FILENAME))
+    try:
+        # file_path is NOT NULL, so this batch can never be committed
+        store.put("url-hash", DATA_URL, None, "0" * 32)
+        store.flush()
+        assert store.get("url-hash") is None
+        store.put("url-hash", DATA_URL, "image.png", "0" * 32)
+        store.flush()
+        assert store.get("url-hash")["file_path"] == "image.png"
+    finally:
+        store.close()
+
+
+def test_schema_upgrade_fills_content_hash(tmp_path):
+    db_path = str(tmp_path / kd_store.STORE_FILENAME)
+    connection = sqlite3.connect(db_path)
+    connection.executescript(f"BEGIN; {MIGRATIONS[0]} PRAGMA user_version = 1; COMMIT;")
+    connection.execute("INSERT INTO downloads (url_hash, url, file_path, file_hash, updated_at) VALUES (?, ?, ?, ?, ?)",
+                       ("url-hash", DATA_URL, "image.png", "0" * 32, 0))
+    connection.commit()
+    connection.close()
+
+    store = DownloadStore(db_path)
+    try:
+        assert store.get("url-hash")["content_sha256"] == SHA256
+        assert store.reader().execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)
+    finally:
+        store.close()
+
+
+def test_legacy_json_migration(tmp_path):
+    other_files_dir = str(tmp_path)
+    legacy_path = tmp_path / kd_store.LEGACY_HASHES_FILENAME
+    legacy_path.write_text(json.dumps({
+        "url-hash": {"url": DATA_URL, "file_path": "image.png", "file_hash": "0" * 32},
+        "sha-hash": {"url": "https://kemono.cr/other.zip", "file_path": "other.zip", "file_hash": "1" * 64,
+                     "hash_algorithm": "sha256"},
+        "broken": {"url": "https://kemono.cr/broken"},
+    }))
+
+    try:
+        store = get_download_store(other_files_dir)
+        assert get_download_store(other_files_dir) is store
+        assert not legacy_path.exists()
+        assert (tmp_path / (kd_store.LEGACY_HASHES_FILENAME + ".migrated")).exists()
+        assert store.get("url-hash")["content_sha256"] == SHA256
+        assert store.get("sha-hash")["hash_algorithm"] == "sha256"
+        assert store.get("broken") is None
+    finally:
+        kd_store.close_download_stores()
+
+    # The entries were committed, not just queued
+    store = DownloadStore(os.path.join(other_files_dir, kd_store.STORE_FILENAME))
+    try:
+        assert store.get("url-hash")["file_path"] == "image.png"
+    finally:
+        store.close()
+
+
+def test_failed_legacy_migration_keeps_json(tmp_path):
+    legacy_path = tmp_path / kd_store.LEGACY_HASHES_FILENAME
+    legacy_path.write_text("{not json")
+    try:
+        store = get_download_store(str(tmp_path))
+        assert store.get("anything") is None
+        assert legacy_path.exists()
+    finally:
+        kd_store.close_download_stores()